@@ -1,32 +1,142 @@
-def encrypt(text,shift):
-    cipherText=""
-    for i in range(len(text)):
-        cha=text[i]
-        if cha.isalpha():
-            if cha.isupper():
-                cipherText+= chr((ord(cha)+ shift-65)%26 +65)
-            else:
-                cipherText+= chr((ord(cha)+ shift-97)%26 +97)
-        else:
-            print("Please don't enter the numbers")
-    return cipherText
-    
-def decrypt(text,shift):
-    cipherText=""
-    for i in range(len(text)):
-        cha=text[i]
-        if cha.isalpha():
-            if cha.isupper():
-                cipherText+= chr((ord(cha)- shift-65)%26 +65)
-            else:
-                cipherText+= chr((ord(cha)- shift-97)%26 +97)
+import mmap
+from functools import lru_cache
+
+import numpy as np
+
+UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LOWER = "abcdefghijklmnopqrstuvwxyz"
+CHUNK_SIZE = 1 << 20  # 1 MiB per read when streaming files
+
+# Relative letter frequencies of English text (A-Z)
+ENGLISH_FREQ = np.array([
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966,
+    0.00153, 0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987,
+    0.06327, 0.09056, 0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+])
+LOG_FREQ = np.log(ENGLISH_FREQ / ENGLISH_FREQ.sum())
+# _ROTATIONS[s, p] is the ciphertext letter that decrypts to p under shift s
+_ROTATIONS = (np.arange(26)[None, :] + np.arange(26)[:, None]) % 26
+
+
+@lru_cache(maxsize=52)
+def _str_table(shift):
+    """
+    Translation table for str.translate, built once per shift.
+    Only A-Z and a-z are mapped, everything else passes through unchanged.
+    """
+    shift %= 26
+    return str.maketrans(UPPER + LOWER,
+                         UPPER[shift:] + UPPER[:shift] + LOWER[shift:] + LOWER[:shift])
+
+
+@lru_cache(maxsize=52)
+def _bytes_table(shift):
+    """
+    256-entry table for bytes.translate, built once per shift.
+    """
+    shift %= 26
+    upper, lower = UPPER.encode(), LOWER.encode()
+    return bytes.maketrans(upper + lower,
+                           upper[shift:] + upper[:shift] + lower[shift:] + lower[:shift])
+
+
+def encrypt(text, shift):
+    """
+    Encrypts str, bytes or bytearray text with a Caesar shift.
+    Non-letters are kept as they are.
+    """
+    if isinstance(text, str):
+        return text.translate(_str_table(shift))
+    return bytes(text).translate(_bytes_table(shift))
+
+
+def decrypt(text, shift):
+    return encrypt(text, -shift)
+
+
+def encrypt_file(src_path, dst_path, shift, chunk_size=CHUNK_SIZE, use_mmap=False):
+    """
+    Encrypts a file in fixed-size chunks so memory use stays flat.
+    The file is treated as bytes, so only ASCII letters are shifted.
+    With use_mmap=True the source is mapped instead of read chunk by chunk.
+    Returns the number of bytes written.
+    """
+    table = _bytes_table(shift)
+    written = 0
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        if use_mmap:
+            try:
+                mapped = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files cannot be mapped
+                return 0
+            with mapped:
+                for start in range(0, len(mapped), chunk_size):
+                    written += dst.write(mapped[start:start + chunk_size].translate(table))
         else:
-            print("Please don't enter the numbers")
-    return cipherText
-    
-
-text=input("Enter the text")
-shift=int(input("Enter the shift size"))          
-print(f"Encryption {encrypt(text,shift)}")
-text=encrypt(text,shift)
-print(f"Decryption {decrypt(text,shift)}")
\ No newline at end of file
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                written += dst.write(chunk.translate(table))
+    return written
+
+
+def decrypt_file(src_path, dst_path, shift, chunk_size=CHUNK_SIZE, use_mmap=False):
+    return encrypt_file(src_path, dst_path, -shift, chunk_size, use_mmap)
+
+
+def _letters(text):
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    codes = np.frombuffer(text, dtype=np.uint8) | 0x20  # fold case
+    return codes[(codes >= 97) & (codes <= 122)] - 97
+
+
+def letter_histogram(text):
+    """
+    Counts of A-Z (case-insensitive) in str/bytes text, in one pass.
+    """
+    return np.bincount(_letters(text), minlength=26)
+
+
+def score_shifts(histogram):
+    """
+    English log-likelihood of every shift for one histogram (shape 26)
+    or a batch of histograms (shape m x 26), computed by rotating the
+    histogram instead of decrypting the text 26 times.
+    """
+    return np.asarray(histogram, dtype=np.float64)[..., _ROTATIONS] @ LOG_FREQ
+
+
+def crack_caesar(text):
+    """
+    Finds the most likely shift of a Caesar ciphertext.
+    Returns (shift, plaintext).
+    """
+    shift = int(score_shifts(letter_histogram(text)).argmax())
+    return shift, decrypt(text, shift)
+
+
+def crack_caesar_batch(messages):
+    """
+    Cracks many messages at once.
+    All letters are histogrammed in a single bincount keyed by message,
+    then every shift of every message is scored with one matrix product.
+    Returns a list of (shift, plaintext) tuples in input order.
+    """
+    if not messages:
+        return []
+    letters = [_letters(m) for m in messages]
+    owner = np.repeat(np.arange(len(messages)), [len(l) for l in letters])
+    histograms = np.bincount(owner * 26 + np.concatenate(letters),
+                             minlength=len(messages) * 26).reshape(len(messages), 26)
+    shifts = score_shifts(histograms).argmax(axis=1)
+    return [(int(shift), decrypt(m, int(shift))) for m, shift in zip(messages, shifts)]
+
+
+if __name__ == "__main__":
+    text=input("Enter the text")
+    shift=int(input("Enter the shift size"))
+    print(f"Encryption {encrypt(text,shift)}")
+    text=encrypt(text,shift)
+    print(f"Decryption {decrypt(text,shift)}")
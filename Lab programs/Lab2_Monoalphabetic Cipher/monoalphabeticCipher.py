@@ -1,19 +1,77 @@
 alpha=['a','b','c','d','e','f','g','h','i','j','k','l','m','n','o','p','q','r','s','t','u','v','w','x','y','z']
 keys=['u','v','w','x','y','z','d','e','f','g','h','i','j','k','l','m','n','a','b','c','o','p','q','r','s','t']
 
-plaintext=input("Enter the Plaintext\n")
-ciphertext=""
-for i in plaintext:
-    for j in alpha:
-        if i==j:
-            ciphertext+=keys[alpha.index(j)]
-
-print(f"The encrypted text is {ciphertext}")
-
-originalText=""
-for i in ciphertext:
-    for j in keys:
-        if i==j:
-            originalText+=alpha[keys.index(j)]
-
-print(f"The original text is {originalText}")
+CHUNK_SIZE = 1 << 20  # 1 MiB per read when streaming files
+
+
+class SubstitutionCipher:
+    """
+    Monoalphabetic substitution compiled into lookup tables.
+    - The key is any permutation of the 26 letters (list or string, either case).
+    - Forward and inverse tables are built once, so every character costs O(1).
+    - Case is kept and non-letters (digits, punctuation, spaces) pass through unchanged.
+    """
+
+    def __init__(self, key):
+        key = "".join(key).lower()
+        if len(key) != 26 or set(key) != set(alpha):
+            raise ValueError("Key must be a permutation of the 26 letters.")
+        plain = "".join(alpha)
+        plain_all = plain + plain.upper()
+        key_all = key + key.upper()
+        self.key = key
+        self._enc_str = str.maketrans(plain_all, key_all)
+        self._dec_str = str.maketrans(key_all, plain_all)
+        self._enc_bytes = bytes.maketrans(plain_all.encode(), key_all.encode())
+        self._dec_bytes = bytes.maketrans(key_all.encode(), plain_all.encode())
+
+    def encrypt(self, text):
+        if isinstance(text, str):
+            return text.translate(self._enc_str)
+        return bytes(text).translate(self._enc_bytes)
+
+    def decrypt(self, text):
+        if isinstance(text, str):
+            return text.translate(self._dec_str)
+        return bytes(text).translate(self._dec_bytes)
+
+    def encrypt_many(self, messages):
+        """
+        Encrypts a batch of str/bytes messages with the compiled table.
+        """
+        return [self.encrypt(m) for m in messages]
+
+    def decrypt_many(self, messages):
+        return [self.decrypt(m) for m in messages]
+
+    def encrypt_file(self, src_path, dst_path, chunk_size=CHUNK_SIZE):
+        """
+        Streams a file through the forward table in fixed-size chunks.
+        Returns the number of bytes written.
+        """
+        return self._translate_file(src_path, dst_path, self._enc_bytes, chunk_size)
+
+    def decrypt_file(self, src_path, dst_path, chunk_size=CHUNK_SIZE):
+        return self._translate_file(src_path, dst_path, self._dec_bytes, chunk_size)
+
+    @staticmethod
+    def _translate_file(src_path, dst_path, table, chunk_size):
+        written = 0
+        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                written += dst.write(chunk.translate(table))
+        return written
+
+
+if __name__ == "__main__":
+    cipher=SubstitutionCipher(keys)
+
+    plaintext=input("Enter the Plaintext\n")
+    ciphertext=cipher.encrypt(plaintext)
+    print(f"The encrypted text is {ciphertext}")
+
+    originalText=cipher.decrypt(ciphertext)
+    print(f"The original text is {originalText}")
@@ -1,67 +1,96 @@
-def playfair(key,cipher):
-    key="".join(dict.fromkeys((key+"ABCDEFGHIKLMNOPQRSTUVWXYZ").upper().replace("J","")))
-    cipher=cipher.replace("J","I").upper()
-    table=[key[i:i+5] for i in range(0,25,5)]
-    pairs=[]
-    i=0
-    while(i<len(cipher)):
-        a=cipher[i]
-        b=cipher[i+1] if i+1<len(cipher) else "X"
-        if a==b:
-            pairs.append((a,"X"))
-            i+=1
-        else:
-            pairs.append((a,b))
-            i+=2
-    def encrypt(pair):
-        idx1=key.index(pair[0])
-        idx2=key.index(pair[1])
-        row1,col1=divmod(idx1,5)
-        row2,col2=divmod(idx2,5)
-        if row1==row2:
-            return table[row1][(col1+1)%5]+table[row2][(col2+1)%5]
-        elif col1==col2:
-            return table[(row1+1)%5][col1]+table[(row2+1)%5][col2]
+from functools import lru_cache
+
+ALPHABET="ABCDEFGHIKLMNOPQRSTUVWXYZ"  # 25 letters, J is merged into I
+INDEX={c:i for i,c in enumerate(ALPHABET)}
+INDEX["J"]=INDEX["I"]
+KEY_CACHE_SIZE=256
+
+
+def _key_square(key):
+    """
+    The 25-letter square for a key. Like the text, the key is read for its
+    letters only: digits, spaces, punctuation and J are skipped.
+    """
+    if not isinstance(key,str):
+        raise TypeError("Key must be a string.")
+    return "".join(dict.fromkeys(c for c in (key+ALPHABET).upper() if c in INDEX and c!="J"))
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _compile(square):
+    """
+    Compiles a key square into two flat 625-entry digraph tables.
+    Entry a*25+b holds the output digraph for letters a, b (alphabet indices).
+    """
+    pos=[0]*25
+    for i,c in enumerate(square):
+        pos[INDEX[c]]=i
+    enc=[None]*625
+    dec=[None]*625
+    for a in range(25):
+        row1,col1=divmod(pos[a],5)
+        for b in range(25):
+            row2,col2=divmod(pos[b],5)
+            if row1==row2:
+                e=square[row1*5+(col1+1)%5]+square[row2*5+(col2+1)%5]
+                d=square[row1*5+(col1+4)%5]+square[row2*5+(col2+4)%5]
+            elif col1==col2:
+                e=square[(row1+1)%5*5+col1]+square[(row2+1)%5*5+col2]
+                d=square[(row1+4)%5*5+col1]+square[(row2+4)%5*5+col2]
+            else:
+                e=d=square[row1*5+col2]+square[row2*5+col1]
+            enc[a*25+b]=e
+            dec[a*25+b]=d
+    return tuple(enc),tuple(dec)
+
+
+def compile_key(key):
+    """
+    Returns the (encrypt, decrypt) digraph tables for a key.
+    Compiled keys are kept in a bounded LRU cache, so repeated keys cost nothing.
+    """
+    return _compile(_key_square(key))
+
+
+def digraphs(text):
+    """
+    Single-pass generator of digraph table indices (a*25+b).
+    Non-letters are skipped; a doubled letter is split with X and
+    an odd trailing letter is padded with X.
+    """
+    x=INDEX["X"]
+    first=None
+    for ch in text.upper():
+        i=INDEX.get(ch)
+        if i is None:
+            continue
+        if first is None:
+            first=i
+        elif first==i:
+            yield first*25+x
         else:
-            return table[row1][col2]+table[row2][col1]
-    encrypted_mes="".join(encrypt(pair)for pair in pairs)
-    return encrypted_mes
+            yield first*25+i
+            first=None
+    if first is not None:
+        yield first*25+x
+
+
+def playfair(key,cipher):
+    enc,_=compile_key(key)
+    return "".join([enc[d] for d in digraphs(cipher)])
 
-#DECRYPTION FUNCTION 
+#DECRYPTION FUNCTION
 def playfair_decrypt(key,cipher):
-    key="".join(dict.fromkeys((key+"ABCDEFGHIKLMNOPQRSTUVWXYZ").upper().replace("J","")))
-    cipher=cipher.replace("J","I").upper()
-    table=[key[i:i+5] for i in range(0,25,5)]
-    pairs=[]
-    i=0
-    while(i<len(cipher)):
-        a=cipher[i]
-        b=cipher[i+1] if i+1<len(cipher) else "X"
-        if a==b:
-            pairs.append((a,"X"))
-            i+=1
-        else:
-            pairs.append((a,b))
-            i+=2
-    def decrypt(pair):
-        idx1=key.index(pair[0])
-        idx2=key.index(pair[1])
-        row1,col1=divmod(idx1,5)
-        row2,col2=divmod(idx2,5)
-        if row1==row2:
-            return table[row1][(col1+4)%5]+table[row2][(col2+4)%5]
-        elif col1==col2:
-            return table[(row1+4)%5][col1]+table[(row2+4)%5][col2]
-        else:
-            return table[row1][col2]+table[row2][col1]
-    decrypted_mes="".join(decrypt(pair)for pair in pairs).replace("X", "") 
-    return decrypted_mes
+    _,dec=compile_key(key)
+    return "".join([dec[d] for d in digraphs(cipher)]).replace("X", "")
+
 
-key=input("enter the key:")
-mes=input("enter the cipher:")
-enc=playfair(key,mes)
-dec=playfair_decrypt(key,enc)
+if __name__ == "__main__":
+    key=input("enter the key:")
+    mes=input("enter the cipher:")
+    enc=playfair(key,mes)
+    dec=playfair_decrypt(key,enc)
 
-print("encrypted message:"+enc)
+    print("encrypted message:"+enc)
 
-print("decrypted message:"+dec)
+    print("decrypted message:"+dec)
@@ -1,12 +1,80 @@
+from functools import lru_cache
+
 import numpy as np
 
+MOD = 26
+MOD_FACTORS = (2, 13)  # 26 = 2 * 13, both prime
+
+
 def mod_inverse(a, m):
     """Find the modular inverse of a under modulo m using Extended Euclidean Algorithm."""
-    a = a % m
-    for x in range(1, m):
-        if (a * x) % m == 1:
-            return x
-    return None  # No modular inverse exists
+    try:
+        return pow(a, -1, m)
+    except ValueError:
+        return None  # No modular inverse exists
+
+
+def _inverse_mod_prime(matrix, p):
+    """
+    Exact Gauss-Jordan inversion of a square integer matrix over GF(p).
+    Works on Python ints, so there is no floating point error for any n.
+    """
+    n = len(matrix)
+    aug = [[x % p for x in row] + [int(i == j) for j in range(n)] for i, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if aug[r][col]), None)
+        if pivot is None:
+            raise ValueError("Key matrix is not invertible under mod 26. Choose a different key.")
+        aug[col], aug[pivot] = aug[pivot], aug[col]
+        inv = pow(aug[col][col], -1, p)
+        aug[col] = [x * inv % p for x in aug[col]]
+        for r in range(n):
+            factor = aug[r][col]
+            if r != col and factor:
+                aug[r] = [(x - factor * y) % p for x, y in zip(aug[r], aug[col])]
+    return [row[n:] for row in aug]
+
+
+@lru_cache(maxsize=128)
+def _cached_inverse(key):
+    parts = [(p, _inverse_mod_prime(key, p)) for p in MOD_FACTORS]
+    n = len(key)
+    inverse = np.zeros((n, n), dtype=np.int64)
+    # Chinese Remainder Theorem: combine the inverses mod 2 and mod 13 into one mod 26.
+    for p, part in parts:
+        coeff = (MOD // p) * mod_inverse(MOD // p, p)
+        inverse += coeff * np.array(part, dtype=np.int64)
+    inverse %= MOD
+    inverse.setflags(write=False)
+    return inverse
+
+
+def key_inverse(key_matrix):
+    """
+    Returns the inverse of key_matrix mod 26, computed exactly and cached per key.
+    Raises ValueError if the key is not invertible.
+    """
+    key = tuple(tuple(int(x) for x in row) for row in np.asarray(key_matrix))
+    return _cached_inverse(key)
+
+
+def _to_vector(text):
+    return np.frombuffer(text.encode("ascii"), dtype=np.uint8).astype(np.int64) - ord('A')
+
+
+def _to_text(vector):
+    return (vector.astype(np.uint8) + ord('A')).tobytes().decode("ascii")
+
+
+def _apply(matrix, vector):
+    """
+    Multiplies every n-letter block by matrix with one modular matmul.
+    The flat vector is viewed as an n x k matrix whose columns are the blocks.
+    """
+    n = len(matrix)
+    blocks = vector.reshape(-1, n).T
+    return (np.asarray(matrix, dtype=np.int64) @ blocks % MOD).T.reshape(-1)
+
 
 def hill_cipher_encrypt(plaintext, key_matrix):
     n = len(key_matrix)
@@ -16,39 +84,12 @@ def hill_cipher_encrypt(plaintext, key_matrix):
     extra_chars = (n - len(plaintext) % n) % n  # How many 'X' are added
     plaintext += "X" * extra_chars
 
-    plaintext_vector = [ord(char) - ord('A') for char in plaintext]
-    ciphertext = ""
-
-    for i in range(0, len(plaintext_vector), n):
-        block = plaintext_vector[i:i + n]
-        result = np.dot(key_matrix, block) % 26
-        ciphertext += "".join(chr(num + ord('A')) for num in result)
-
+    ciphertext = _to_text(_apply(key_matrix, _to_vector(plaintext)))
     return ciphertext, extra_chars  # Return the number of added 'X' characters
 
-def hill_cipher_decrypt(ciphertext, key_matrix, extra_chars):
-    n = len(key_matrix)
-    
-    # Compute determinant
-    det = int(round(np.linalg.det(key_matrix))) % 26
-    det_inv = mod_inverse(det, 26)
 
-    if det_inv is None:
-        raise ValueError("Key matrix is not invertible under mod 26. Choose a different key.")
-
-    # Compute adjugate (cofactor matrix transposed)
-    adjugate = np.round(np.linalg.inv(key_matrix) * np.linalg.det(key_matrix)).astype(int) % 26
-
-    # Multiply adjugate by modular inverse of determinant
-    key_inverse = (det_inv * adjugate) % 26
-
-    ciphertext_vector = [ord(char) - ord('A') for char in ciphertext]
-    originaltext = ""
-
-    for i in range(0, len(ciphertext_vector), n):
-        block = ciphertext_vector[i:i + n]
-        result = np.dot(key_inverse, block) % 26
-        originaltext += "".join(chr(int(num) + ord('A')) for num in result)
+def hill_cipher_decrypt(ciphertext, key_matrix, extra_chars):
+    originaltext = _to_text(_apply(key_inverse(key_matrix), _to_vector(ciphertext)))
 
     # Remove extra 'X' padding added during encryption
     if extra_chars > 0:
@@ -56,15 +97,51 @@ def hill_cipher_decrypt(ciphertext, key_matrix, extra_chars):
 
     return originaltext
 
-# Example usage
-plaintext = input("Enter the text: ")
-key_matrix = np.array([[6, 24, 1], [13, 16, 10], [20, 17, 15]])  # Example 3x3 key matrix
-
-ciphertext, extra_chars = hill_cipher_encrypt(plaintext, key_matrix)
-print("Encrypted:", ciphertext)
 
-try:
-    originaltext = hill_cipher_decrypt(ciphertext, key_matrix, extra_chars)
-    print("Decrypted:", originaltext)
-except ValueError as e:
-    print(e)
+def hill_cipher_encrypt_batch(messages, key_matrix):
+    """
+    Encrypts many messages with a single matrix multiply.
+    All padded messages are concatenated into one n x k matrix, then split again.
+    Returns a list of (ciphertext, extra_chars) tuples.
+    """
+    n = len(key_matrix)
+    padded, extras = [], []
+    for text in messages:
+        text = text.upper().replace(" ", "")
+        extra = (n - len(text) % n) % n
+        padded.append(text + "X" * extra)
+        extras.append(extra)
+    joined = _to_text(_apply(key_matrix, _to_vector("".join(padded))))
+    result, pos = [], 0
+    for text, extra in zip(padded, extras):
+        result.append((joined[pos:pos + len(text)], extra))
+        pos += len(text)
+    return result
+
+
+def hill_cipher_decrypt_batch(ciphertexts, key_matrix):
+    """
+    Decrypts a list of (ciphertext, extra_chars) tuples with a single matrix multiply.
+    """
+    joined = _to_text(_apply(key_inverse(key_matrix), _to_vector("".join(c for c, _ in ciphertexts))))
+    result, pos = [], 0
+    for text, extra in ciphertexts:
+        plain = joined[pos:pos + len(text)]
+        result.append(plain[:len(plain) - extra])
+        pos += len(text)
+    return result
+
+
+if __name__ == "__main__":
+    # Example usage
+    plaintext = input("Enter the text: ")
+    key_matrix = np.array([[6, 24, 1], [13, 16, 10], [20, 17, 15]])  # Example 3x3 key matrix
+
+    ciphertext, extra_chars = hill_cipher_encrypt(plaintext, key_matrix)
+    print("Encrypted:", ciphertext)
+
+    try:
+        originaltext = hill_cipher_decrypt(ciphertext, key_matrix, extra_chars)
+        print("Decrypted:", originaltext)
+    except ValueError as e:
+        print(e)
@@ -1,3 +1,8 @@
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
 def feistel_round(L, R, K):
     """
     One round of the Feistel cipher.
@@ -36,10 +41,174 @@ def feistel_decrypt(ciphertext, round_keys):
     return (L + R).replace("X","")  # Concatenate to get the original plaintext
 
 
-round_keys = [3, 7, 2, 5]  # Example round keys
-plaintext = "HELLO"  # Example plaintext
-encrypted_text = feistel_encrypt(plaintext, round_keys)
-decrypted_text = feistel_decrypt(encrypted_text, round_keys)
-print(f"Plaintext: {plaintext}")          # Expected: HELLO
-print(f"Ciphertext: {encrypted_text}")
-print(f"Decrypted: {decrypted_text}")
\ No newline at end of file
+# ============================
+# BYTES-BASED FEISTEL BLOCK CIPHER
+# ============================
+
+BLOCK_SIZE = 8  # bytes; each half is one 32-bit word
+MASK32 = 0xFFFFFFFF
+SEGMENT_SIZE = 8 << 20  # bytes per process-pool task in CTR mode
+_HALVES = np.dtype(">u4")
+
+
+def default_round_function(right, key):
+    """
+    32-bit mixing round function f(R, K).
+    Works on Python ints and on NumPy uint32 arrays (one value per block),
+    so the same function drives the scalar and the vectorized paths.
+    """
+    x = (right ^ key) & MASK32
+    x = (x * 0x9E3779B1) & MASK32
+    x ^= x >> 16
+    x = (x * 0x85EBCA6B) & MASK32
+    x ^= x >> 13
+    return x
+
+
+def _check_iv(value, name="IV"):
+    if len(value) != BLOCK_SIZE:
+        raise ValueError(f"{name} must be {BLOCK_SIZE} bytes.")
+
+
+def pkcs7_pad(data, block_size=BLOCK_SIZE):
+    n = block_size - len(data) % block_size
+    return bytes(data) + bytes([n]) * n
+
+
+def pkcs7_unpad(data, block_size=BLOCK_SIZE):
+    n = data[-1] if data else 0
+    if not 1 <= n <= block_size or data[-n:] != bytes([n]) * n:
+        raise ValueError("Invalid padding.")
+    return data[:-n]
+
+
+class FeistelCipher:
+    """
+    Feistel block cipher over bytes with a fixed 8-byte block.
+    - round_keys: list of 32-bit integer round keys (one per round).
+    - round_function: f(right, key) -> 32-bit value; must also accept
+      uint32 arrays for the vectorized path and be a module-level
+      function if CTR mode is used with a process pool.
+    Every round runs across all blocks of a message at once with NumPy.
+    """
+
+    def __init__(self, round_keys, round_function=default_round_function):
+        self.round_keys = [k & MASK32 for k in round_keys]
+        self.round_function = round_function
+
+    @classmethod
+    def from_key(cls, key, rounds=16, round_function=default_round_function):
+        """
+        Derives `rounds` 32-bit round keys from a byte key with SHA-256.
+        """
+        stream = b"".join(hashlib.sha256(key + bytes([i])).digest() for i in range((rounds * 4 + 31) // 32))
+        return cls([int.from_bytes(stream[i * 4:i * 4 + 4], "big") for i in range(rounds)], round_function)
+
+    # ---- raw blocks ----
+
+    def _encrypt_halves(self, left, right):
+        f = self.round_function
+        for k in self.round_keys:
+            left, right = right, left ^ f(right, k)
+        return left, right
+
+    def _decrypt_halves(self, left, right):
+        f = self.round_function
+        for k in reversed(self.round_keys):
+            right, left = left, right ^ f(left, k)
+        return left, right
+
+    def _blocks(self, data, transform):
+        words = np.frombuffer(data, dtype=_HALVES)
+        if len(words) * 4 != len(data) or len(words) % 2:
+            raise ValueError(f"Data length must be a multiple of {BLOCK_SIZE} bytes.")
+        left, right = transform(words[0::2].astype(np.uint32), words[1::2].astype(np.uint32))
+        out = np.empty(len(words), dtype=_HALVES)
+        out[0::2], out[1::2] = left, right
+        return out.tobytes()
+
+    def encrypt_blocks(self, data):
+        """
+        Encrypts whole 8-byte blocks (no padding), all blocks per round at once.
+        """
+        return self._blocks(data, self._encrypt_halves)
+
+    def decrypt_blocks(self, data):
+        return self._blocks(data, self._decrypt_halves)
+
+    # ---- modes of operation ----
+
+    def encrypt_ecb(self, data):
+        return self.encrypt_blocks(pkcs7_pad(data))
+
+    def decrypt_ecb(self, data):
+        return pkcs7_unpad(self.decrypt_blocks(data))
+
+    def encrypt_cbc(self, data, iv):
+        """
+        CBC encryption is sequential by nature, so it runs block by block
+        on Python ints; decryption is vectorized.
+        """
+        _check_iv(iv)
+        padded = pkcs7_pad(data)
+        words = np.frombuffer(padded, dtype=_HALVES).tolist()
+        prev_l, prev_r = (int(w) for w in np.frombuffer(iv, dtype=_HALVES))
+        out = []
+        for i in range(0, len(words), 2):
+            prev_l, prev_r = self._encrypt_halves(words[i] ^ prev_l, words[i + 1] ^ prev_r)
+            out += (prev_l, prev_r)
+        return np.array(out, dtype=_HALVES).tobytes()
+
+    def decrypt_cbc(self, data, iv):
+        _check_iv(iv)
+        if not data or len(data) % BLOCK_SIZE:
+            raise ValueError(f"CBC ciphertext must be a non-empty multiple of {BLOCK_SIZE} bytes.")
+        plain = np.frombuffer(self.decrypt_blocks(data), dtype=np.uint8)
+        chained = np.frombuffer(bytes(iv) + bytes(data[:-BLOCK_SIZE]), dtype=np.uint8)
+        return pkcs7_unpad((plain ^ chained).tobytes())
+
+    def keystream(self, nonce, start_block, count):
+        """
+        CTR keystream for blocks start_block .. start_block+count-1.
+        Counter block i is (nonce + i) mod 2**64.
+        """
+        counters = np.uint64(int.from_bytes(nonce, "big")) + np.arange(start_block, start_block + count, dtype=np.uint64)
+        left, right = self._encrypt_halves((counters >> np.uint64(32)).astype(np.uint32),
+                                           (counters & np.uint64(MASK32)).astype(np.uint32))
+        out = np.empty(2 * count, dtype=_HALVES)
+        out[0::2], out[1::2] = left, right
+        return np.frombuffer(out.tobytes(), dtype=np.uint8)
+
+    def ctr(self, data, nonce, workers=None, segment_size=SEGMENT_SIZE):
+        """
+        CTR mode (encryption and decryption are the same operation).
+        No padding is needed. With workers > 1, buffers larger than one
+        segment are split on block boundaries across a process pool.
+        """
+        _check_iv(nonce, "Nonce")
+        if workers and workers > 1 and len(data) > segment_size:
+            segment_size -= segment_size % BLOCK_SIZE
+            view = memoryview(data)
+            jobs = [(self.round_keys, self.round_function, bytes(nonce), start, view[start:start + segment_size].tobytes())
+                    for start in range(0, len(data), segment_size)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return b"".join(pool.map(_ctr_segment, jobs))
+        return _ctr_segment((self.round_keys, self.round_function, bytes(nonce), 0, data))
+
+
+def _ctr_segment(job):
+    round_keys, round_function, nonce, offset, data = job
+    cipher = FeistelCipher(round_keys, round_function)
+    count = -(-len(data) // BLOCK_SIZE)
+    stream = cipher.keystream(nonce, offset // BLOCK_SIZE, count)[:len(data)]
+    return (np.frombuffer(data, dtype=np.uint8) ^ stream).tobytes()
+
+
+if __name__ == "__main__":
+    round_keys = [3, 7, 2, 5]  # Example round keys
+    plaintext = "HELLO"  # Example plaintext
+    encrypted_text = feistel_encrypt(plaintext, round_keys)
+    decrypted_text = feistel_decrypt(encrypted_text, round_keys)
+    print(f"Plaintext: {plaintext}")          # Expected: HELLO
+    print(f"Ciphertext: {encrypted_text}")
+    print(f"Decrypted: {decrypted_text}")
@@ -1,37 +1,44 @@
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=64)
+def _key_shifts(key):
+    """
+    Shift vector (0-25) for the letters of the key, built once per key.
+    """
+    shifts = np.array([ord(c) - ord('A') for c in key.upper() if 'A' <= c <= 'Z'], dtype=np.int16)
+    if len(shifts) == 0:
+        raise ValueError("Key must contain at least one letter.")
+    shifts.setflags(write=False)
+    return shifts
+
+
+def _shift_letters(text, key, sign):
+    """
+    Shifts every A-Z letter of text by the key in one vectorized pass.
+    The key advances over letters only; other characters are kept.
+    """
+    shifts = _key_shifts(key)
+    codes = np.frombuffer(text.upper().encode("utf-32-le"), dtype=np.uint32).copy()
+    letters = np.flatnonzero((codes >= 65) & (codes <= 90))
+    codes[letters] = (codes[letters].astype(np.int16) - 65 + sign * np.resize(shifts, len(letters))) % 26 + 65
+    return codes.tobytes().decode("utf-32-le")
+
+
 def vignereCipher(plaintext,key):
-    key=key.upper()
-    ciphertext=""
-    key_index=0
-    for char in plaintext.upper():
-        if char.isalpha():
-            shift = ord(key[key_index]) - ord('A')
-            ciphertext += chr((ord(char) - ord('A') + shift) % 26 + ord('A'))
-            key_index = (key_index + 1) % len(key)
-        else:
-            ciphertext+=char
-    
-    return ciphertext
+    return _shift_letters(plaintext, key, 1)
 
 
 def vignereCipher_decrypt(ciphertext,key):
-    key=key.upper()
-    originaltext=""
-    key_index=0
-    for char in ciphertext.upper():
-        if char.isalpha():
-            shift = ord(key[key_index]) - ord('A')
-            originaltext += chr((ord(char) - ord('A') - shift) % 26 + ord('A'))
-            key_index = (key_index + 1) % len(key)
-        else:
-            originaltext+=char
-    
-    return originaltext
-        
-        
-        
-plaintext=input("Enter the plaintext\n")
-key=input("Enter the key\n")
-ciphertext=vignereCipher(plaintext,key)
-print(ciphertext)
-originaltext=vignereCipher_decrypt(ciphertext,key)
-print(originaltext)
\ No newline at end of file
+    return _shift_letters(ciphertext, key, -1)
+
+
+if __name__ == "__main__":
+    plaintext=input("Enter the plaintext\n")
+    key=input("Enter the key\n")
+    ciphertext=vignereCipher(plaintext,key)
+    print(ciphertext)
+    originaltext=vignereCipher_decrypt(ciphertext,key)
+    print(originaltext)
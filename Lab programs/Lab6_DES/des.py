@@ -1,100 +1,368 @@
-import random
-s = input("Enter a string : ")
-result = ''.join(format(ord(i),'08b') for i in s)
-answer = ""
-for i in range(len(result)):
-    if(i%8!=0):
-       answer+=result[i] 
-     
-l = int(len(answer)/2)
-left = answer[:l]
-right = answer[l:]
-
-lt = [2,3,6,7,1,6,5,9]
-
-keys = []
-for i in range(0,8):
-    newKey = ""
-    newAnswer = ""
-    
-    nl=int(left,2)
-    nl=bin(nl<<lt[i])
-    num=2+lt[i]
-    
-    nr = int(right,2)
-    nr = bin(nr<<lt[i])
-    num=2+lt[i]
-    
-    newKey = nr[num:]+nl[num:]
-    rm =[]
-    
-    while(len(rm)!=8):
-        r = random.randint(0,len(newKey)-1)
-        if(r not in rm):
-            rm.append(r)
-    for i in range(len(newKey)):
-        if(i not in rm):
-          newAnswer+=newKey[i]
-          
-    keys.append(newAnswer)
-
-for i in range(0,len(keys)):
-    print("Key ",i+1," = ",keys[i])
-
-
-
-
-
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-
-    
+"""
+Data Encryption Standard (DES) and Triple DES.
 
+- Deterministic 64-bit integer key schedule (PC-1, shifts, PC-2), cached per key.
+- Rounds use combined S-box + P-box (SP) tables, so f(R, K) is 8 lookups;
+  the E expansion is folded into rotations of R.
+- IP and FP are applied with per-byte lookup tables.
+- Single blocks run on Python ints; many blocks run on NumPy uint64 arrays.
+- ECB / CBC (PKCS#7 padding) and CTR modes over bytes.
+"""
+from functools import lru_cache
 
+import numpy as np
+
+BLOCK_SIZE = 8
+BATCH_BLOCKS = 1 << 14  # blocks per NumPy batch, sized to stay cache resident
+MASK32 = 0xFFFFFFFF
+
+IP = [58, 50, 42, 34, 26, 18, 10, 2, 60, 52, 44, 36, 28, 20, 12, 4,
+      62, 54, 46, 38, 30, 22, 14, 6, 64, 56, 48, 40, 32, 24, 16, 8,
+      57, 49, 41, 33, 25, 17, 9, 1, 59, 51, 43, 35, 27, 19, 11, 3,
+      61, 53, 45, 37, 29, 21, 13, 5, 63, 55, 47, 39, 31, 23, 15, 7]
+
+FP = [40, 8, 48, 16, 56, 24, 64, 32, 39, 7, 47, 15, 55, 23, 63, 31,
+      38, 6, 46, 14, 54, 22, 62, 30, 37, 5, 45, 13, 53, 21, 61, 29,
+      36, 4, 44, 12, 52, 20, 60, 28, 35, 3, 43, 11, 51, 19, 59, 27,
+      34, 2, 42, 10, 50, 18, 58, 26, 33, 1, 41, 9, 49, 17, 57, 25]
+
+E = [32, 1, 2, 3, 4, 5, 4, 5, 6, 7, 8, 9,
+     8, 9, 10, 11, 12, 13, 12, 13, 14, 15, 16, 17,
+     16, 17, 18, 19, 20, 21, 20, 21, 22, 23, 24, 25,
+     24, 25, 26, 27, 28, 29, 28, 29, 30, 31, 32, 1]
+
+P = [16, 7, 20, 21, 29, 12, 28, 17, 1, 15, 23, 26, 5, 18, 31, 10,
+     2, 8, 24, 14, 32, 27, 3, 9, 19, 13, 30, 6, 22, 11, 4, 25]
+
+PC1 = [57, 49, 41, 33, 25, 17, 9, 1, 58, 50, 42, 34, 26, 18,
+       10, 2, 59, 51, 43, 35, 27, 19, 11, 3, 60, 52, 44, 36,
+       63, 55, 47, 39, 31, 23, 15, 7, 62, 54, 46, 38, 30, 22,
+       14, 6, 61, 53, 45, 37, 29, 21, 13, 5, 28, 20, 12, 4]
+
+PC2 = [14, 17, 11, 24, 1, 5, 3, 28, 15, 6, 21, 10,
+       23, 19, 12, 4, 26, 8, 16, 7, 27, 20, 13, 2,
+       41, 52, 31, 37, 47, 55, 30, 40, 51, 45, 33, 48,
+       44, 49, 39, 56, 34, 53, 46, 42, 50, 36, 29, 32]
+
+SHIFTS = [1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 1]
+
+SBOXES = [
+    [14, 4, 13, 1, 2, 15, 11, 8, 3, 10, 6, 12, 5, 9, 0, 7,
+     0, 15, 7, 4, 14, 2, 13, 1, 10, 6, 12, 11, 9, 5, 3, 8,
+     4, 1, 14, 8, 13, 6, 2, 11, 15, 12, 9, 7, 3, 10, 5, 0,
+     15, 12, 8, 2, 4, 9, 1, 7, 5, 11, 3, 14, 10, 0, 6, 13],
+    [15, 1, 8, 14, 6, 11, 3, 4, 9, 7, 2, 13, 12, 0, 5, 10,
+     3, 13, 4, 7, 15, 2, 8, 14, 12, 0, 1, 10, 6, 9, 11, 5,
+     0, 14, 7, 11, 10, 4, 13, 1, 5, 8, 12, 6, 9, 3, 2, 15,
+     13, 8, 10, 1, 3, 15, 4, 2, 11, 6, 7, 12, 0, 5, 14, 9],
+    [10, 0, 9, 14, 6, 3, 15, 5, 1, 13, 12, 7, 11, 4, 2, 8,
+     13, 7, 0, 9, 3, 4, 6, 10, 2, 8, 5, 14, 12, 11, 15, 1,
+     13, 6, 4, 9, 8, 15, 3, 0, 11, 1, 2, 12, 5, 10, 14, 7,
+     1, 10, 13, 0, 6, 9, 8, 7, 4, 15, 14, 3, 11, 5, 2, 12],
+    [7, 13, 14, 3, 0, 6, 9, 10, 1, 2, 8, 5, 11, 12, 4, 15,
+     13, 8, 11, 5, 6, 15, 0, 3, 4, 7, 2, 12, 1, 10, 14, 9,
+     10, 6, 9, 0, 12, 11, 7, 13, 15, 1, 3, 14, 5, 2, 8, 4,
+     3, 15, 0, 6, 10, 1, 13, 8, 9, 4, 5, 11, 12, 7, 2, 14],
+    [2, 12, 4, 1, 7, 10, 11, 6, 8, 5, 3, 15, 13, 0, 14, 9,
+     14, 11, 2, 12, 4, 7, 13, 1, 5, 0, 15, 10, 3, 9, 8, 6,
+     4, 2, 1, 11, 10, 13, 7, 8, 15, 9, 12, 5, 6, 3, 0, 14,
+     11, 8, 12, 7, 1, 14, 2, 13, 6, 15, 0, 9, 10, 4, 5, 3],
+    [12, 1, 10, 15, 9, 2, 6, 8, 0, 13, 3, 4, 14, 7, 5, 11,
+     10, 15, 4, 2, 7, 12, 9, 5, 6, 1, 13, 14, 0, 11, 3, 8,
+     9, 14, 15, 5, 2, 8, 12, 3, 7, 0, 4, 10, 1, 13, 11, 6,
+     4, 3, 2, 12, 9, 5, 15, 10, 11, 14, 1, 7, 6, 0, 8, 13],
+    [4, 11, 2, 14, 15, 0, 8, 13, 3, 12, 9, 7, 5, 10, 6, 1,
+     13, 0, 11, 7, 4, 9, 1, 10, 14, 3, 5, 12, 2, 15, 8, 6,
+     1, 4, 11, 13, 12, 3, 7, 14, 10, 15, 6, 8, 0, 5, 9, 2,
+     6, 11, 13, 8, 1, 4, 10, 7, 9, 5, 0, 15, 14, 2, 3, 12],
+    [13, 2, 8, 4, 6, 15, 11, 1, 10, 9, 3, 14, 5, 0, 12, 7,
+     1, 15, 13, 8, 10, 3, 7, 4, 12, 5, 6, 11, 0, 14, 9, 2,
+     7, 11, 4, 1, 9, 12, 14, 2, 0, 6, 10, 13, 15, 3, 5, 8,
+     2, 1, 14, 7, 4, 10, 8, 13, 15, 12, 9, 0, 3, 5, 6, 11],
+]
+
+
+def permute(value, table, in_bits):
+    """
+    Generic DES bit permutation; bit 1 is the most significant input bit.
+    Used to build the lookup tables and the key schedule, not per block.
+    """
+    out = 0
+    for pos in table:
+        out = (out << 1) | ((value >> (in_bits - pos)) & 1)
+    return out
+
+
+def _byte_tables(table, in_bits):
+    """
+    Splits a permutation into one 256-entry table per input byte,
+    so permuting a block is an OR of in_bits/8 lookups.
+    """
+    return [[permute(v << (in_bits - 8 * (b + 1)), table, in_bits) for v in range(256)]
+            for b in range(in_bits // 8)]
+
+
+def _sp_tables():
+    """
+    SP[i][x]: S-box i applied to 6-bit input x, placed in its nibble and
+    passed through the P permutation.
+    """
+    tables = []
+    for i, sbox in enumerate(SBOXES):
+        row = []
+        for x in range(64):
+            s = sbox[(((x >> 4) & 2) | (x & 1)) * 16 + ((x >> 1) & 0xF)]
+            row.append(permute(s << (28 - 4 * i), P, 32))
+        tables.append(row)
+    return tables
+
+
+IP_TABLES = _byte_tables(IP, 64)
+FP_TABLES = _byte_tables(FP, 64)
+SP_TABLES = _sp_tables()
+
+_IP_NP = np.array(IP_TABLES, dtype=np.uint64)
+_FP_NP = np.array(FP_TABLES, dtype=np.uint64)
+_SP_NP = np.array(SP_TABLES, dtype=np.uint32)
+
+
+@lru_cache(maxsize=256)
+def key_schedule(key):
+    """
+    Returns the 16 48-bit round keys for a 64-bit integer key.
+    Deterministic and cached per key; parity bits are ignored by PC-1.
+    """
+    cd = permute(key, PC1, 64)
+    c, d = cd >> 28, cd & 0xFFFFFFF
+    round_keys = []
+    for shift in SHIFTS:
+        c = ((c << shift) | (c >> (28 - shift))) & 0xFFFFFFF
+        d = ((d << shift) | (d >> (28 - shift))) & 0xFFFFFFF
+        round_keys.append(permute((c << 28) | d, PC2, 56))
+    return tuple(round_keys)
+
+
+def _key_chunks(round_keys):
+    """
+    Splits each 48-bit round key into the eight 6-bit values fed to the S-boxes.
+    """
+    return tuple(tuple((k >> (42 - 6 * i)) & 0x3F for i in range(8)) for k in round_keys)
+
+
+def _lookup(tables, value, nbytes):
+    out = 0
+    for b in range(nbytes):
+        out |= tables[b][(value >> (8 * (nbytes - 1 - b))) & 0xFF]
+    return out
+
+
+def _crypt_int(block, key_chunks):
+    """
+    DES on one 64-bit integer block. The E expansion is not materialised:
+    with r = R rotated right by 1, S-box input i is the top 6 bits of
+    r rotated left by 4*i.
+    """
+    block = _lookup(IP_TABLES, block, 8)
+    left, right = block >> 32, block & MASK32
+    sp0, sp1, sp2, sp3, sp4, sp5, sp6, sp7 = SP_TABLES
+    for k0, k1, k2, k3, k4, k5, k6, k7 in key_chunks:
+        r = ((right >> 1) | (right << 31)) & MASK32
+        r2 = (r << 32) | r  # r rotated left by n is (r2 >> (32 - n)) & MASK32
+        f = (sp0[(r >> 26) ^ k0] | sp1[((r2 >> 54) & 0x3F) ^ k1] | sp2[((r2 >> 50) & 0x3F) ^ k2]
+             | sp3[((r2 >> 46) & 0x3F) ^ k3] | sp4[((r2 >> 42) & 0x3F) ^ k4] | sp5[((r2 >> 38) & 0x3F) ^ k5]
+             | sp6[((r2 >> 34) & 0x3F) ^ k6] | sp7[((r2 >> 30) & 0x3F) ^ k7])
+        left, right = right, left ^ f
+    return _lookup(FP_TABLES, (right << 32) | left, 8)
+
+
+def _np_lookup(tables, values, nbytes):
+    out = np.zeros(values.shape, dtype=np.uint64)
+    for b in range(nbytes):
+        out |= tables[b].take((values >> np.uint64(8 * (nbytes - 1 - b))) & np.uint64(0xFF))
+    return out
+
+
+def _crypt_array(blocks, key_chunks):
+    """
+    Runs DES over a uint64 array of blocks in cache-sized batches.
+    """
+    if len(blocks) <= BATCH_BLOCKS:
+        return _crypt_batch(blocks, key_chunks)
+    out = np.empty_like(blocks)
+    for start in range(0, len(blocks), BATCH_BLOCKS):
+        out[start:start + BATCH_BLOCKS] = _crypt_batch(blocks[start:start + BATCH_BLOCKS], key_chunks)
+    return out
+
+
+def _crypt_batch(blocks, key_chunks):
+    """
+    Every round is a handful of vectorized shifts and eight SP-table
+    gathers on uint32 halves.
+    """
+    blocks = _np_lookup(_IP_NP, blocks, 8)
+    left = (blocks >> np.uint64(32)).astype(np.uint32)
+    right = blocks.astype(np.uint32)  # keeps the low 32 bits
+    for chunks in key_chunks:
+        r = (right >> np.uint32(1)) | (right << np.uint32(31))
+        f = _SP_NP[0].take((r >> np.uint32(26)) ^ np.uint32(chunks[0]))
+        for i in range(1, 8):
+            rot = (r << np.uint32(4 * i)) | (r >> np.uint32(32 - 4 * i))
+            f |= _SP_NP[i].take((rot >> np.uint32(26)) ^ np.uint32(chunks[i]))
+        left, right = right, left ^ f
+    return _np_lookup(_FP_NP, (right.astype(np.uint64) << np.uint64(32)) | left.astype(np.uint64), 8)
+
+
+def pkcs7_pad(data, block_size=BLOCK_SIZE):
+    n = block_size - len(data) % block_size
+    return bytes(data) + bytes([n]) * n
+
+
+def pkcs7_unpad(data, block_size=BLOCK_SIZE):
+    n = data[-1] if data else 0
+    if not 1 <= n <= block_size or data[-n:] != bytes([n]) * n:
+        raise ValueError("Invalid padding.")
+    return data[:-n]
+
+
+def _check_iv(value, name="IV"):
+    if len(value) != BLOCK_SIZE:
+        raise ValueError(f"{name} must be {BLOCK_SIZE} bytes.")
+
+
+def _to_blocks(data):
+    if len(data) % BLOCK_SIZE:
+        raise ValueError(f"Data length must be a multiple of {BLOCK_SIZE} bytes.")
+    return np.frombuffer(data, dtype=">u8").astype(np.uint64)
+
+
+def _from_blocks(blocks):
+    return blocks.astype(">u8").tobytes()
+
+
+class _BlockModes:
+    """
+    ECB, CBC and CTR over bytes for a 64-bit block cipher.
+    Subclasses provide _encrypt_int/_decrypt_int and _encrypt_array/_decrypt_array.
+    """
+
+    def encrypt_block(self, block):
+        return self._encrypt_int(int.from_bytes(block, "big")).to_bytes(8, "big")
+
+    def decrypt_block(self, block):
+        return self._decrypt_int(int.from_bytes(block, "big")).to_bytes(8, "big")
+
+    def encrypt_blocks(self, data):
+        """
+        Encrypts whole 8-byte blocks (no padding) as one NumPy batch.
+        """
+        return _from_blocks(self._encrypt_array(_to_blocks(data)))
+
+    def decrypt_blocks(self, data):
+        return _from_blocks(self._decrypt_array(_to_blocks(data)))
+
+    def encrypt_ecb(self, data):
+        return self.encrypt_blocks(pkcs7_pad(data))
+
+    def decrypt_ecb(self, data):
+        return pkcs7_unpad(self.decrypt_blocks(data))
+
+    def encrypt_cbc(self, data, iv):
+        """
+        CBC encryption is sequential, so it runs block by block on ints.
+        """
+        _check_iv(iv)
+        prev = int.from_bytes(iv, "big")
+        out = []
+        for block in np.frombuffer(pkcs7_pad(data), dtype=">u8").tolist():
+            prev = self._encrypt_int(block ^ prev)
+            out.append(prev)
+        return np.array(out, dtype=">u8").tobytes()
+
+    def decrypt_cbc(self, data, iv):
+        _check_iv(iv)
+        if not data or len(data) % BLOCK_SIZE:
+            raise ValueError(f"CBC ciphertext must be a non-empty multiple of {BLOCK_SIZE} bytes.")
+        blocks = _to_blocks(data)
+        chained = np.concatenate(([np.uint64(int.from_bytes(iv, "big"))], blocks[:-1]))
+        return pkcs7_unpad(_from_blocks(self._decrypt_array(blocks) ^ chained))
+
+    def ctr(self, data, nonce):
+        """
+        CTR mode (encrypt and decrypt are the same). Counter block i is
+        (nonce + i) mod 2**64; no padding is needed.
+        """
+        _check_iv(nonce, "Nonce")
+        count = -(-len(data) // BLOCK_SIZE)
+        counters = np.uint64(int.from_bytes(nonce, "big")) + np.arange(count, dtype=np.uint64)
+        stream = np.frombuffer(_from_blocks(self._encrypt_array(counters)), dtype=np.uint8)[:len(data)]
+        return (np.frombuffer(data, dtype=np.uint8) ^ stream).tobytes()
+
+
+class DES(_BlockModes):
+    """
+    Single DES with an 8-byte key (or a 64-bit integer key).
+    """
+
+    def __init__(self, key):
+        if isinstance(key, int):
+            key = key.to_bytes(8, "big")
+        if len(key) != 8:
+            raise ValueError("DES key must be 8 bytes.")
+        self.round_keys = key_schedule(int.from_bytes(key, "big"))
+        self.key_chunks = _key_chunks(self.round_keys)
+        self.inverse_chunks = self.key_chunks[::-1]
+
+    def _encrypt_int(self, block):
+        return _crypt_int(block, self.key_chunks)
+
+    def _decrypt_int(self, block):
+        return _crypt_int(block, self.inverse_chunks)
+
+    def _encrypt_array(self, blocks):
+        return _crypt_array(blocks, self.key_chunks)
+
+    def _decrypt_array(self, blocks):
+        return _crypt_array(blocks, self.inverse_chunks)
+
+
+class TripleDES(_BlockModes):
+    """
+    Triple DES (EDE) with a 16-byte (two-key) or 24-byte (three-key) key.
+    """
+
+    def __init__(self, key):
+        if len(key) not in (16, 24):
+            raise ValueError("Triple DES key must be 16 or 24 bytes.")
+        k1, k2 = DES(key[:8]), DES(key[8:16])
+        k3 = DES(key[16:24]) if len(key) == 24 else k1
+        self.keys = (k1, k2, k3)
+
+    def _encrypt_int(self, block):
+        k1, k2, k3 = self.keys
+        return k3._encrypt_int(k2._decrypt_int(k1._encrypt_int(block)))
+
+    def _decrypt_int(self, block):
+        k1, k2, k3 = self.keys
+        return k1._decrypt_int(k2._encrypt_int(k3._decrypt_int(block)))
+
+    def _encrypt_array(self, blocks):
+        k1, k2, k3 = self.keys
+        return k3._encrypt_array(k2._decrypt_array(k1._encrypt_array(blocks)))
+
+    def _decrypt_array(self, blocks):
+        k1, k2, k3 = self.keys
+        return k1._decrypt_array(k2._encrypt_array(k3._decrypt_array(blocks)))
+
+
+if __name__ == "__main__":
+    s = input("Enter a string : ")
+    key = s.encode()[:8].ljust(8, b"\0")  # first 8 bytes of the string as the DES key
+    keys = key_schedule(int.from_bytes(key, "big"))
+    for i in range(0,len(keys)):
+        print("Key ",i+1," = ",format(keys[i], "048b"))
+
+    cipher = DES(key)
+    message = b"Data Encryption Standard"
+    encrypted = cipher.encrypt_ecb(message)
+    print("Encrypted : ", encrypted.hex())
+    print("Decrypted : ", cipher.decrypt_ecb(encrypted).decode())
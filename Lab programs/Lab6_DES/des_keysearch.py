@@ -0,0 +1,213 @@
+"""
+Bitsliced DES for known-plaintext key search over a reduced keyspace.
+
+Each DES bit is a NumPy uint64 array in which every bit lane holds a
+different candidate key, so one pass evaluates 64 * LANE_WORDS keys.
+- The key schedule is pure wiring: every round-key bit is one key bit.
+- S-boxes are boolean circuits generated from the S-box truth tables
+  (des_sbox_circuits.py, written by gen_sbox_circuits.py).
+- The known plaintext's IP is a constant, and the target ciphertext is
+  compared before FP, so neither permutation is evaluated per pass.
+
+A search fixes the known key bits and enumerates the unknown ones
+(for example 24-32 bits); search_keyspace splits that range over a
+process pool, reports progress and stops at the first match.
+"""
+import multiprocessing
+import time
+
+import numpy as np
+
+from des import DES, E, IP, P, key_schedule, permute
+from des_sbox_circuits import SBOX_CIRCUITS
+
+LANE_WORDS = 4096  # uint64 words per bit array: 262144 keys per pass
+PASSES_PER_TASK = 4  # passes handed to a worker at a time
+ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def _round_key_sources():
+    """
+    ROUND_KEY_SOURCES[r][j] is the key bit (0 = MSB) that becomes bit j of round key r.
+    """
+    sources = [[None] * 48 for _ in range(16)]
+    for p in range(64):
+        for r, k in enumerate(key_schedule(1 << (63 - p))):
+            for j in range(48):
+                if (k >> (47 - j)) & 1:
+                    sources[r][j] = p
+    return sources
+
+
+ROUND_KEY_SOURCES = _round_key_sources()
+
+
+def _bits(value, nbits):
+    return [(value >> (nbits - 1 - i)) & 1 for i in range(nbits)]
+
+
+def _lane_patterns(start, unknown_bits, words):
+    """
+    Bit arrays for the unknown key bits over candidate indices start .. start+64*words-1.
+    Lane j of word w holds candidate index start + 64*w + j.
+    """
+    index = start + np.arange(64 * words, dtype=np.uint64)
+    patterns = {}
+    for m, position in enumerate(unknown_bits):
+        lanes = ((index >> np.uint64(m)) & np.uint64(1)).astype(np.uint8).reshape(words, 64)
+        patterns[position] = np.packbits(lanes, axis=1, bitorder="little").view("<u8").reshape(words).astype(np.uint64)
+    return patterns
+
+
+class BitslicedSearch:
+    """
+    Known-plaintext search over keys that share all bits except `unknown_bits`.
+    - plaintext, ciphertext: one known 8-byte block pair.
+    - base_key: 8-byte key holding the known bits (unknown positions are ignored).
+    - unknown_bits: key bit positions (0 = MSB of the 64-bit key) to enumerate;
+      parity bits (positions 7, 15, ..., 63) are not used by DES.
+    """
+
+    def __init__(self, plaintext, ciphertext, base_key, unknown_bits, words=LANE_WORDS):
+        self.plaintext = bytes(plaintext)
+        self.ciphertext = bytes(ciphertext)
+        self.base_key = int.from_bytes(base_key, "big")
+        self.unknown_bits = list(unknown_bits)
+        self.words = words
+        self.keyspace = 1 << len(self.unknown_bits)
+        zero, ones = np.zeros(words, dtype=np.uint64), np.full(words, ONES)
+        self.zero, self.ones = zero, ones
+        block = permute(int.from_bytes(plaintext, "big"), IP, 64)
+        self.initial = [ones if b else zero for b in _bits(block, 64)]
+        self.target = _bits(permute(int.from_bytes(ciphertext, "big"), IP, 64), 64)  # FP^-1 = IP
+        self.known_key = {p: (ones if (self.base_key >> (63 - p)) & 1 else zero)
+                          for p in range(64) if p not in self.unknown_bits}
+
+    def candidate_key(self, index):
+        """
+        The 8-byte key for a candidate index.
+        """
+        key = self.base_key
+        for m, position in enumerate(self.unknown_bits):
+            mask = 1 << (63 - position)
+            key = (key | mask) if (index >> m) & 1 else (key & ~mask)
+        return key.to_bytes(8, "big")
+
+    def run_pass(self, start):
+        """
+        Tests the 64 * words candidates starting at index `start`.
+        Returns the list of matching candidate indices (normally empty).
+        """
+        key = dict(self.known_key)
+        key.update(_lane_patterns(start, self.unknown_bits, self.words))
+        left, right = self.initial[:32], self.initial[32:]
+        zero, ones = self.zero, self.ones
+        for r in range(16):
+            sources = ROUND_KEY_SOURCES[r]
+            sbox_out = []
+            for i, circuit in enumerate(SBOX_CIRCUITS):
+                inputs = [right[E[6 * i + t] - 1] ^ key[sources[6 * i + t]] for t in range(6)]
+                sbox_out.extend(circuit(*inputs, ones, zero))
+            left, right = right, [left[j] ^ sbox_out[P[j] - 1] for j in range(32)]
+        match = ones
+        for value, bit in zip(right + left, self.target):
+            match = match & (value if bit else ~value)
+            if not match.any():
+                return []
+        lanes = np.unpackbits(match.astype("<u8").view(np.uint8), bitorder="little")
+        found = []
+        for lane in np.flatnonzero(lanes).tolist():
+            index = start + lane
+            if index < self.keyspace and DES(self.candidate_key(index)).encrypt_block(self.plaintext) == self.ciphertext:
+                found.append(index)
+        return found
+
+    def run_range(self, start, stop):
+        """
+        Tests candidate indices start .. stop-1 (start aligned to a pass).
+        Returns (matching indices, keys tested).
+        """
+        found, step = [], 64 * self.words
+        for offset in range(start, stop, step):
+            found.extend(self.run_pass(offset))
+            if found:
+                return found, offset + step - start
+        return found, stop - start
+
+
+_worker_search = None
+
+
+def _init_worker(args):
+    global _worker_search
+    _worker_search = BitslicedSearch(*args)
+
+
+def _search_task(bounds):
+    found, tested = _worker_search.run_range(*bounds)
+    return found, tested
+
+
+def search_keyspace(plaintext, ciphertext, base_key, unknown_bits, workers=None,
+                    words=LANE_WORDS, progress=None):
+    """
+    Searches every assignment of unknown_bits for the key that maps
+    plaintext to ciphertext, spread over a process pool.
+    - progress(tested, total, keys_per_sec) is called as tasks finish.
+    - The search stops at the first verified match.
+    Returns (key bytes or None, keys tested, seconds).
+    """
+    args = (plaintext, ciphertext, base_key, list(unknown_bits), words)
+    search = BitslicedSearch(*args)
+    step = 64 * words * PASSES_PER_TASK
+    tasks = [(start, min(start + step, search.keyspace)) for start in range(0, search.keyspace, step)]
+    tested, started = 0, time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(args,)) as pool:
+        for found, count in pool.imap_unordered(_search_task, tasks):
+            tested += count
+            elapsed = time.perf_counter() - started
+            if progress:
+                progress(tested, search.keyspace, tested / elapsed if elapsed else 0.0)
+            if found:
+                pool.terminate()
+                return search.candidate_key(found[0]), tested, elapsed
+    return None, tested, time.perf_counter() - started
+
+
+def benchmark(workers=None, passes=8, words=LANE_WORDS):
+    """
+    Measures bitsliced keys/sec on one core and across `workers` processes.
+    Returns (single-core keys/sec, pooled keys/sec, workers used).
+    """
+    workers = workers or multiprocessing.cpu_count()
+    key = bytes.fromhex("133457799BBCDFF1")
+    plaintext = bytes.fromhex("0123456789ABCDEF")
+    ciphertext = DES(key).encrypt_block(plaintext)
+    unknown = [p for p in range(64) if p % 8 != 7][:32]
+    search = BitslicedSearch(plaintext, ciphertext, key, unknown, words)
+    start = time.perf_counter()
+    search.run_range(1 << 31, (1 << 31) + passes * 64 * words)
+    single = passes * 64 * words / (time.perf_counter() - start)
+
+    per_task = 64 * words * PASSES_PER_TASK
+    tasks = [((1 << 31) + i * per_task, (1 << 31) + (i + 1) * per_task) for i in range(workers * 2)]
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=((plaintext, ciphertext, key, unknown, words),)) as pool:
+        tested = sum(count for _, count in pool.imap_unordered(_search_task, tasks))
+    pooled = tested / (time.perf_counter() - start)
+    return single, pooled, workers
+
+
+if __name__ == "__main__":
+    key = bytes.fromhex("133457799BBCDFF1")
+    plaintext = b"KNOWNPT!"
+    ciphertext = DES(key).encrypt_block(plaintext)
+    unknown = [p for p in range(64) if p % 8 != 7][-24:]  # 24 unknown key bits
+    mask = sum(1 << (63 - p) for p in unknown)
+    base_key = (int.from_bytes(key, "big") & ~mask).to_bytes(8, "big")  # known bits only
+    print(f"Searching 2^{len(unknown)} keys ...")
+    found, tested, seconds = search_keyspace(
+        plaintext, ciphertext, base_key, unknown,
+        progress=lambda done, total, rate: print(f"  {done}/{total} keys, {rate:,.0f} keys/sec"))
+    print(f"Recovered key: {found.hex() if found else None} after {tested} keys in {seconds:.2f}s")
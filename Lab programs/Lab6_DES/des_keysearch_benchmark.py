@@ -0,0 +1,20 @@
+"""
+Bitsliced DES key-search benchmark (keys/sec per core).
+
+    python des_keysearch_benchmark.py [workers] [passes]
+"""
+import sys
+
+from des_keysearch import LANE_WORDS, benchmark
+
+
+def main(workers=None, passes=8):
+    single, pooled, workers = benchmark(workers, passes)
+    print(f"Keys per pass          : {64 * LANE_WORDS}")
+    print(f"Single core            : {single:14,.0f} keys/sec")
+    print(f"{workers} workers{'':<14}: {pooled:14,.0f} keys/sec")
+    print(f"Per core ({workers} workers){'':<3}: {pooled / workers:14,.0f} keys/sec")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
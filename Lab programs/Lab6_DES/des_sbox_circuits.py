@@ -0,0 +1,582 @@
+"""
+Bitsliced DES S-boxes as straight-line boolean circuits.
+
+Generated by gen_sbox_circuits.py from the truth tables in des.py; do not
+edit by hand. sbox<i>(x0, ..., x5, ONES, ZERO) takes the six input bits of
+S-box i (x0 first) as bit arrays and returns its four output bits, most
+significant first. ONES and ZERO are the all-ones and all-zero arrays.
+"""
+
+
+def sbox0(x0, x1, x2, x3, x4, x5, ONES, ZERO):
+    t0 = ~x5
+    t1 = t0 ^ ((t0 ^ x5) & x4)
+    t2 = t0 & ~x4
+    t3 = x5 ^ ((x5 ^ t0) & x4)
+    t4 = t0 | ~x4
+    t5 = x5 | x4
+    t6 = x5 & x4
+    t7 = t0 & x4
+    t8 = t0 | x4
+    t9 = t1 ^ ((t1 ^ t2) & x3)
+    t10 = t3 ^ ((t3 ^ t4) & x3)
+    t11 = t3 ^ ((t3 ^ t5) & x3)
+    t12 = t3 ^ ((t3 ^ t6) & x3)
+    t13 = x5 ^ ((x5 ^ t4) & x3)
+    t14 = t1 ^ ((t1 ^ t7) & x3)
+    t15 = t8 ^ ((t8 ^ t1) & x3)
+    t16 = t9 ^ ((t9 ^ t10) & x2)
+    t17 = t11 ^ ((t11 ^ t12) & x2)
+    t18 = t13 ^ ((t13 ^ t14) & x2)
+    t19 = t15 ^ ((t15 ^ t12) & x2)
+    t20 = t16 ^ ((t16 ^ t17) & x1)
+    t21 = t18 ^ ((t18 ^ t19) & x1)
+    t22 = t20 ^ ((t20 ^ t21) & x0)
+    t23 = x5 | ~x4
+    t24 = x5 & ~x4
+    t25 = t8 ^ ((t8 ^ t23) & x3)
+    t26 = t3 ^ ((t3 ^ t24) & x3)
+    t27 = t6 ^ ((t6 ^ t4) & x3)
+    t28 = t23 ^ ((t23 ^ t2) & x3)
+    t29 = t4 ^ ((t4 ^ t6) & x3)
+    t30 = t4 ^ ((t4 ^ x4) & x3)
+    t31 = t23 & x3
+    t32 = t25 ^ ((t25 ^ t26) & x2)
+    t33 = t27 ^ ((t27 ^ t14) & x2)
+    t34 = t28 ^ ((t28 ^ t29) & x2)
+    t35 = t30 ^ ((t30 ^ t31) & x2)
+    t36 = t32 ^ ((t32 ^ t33) & x1)
+    t37 = t34 ^ ((t34 ^ t35) & x1)
+    t38 = t36 ^ ((t36 ^ t37) & x0)
+    t39 = t1 ^ ((t1 ^ t24) & x3)
+    t40 = t2 | ~x3
+    t41 = t1 | ~x3
+    t42 = t3 & x3
+    t43 = t24 ^ ((t24 ^ t1) & x3)
+    t44 = t7 ^ ((t7 ^ t8) & x3)
+    t45 = t1 ^ ((t1 ^ t5) & x3)
+    t46 = t4 ^ ((t4 ^ t24) & x3)
+    t47 = t39 ^ ((t39 ^ t40) & x2)
+    t48 = t41 ^ ((t41 ^ t42) & x2)
+    t49 = t43 ^ ((t43 ^ t44) & x2)
+    t50 = t45 ^ ((t45 ^ t46) & x2)
+    t51 = t47 ^ ((t47 ^ t48) & x1)
+    t52 = t49 ^ ((t49 ^ t50) & x1)
+    t53 = t51 ^ ((t51 ^ t52) & x0)
+    t54 = t7 ^ ((t7 ^ t23) & x3)
+    t55 = t2 ^ ((t2 ^ t6) & x3)
+    t56 = t3 | ~x3
+    t57 = t3 & ~x3
+    t58 = t23 ^ ((t23 ^ t4) & x3)
+    t59 = t2 ^ ((t2 ^ t1) & x3)
+    t60 = t27 ^ ((t27 ^ t54) & x2)
+    t61 = t55 ^ ((t55 ^ t56) & x2)
+    t62 = t57 ^ ((t57 ^ t45) & x2)
+    t63 = t58 ^ ((t58 ^ t59) & x2)
+    t64 = t60 ^ ((t60 ^ t61) & x1)
+    t65 = t62 ^ ((t62 ^ t63) & x1)
+    t66 = t64 ^ ((t64 ^ t65) & x0)
+    return t22, t38, t53, t66
+
+
+def sbox1(x0, x1, x2, x3, x4, x5, ONES, ZERO):
+    t0 = ~x5
+    t1 = t0 ^ ((t0 ^ x5) & x4)
+    t2 = x5 ^ ((x5 ^ t0) & x4)
+    t3 = ~x4
+    t4 = x5 | x4
+    t5 = t0 & ~x4
+    t6 = t1 ^ ((t1 ^ t0) & x3)
+    t7 = t2 ^ ((t2 ^ x5) & x3)
+    t8 = t3 ^ ((t3 ^ x4) & x3)
+    t9 = t1 ^ ((t1 ^ t2) & x3)
+    t10 = t4 ^ ((t4 ^ t2) & x3)
+    t11 = t1 ^ ((t1 ^ t5) & x3)
+    t12 = t2 ^ ((t2 ^ t1) & x3)
+    t13 = t5 ^ ((t5 ^ t4) & x3)
+    t14 = t6 ^ ((t6 ^ t7) & x2)
+    t15 = t8 ^ ((t8 ^ t9) & x2)
+    t16 = t10 ^ ((t10 ^ t11) & x2)
+    t17 = t12 ^ ((t12 ^ t13) & x2)
+    t18 = t14 ^ ((t14 ^ t15) & x1)
+    t19 = t16 ^ ((t16 ^ t17) & x1)
+    t20 = t18 ^ ((t18 ^ t19) & x0)
+    t21 = t0 & x4
+    t22 = x5 & x4
+    t23 = t1 ^ ((t1 ^ t4) & x3)
+    t24 = t2 ^ ((t2 ^ t21) & x3)
+    t25 = t3 ^ ((t3 ^ t1) & x3)
+    t26 = t2 ^ ((t2 ^ t5) & x3)
+    t27 = x4 ^ ((x4 ^ t3) & x3)
+    t28 = t1 | x3
+    t29 = t22 ^ ((t22 ^ t2) & x3)
+    t30 = t23 ^ ((t23 ^ t8) & x2)
+    t31 = t24 ^ ((t24 ^ t25) & x2)
+    t32 = t26 ^ ((t26 ^ t27) & x2)
+    t33 = t28 ^ ((t28 ^ t29) & x2)
+    t34 = t30 ^ ((t30 ^ t31) & x1)
+    t35 = t32 ^ ((t32 ^ t33) & x1)
+    t36 = t34 ^ ((t34 ^ t35) & x0)
+    t37 = x5 & ~x4
+    t38 = t0 | ~x4
+    t39 = x5 | ~x4
+    t40 = t1 | ~x3
+    t41 = t21 ^ ((t21 ^ t1) & x3)
+    t42 = t37 ^ ((t37 ^ t2) & x3)
+    t43 = t21 ^ ((t21 ^ t38) & x3)
+    t44 = t39 ^ ((t39 ^ t22) & x3)
+    t45 = x5 ^ ((x5 ^ t2) & x3)
+    t46 = t8 ^ ((t8 ^ t40) & x2)
+    t47 = t41 ^ ((t41 ^ t42) & x2)
+    t48 = t43 ^ ((t43 ^ t44) & x2)
+    t49 = t45 ^ ((t45 ^ t43) & x2)
+    t50 = t46 ^ ((t46 ^ t47) & x1)
+    t51 = t48 ^ ((t48 ^ t49) & x1)
+    t52 = t50 ^ ((t50 ^ t51) & x0)
+    t53 = t0 | x4
+    t54 = t22 | ~x3
+    t55 = t0 ^ ((t0 ^ t2) & x3)
+    t56 = t22 ^ ((t22 ^ t39) & x3)
+    t57 = t37 ^ ((t37 ^ t53) & x3)
+    t58 = x5 ^ ((x5 ^ t0) & x3)
+    t59 = t3 ^ ((t3 ^ t37) & x3)
+    t60 = t53 ^ ((t53 ^ x4) & x3)
+    t61 = t54 ^ ((t54 ^ t26) & x2)
+    t62 = t55 ^ ((t55 ^ t56) & x2)
+    t63 = t57 ^ ((t57 ^ t58) & x2)
+    t64 = t59 ^ ((t59 ^ t60) & x2)
+    t65 = t61 ^ ((t61 ^ t62) & x1)
+    t66 = t63 ^ ((t63 ^ t64) & x1)
+    t67 = t65 ^ ((t65 ^ t66) & x0)
+    return t20, t36, t52, t67
+
+
+def sbox2(x0, x1, x2, x3, x4, x5, ONES, ZERO):
+    t0 = ~x5
+    t1 = ~x4
+    t2 = t0 | x4
+    t3 = t0 ^ ((t0 ^ x5) & x4)
+    t4 = x5 | ~x4
+    t5 = x5 ^ ((x5 ^ t0) & x4)
+    t6 = x5 & ~x4
+    t7 = t1 ^ ((t1 ^ t2) & x3)
+    t8 = t3 & x3
+    t9 = x4 ^ ((x4 ^ t3) & x3)
+    t10 = t4 ^ ((t4 ^ t5) & x3)
+    t11 = t3 ^ ((t3 ^ t5) & x3)
+    t12 = t2 ^ ((t2 ^ t6) & x3)
+    t13 = t5 ^ ((t5 ^ t3) & x3)
+    t14 = t7 ^ ((t7 ^ t8) & x2)
+    t15 = t9 ^ ((t9 ^ t10) & x2)
+    t16 = t11 ^ ((t11 ^ t12) & x2)
+    t17 = t11 ^ ((t11 ^ t13) & x2)
+    t18 = t14 ^ ((t14 ^ t15) & x1)
+    t19 = t16 ^ ((t16 ^ t17) & x1)
+    t20 = t18 ^ ((t18 ^ t19) & x0)
+    t21 = t0 & x4
+    t22 = t0 | ~x4
+    t23 = x5 & x4
+    t24 = x5 ^ ((x5 ^ t21) & x3)
+    t25 = t3 ^ ((t3 ^ t22) & x3)
+    t26 = t21 | x3
+    t27 = t5 ^ ((t5 ^ t6) & x3)
+    t28 = t0 ^ ((t0 ^ t1) & x3)
+    t29 = t5 ^ ((t5 ^ t23) & x3)
+    t30 = x5 ^ ((x5 ^ t5) & x3)
+    t31 = t3 ^ ((t3 ^ t2) & x3)
+    t32 = t24 ^ ((t24 ^ t25) & x2)
+    t33 = t26 ^ ((t26 ^ t27) & x2)
+    t34 = t28 ^ ((t28 ^ t29) & x2)
+    t35 = t30 ^ ((t30 ^ t31) & x2)
+    t36 = t32 ^ ((t32 ^ t33) & x1)
+    t37 = t34 ^ ((t34 ^ t35) & x1)
+    t38 = t36 ^ ((t36 ^ t37) & x0)
+    t39 = t3 ^ ((t3 ^ t21) & x3)
+    t40 = t22 ^ ((t22 ^ t4) & x3)
+    t41 = t6 ^ ((t6 ^ x4) & x3)
+    t42 = t3 ^ ((t3 ^ t1) & x3)
+    t43 = x4 & ~x3
+    t44 = t3 ^ ((t3 ^ t4) & x3)
+    t45 = t5 ^ ((t5 ^ t22) & x3)
+    t46 = t39 ^ ((t39 ^ t40) & x2)
+    t47 = t41 ^ ((t41 ^ t42) & x2)
+    t48 = t43 ^ ((t43 ^ t13) & x2)
+    t49 = t44 ^ ((t44 ^ t45) & x2)
+    t50 = t46 ^ ((t46 ^ t47) & x1)
+    t51 = t48 ^ ((t48 ^ t49) & x1)
+    t52 = t50 ^ ((t50 ^ t51) & x0)
+    t53 = x5 ^ ((x5 ^ t3) & x3)
+    t54 = t5 ^ ((t5 ^ t0) & x3)
+    t55 = t0 ^ ((t0 ^ t5) & x3)
+    t56 = t3 ^ ((t3 ^ x5) & x3)
+    t57 = t1 ^ ((t1 ^ t5) & x3)
+    t58 = t2 ^ ((t2 ^ t23) & x3)
+    t59 = t4 ^ ((t4 ^ t21) & x3)
+    t60 = t53 ^ ((t53 ^ t54) & x2)
+    t61 = t55 ^ ((t55 ^ t56) & x2)
+    t62 = t57 ^ ((t57 ^ t9) & x2)
+    t63 = t58 ^ ((t58 ^ t59) & x2)
+    t64 = t60 ^ ((t60 ^ t61) & x1)
+    t65 = t62 ^ ((t62 ^ t63) & x1)
+    t66 = t64 ^ ((t64 ^ t65) & x0)
+    return t20, t38, t52, t66
+
+
+def sbox3(x0, x1, x2, x3, x4, x5, ONES, ZERO):
+    t0 = ~x5
+    t1 = x5 | x4
+    t2 = ~x4
+    t3 = x5 & x4
+    t4 = t0 ^ ((t0 ^ x5) & x4)
+    t5 = t0 | x4
+    t6 = t0 & ~x4
+    t7 = t0 | ~x4
+    t8 = x5 & ~x4
+    t9 = t1 ^ ((t1 ^ t2) & x3)
+    t10 = t3 ^ ((t3 ^ t0) & x3)
+    t11 = t4 & x3
+    t12 = t5 ^ ((t5 ^ t1) & x3)
+    t13 = t4 ^ ((t4 ^ t6) & x3)
+    t14 = t7 ^ ((t7 ^ t1) & x3)
+    t15 = t2 ^ ((t2 ^ x4) & x3)
+    t16 = t8 ^ ((t8 ^ t4) & x3)
+    t17 = t9 ^ ((t9 ^ t10) & x2)
+    t18 = t11 ^ ((t11 ^ t12) & x2)
+    t19 = t13 ^ ((t13 ^ t14) & x2)
+    t20 = t15 ^ ((t15 ^ t16) & x2)
+    t21 = t17 ^ ((t17 ^ t18) & x1)
+    t22 = t19 ^ ((t19 ^ t20) & x1)
+    t23 = t21 ^ ((t21 ^ t22) & x0)
+    t24 = t0 & x4
+    t25 = x5 ^ ((x5 ^ t0) & x4)
+    t26 = x5 | ~x4
+    t27 = t7 ^ ((t7 ^ t4) & x3)
+    t28 = t1 & ~x3
+    t29 = x5 ^ ((x5 ^ x4) & x3)
+    t30 = t24 ^ ((t24 ^ t7) & x3)
+    t31 = x4 ^ ((x4 ^ t3) & x3)
+    t32 = t6 ^ ((t6 ^ t7) & x3)
+    t33 = t4 ^ ((t4 ^ t25) & x3)
+    t34 = t26 ^ ((t26 ^ x4) & x3)
+    t35 = t27 ^ ((t27 ^ t28) & x2)
+    t36 = t29 ^ ((t29 ^ t30) & x2)
+    t37 = t31 ^ ((t31 ^ t32) & x2)
+    t38 = t33 ^ ((t33 ^ t34) & x2)
+    t39 = t35 ^ ((t35 ^ t36) & x1)
+    t40 = t37 ^ ((t37 ^ t38) & x1)
+    t41 = t39 ^ ((t39 ^ t40) & x0)
+    t42 = t1 ^ ((t1 ^ x4) & x3)
+    t43 = x4 ^ ((x4 ^ t8) & x3)
+    t44 = t3 | ~x3
+    t45 = t25 ^ ((t25 ^ t6) & x3)
+    t46 = t6 ^ ((t6 ^ t5) & x3)
+    t47 = x4 ^ ((x4 ^ x5) & x3)
+    t48 = t32 ^ ((t32 ^ t42) & x2)
+    t49 = t43 ^ ((t43 ^ t33) & x2)
+    t50 = t44 ^ ((t44 ^ t45) & x2)
+    t51 = t46 ^ ((t46 ^ t47) & x2)
+    t52 = t48 ^ ((t48 ^ t49) & x1)
+    t53 = t50 ^ ((t50 ^ t51) & x1)
+    t54 = t52 ^ ((t52 ^ t53) & x0)
+    t55 = t3 ^ ((t3 ^ t4) & x3)
+    t56 = t4 ^ ((t4 ^ t24) & x3)
+    t57 = x5 ^ ((x5 ^ t6) & x3)
+    t58 = x4 ^ ((x4 ^ t7) & x3)
+    t59 = t7 ^ ((t7 ^ t26) & x3)
+    t60 = t4 & ~x3
+    t61 = t14 ^ ((t14 ^ t55) & x2)
+    t62 = t56 ^ ((t56 ^ t15) & x2)
+    t63 = t57 ^ ((t57 ^ t58) & x2)
+    t64 = t59 ^ ((t59 ^ t60) & x2)
+    t65 = t61 ^ ((t61 ^ t62) & x1)
+    t66 = t63 ^ ((t63 ^ t64) & x1)
+    t67 = t65 ^ ((t65 ^ t66) & x0)
+    return t23, t41, t54, t67
+
+
+def sbox4(x0, x1, x2, x3, x4, x5, ONES, ZERO):
+    t0 = ~x5
+    t1 = x5 | x4
+    t2 = x5 & x4
+    t3 = t0 & x4
+    t4 = ~x4
+    t5 = t0 & ~x4
+    t6 = t0 ^ ((t0 ^ x5) & x4)
+    t7 = t0 | ~x4
+    t8 = x5 ^ ((x5 ^ t0) & x4)
+    t9 = t0 | x4
+    t10 = x5 & ~x4
+    t11 = t1 ^ ((t1 ^ t2) & x3)
+    t12 = t3 ^ ((t3 ^ t4) & x3)
+    t13 = t5 ^ ((t5 ^ t1) & x3)
+    t14 = t6 ^ ((t6 ^ t7) & x3)
+    t15 = x5 ^ ((x5 ^ t8) & x3)
+    t16 = t9 ^ ((t9 ^ x4) & x3)
+    t17 = t9 ^ ((t9 ^ t6) & x3)
+    t18 = t10 ^ ((t10 ^ t3) & x3)
+    t19 = t11 ^ ((t11 ^ t12) & x2)
+    t20 = t13 ^ ((t13 ^ t14) & x2)
+    t21 = t15 ^ ((t15 ^ t16) & x2)
+    t22 = t17 ^ ((t17 ^ t18) & x2)
+    t23 = t19 ^ ((t19 ^ t20) & x1)
+    t24 = t21 ^ ((t21 ^ t22) & x1)
+    t25 = t23 ^ ((t23 ^ t24) & x0)
+    t26 = x5 | ~x4
+    t27 = t8 ^ ((t8 ^ t6) & x3)
+    t28 = t26 ^ ((t26 ^ t8) & x3)
+    t29 = t5 ^ ((t5 ^ t6) & x3)
+    t30 = t5 ^ ((t5 ^ x5) & x3)
+    t31 = x4 ^ ((x4 ^ t6) & x3)
+    t32 = t26 ^ ((t26 ^ t0) & x3)
+    t33 = t6 ^ ((t6 ^ t8) & x3)
+    t34 = t27 ^ ((t27 ^ t28) & x2)
+    t35 = t8 ^ ((t8 ^ t29) & x2)
+    t36 = t30 ^ ((t30 ^ t31) & x2)
+    t37 = t32 ^ ((t32 ^ t33) & x2)
+    t38 = t34 ^ ((t34 ^ t35) & x1)
+    t39 = t36 ^ ((t36 ^ t37) & x1)
+    t40 = t38 ^ ((t38 ^ t39) & x0)
+    t41 = t26 ^ ((t26 ^ t10) & x3)
+    t42 = t9 ^ ((t9 ^ t0) & x3)
+    t43 = t10 ^ ((t10 ^ t6) & x3)
+    t44 = t8 ^ ((t8 ^ x4) & x3)
+    t45 = t6 ^ ((t6 ^ t4) & x3)
+    t46 = t26 & ~x3
+    t47 = t7 ^ ((t7 ^ x4) & x3)
+    t48 = t41 ^ ((t41 ^ t42) & x2)
+    t49 = x3 ^ ((x3 ^ t43) & x2)
+    t50 = t44 ^ ((t44 ^ t45) & x2)
+    t51 = t46 ^ ((t46 ^ t47) & x2)
+    t52 = t48 ^ ((t48 ^ t49) & x1)
+    t53 = t50 ^ ((t50 ^ t51) & x1)
+    t54 = t52 ^ ((t52 ^ t53) & x0)
+    t55 = t2 ^ ((t2 ^ t3) & x3)
+    t56 = t6 ^ ((t6 ^ t26) & x3)
+    t57 = t8 ^ ((t8 ^ t7) & x3)
+    t58 = t26 ^ ((t26 ^ t3) & x3)
+    t59 = t10 ^ ((t10 ^ t9) & x3)
+    t60 = t3 ^ ((t3 ^ x5) & x3)
+    t61 = t55 ^ ((t55 ^ t56) & x2)
+    t62 = t57 ^ ((t57 ^ t58) & x2)
+    t63 = t59 ^ ((t59 ^ t27) & x2)
+    t64 = t16 ^ ((t16 ^ t60) & x2)
+    t65 = t61 ^ ((t61 ^ t62) & x1)
+    t66 = t63 ^ ((t63 ^ t64) & x1)
+    t67 = t65 ^ ((t65 ^ t66) & x0)
+    return t25, t40, t54, t67
+
+
+def sbox5(x0, x1, x2, x3, x4, x5, ONES, ZERO):
+    t0 = ~x5
+    t1 = x5 | ~x4
+    t2 = t0 ^ ((t0 ^ x5) & x4)
+    t3 = x5 ^ ((x5 ^ t0) & x4)
+    t4 = t0 & x4
+    t5 = t1 ^ ((t1 ^ t0) & x3)
+    t6 = t2 ^ ((t2 ^ t3) & x3)
+    t7 = t4 ^ ((t4 ^ x5) & x3)
+    t8 = t2 ^ ((t2 ^ x4) & x3)
+    t9 = t0 ^ ((t0 ^ t2) & x3)
+    t10 = t3 ^ ((t3 ^ t1) & x3)
+    t11 = x5 ^ ((x5 ^ t4) & x3)
+    t12 = t4 ^ ((t4 ^ t1) & x3)
+    t13 = t5 ^ ((t5 ^ t6) & x2)
+    t14 = t7 ^ ((t7 ^ t8) & x2)
+    t15 = t9 ^ ((t9 ^ t10) & x2)
+    t16 = t11 ^ ((t11 ^ t12) & x2)
+    t17 = t13 ^ ((t13 ^ t14) & x1)
+    t18 = t15 ^ ((t15 ^ t16) & x1)
+    t19 = t17 ^ ((t17 ^ t18) & x0)
+    t20 = x5 | x4
+    t21 = t0 & ~x4
+    t22 = t0 | x4
+    t23 = x5 & x4
+    t24 = ~x4
+    t25 = x5 ^ ((x5 ^ t2) & x3)
+    t26 = t3 ^ ((t3 ^ t20) & x3)
+    t27 = t0 ^ ((t0 ^ t21) & x3)
+    t28 = t3 ^ ((t3 ^ t22) & x3)
+    t29 = t23 ^ ((t23 ^ t24) & x3)
+    t30 = t3 ^ ((t3 ^ x4) & x3)
+    t31 = t6 ^ ((t6 ^ t25) & x2)
+    t32 = t26 ^ ((t26 ^ t27) & x2)
+    t33 = t28 ^ ((t28 ^ t29) & x2)
+    t34 = t2 ^ ((t2 ^ t30) & x2)
+    t35 = t31 ^ ((t31 ^ t32) & x1)
+    t36 = t33 ^ ((t33 ^ t34) & x1)
+    t37 = t35 ^ ((t35 ^ t36) & x0)
+    t38 = x5 & ~x4
+    t39 = x5 ^ ((x5 ^ t22) & x3)
+    t40 = t3 ^ ((t3 ^ t21) & x3)
+    t41 = t38 ^ ((t38 ^ t2) & x3)
+    t42 = t22 ^ ((t22 ^ t3) & x3)
+    t43 = x4 ^ ((x4 ^ t24) & x3)
+    t44 = t21 ^ ((t21 ^ t20) & x3)
+    t45 = t1 ^ ((t1 ^ x4) & x3)
+    t46 = t38 ^ ((t38 ^ t0) & x3)
+    t47 = t39 ^ ((t39 ^ t40) & x2)
+    t48 = t41 ^ ((t41 ^ t42) & x2)
+    t49 = t43 ^ ((t43 ^ t44) & x2)
+    t50 = t45 ^ ((t45 ^ t46) & x2)
+    t51 = t47 ^ ((t47 ^ t48) & x1)
+    t52 = t49 ^ ((t49 ^ t50) & x1)
+    t53 = t51 ^ ((t51 ^ t52) & x0)
+    t54 = t0 | ~x4
+    t55 = x4 ^ ((x4 ^ t4) & x3)
+    t56 = t24 ^ ((t24 ^ x5) & x3)
+    t57 = x4 ^ ((x4 ^ t54) & x3)
+    t58 = t2 ^ ((t2 ^ t0) & x3)
+    t59 = x5 ^ ((x5 ^ t3) & x3)
+    t60 = t55 ^ ((t55 ^ t56) & x2)
+    t61 = t43 ^ ((t43 ^ t57) & x2)
+    t62 = t58 ^ ((t58 ^ t59) & x2)
+    t63 = t56 ^ ((t56 ^ t9) & x2)
+    t64 = t60 ^ ((t60 ^ t61) & x1)
+    t65 = t62 ^ ((t62 ^ t63) & x1)
+    t66 = t64 ^ ((t64 ^ t65) & x0)
+    return t19, t37, t53, t66
+
+
+def sbox6(x0, x1, x2, x3, x4, x5, ONES, ZERO):
+    t0 = ~x5
+    t1 = x5 ^ ((x5 ^ t0) & x4)
+    t2 = t0 ^ ((t0 ^ x5) & x4)
+    t3 = t0 | x4
+    t4 = x5 & ~x4
+    t5 = x5 & x4
+    t6 = t0 & ~x4
+    t7 = t0 | ~x4
+    t8 = t2 ^ ((t2 ^ t3) & x3)
+    t9 = t1 ^ ((t1 ^ t2) & x3)
+    t10 = x4 ^ ((x4 ^ t4) & x3)
+    t11 = t5 | x3
+    t12 = t6 ^ ((t6 ^ t1) & x3)
+    t13 = t7 ^ ((t7 ^ x4) & x3)
+    t14 = t4 ^ ((t4 ^ t2) & x3)
+    t15 = t1 ^ ((t1 ^ t8) & x2)
+    t16 = t9 ^ ((t9 ^ t10) & x2)
+    t17 = t11 ^ ((t11 ^ t12) & x2)
+    t18 = t13 ^ ((t13 ^ t14) & x2)
+    t19 = t15 ^ ((t15 ^ t16) & x1)
+    t20 = t17 ^ ((t17 ^ t18) & x1)
+    t21 = t19 ^ ((t19 ^ t20) & x0)
+    t22 = ~x4
+    t23 = t0 & x4
+    t24 = x5 | x4
+    t25 = t22 ^ ((t22 ^ x4) & x3)
+    t26 = t22 ^ ((t22 ^ t23) & x3)
+    t27 = t1 ^ ((t1 ^ t24) & x3)
+    t28 = x4 ^ ((x4 ^ t2) & x3)
+    t29 = t1 ^ ((t1 ^ t5) & x3)
+    t30 = t25 ^ ((t25 ^ t26) & x2)
+    t31 = t27 ^ ((t27 ^ t2) & x2)
+    t32 = t28 ^ ((t28 ^ t29) & x2)
+    t33 = t30 ^ ((t30 ^ t31) & x1)
+    t34 = t15 ^ ((t15 ^ t32) & x1)
+    t35 = t33 ^ ((t33 ^ t34) & x0)
+    t36 = x5 | ~x4
+    t37 = t23 | x3
+    t38 = t6 ^ ((t6 ^ t5) & x3)
+    t39 = t36 ^ ((t36 ^ t23) & x3)
+    t40 = t24 ^ ((t24 ^ t2) & x3)
+    t41 = x5 ^ ((x5 ^ t6) & x3)
+    t42 = t0 ^ ((t0 ^ t2) & x3)
+    t43 = x5 ^ ((x5 ^ t1) & x3)
+    t44 = t37 ^ ((t37 ^ t38) & x2)
+    t45 = t39 ^ ((t39 ^ t40) & x2)
+    t46 = t41 ^ ((t41 ^ t37) & x2)
+    t47 = t42 ^ ((t42 ^ t43) & x2)
+    t48 = t44 ^ ((t44 ^ t45) & x1)
+    t49 = t46 ^ ((t46 ^ t47) & x1)
+    t50 = t48 ^ ((t48 ^ t49) & x0)
+    t51 = t1 ^ ((t1 ^ x5) & x3)
+    t52 = t2 ^ ((t2 ^ t1) & x3)
+    t53 = t2 ^ ((t2 ^ t7) & x3)
+    t54 = t2 ^ ((t2 ^ t23) & x3)
+    t55 = t24 ^ ((t24 ^ t5) & x3)
+    t56 = t23 ^ ((t23 ^ t22) & x3)
+    t57 = t51 ^ ((t51 ^ t52) & x2)
+    t58 = t53 ^ ((t53 ^ t54) & x2)
+    t59 = t53 ^ ((t53 ^ t9) & x2)
+    t60 = t55 ^ ((t55 ^ t56) & x2)
+    t61 = t57 ^ ((t57 ^ t58) & x1)
+    t62 = t59 ^ ((t59 ^ t60) & x1)
+    t63 = t61 ^ ((t61 ^ t62) & x0)
+    return t21, t35, t50, t63
+
+
+def sbox7(x0, x1, x2, x3, x4, x5, ONES, ZERO):
+    t0 = ~x5
+    t1 = t0 ^ ((t0 ^ x5) & x4)
+    t2 = x5 | ~x4
+    t3 = x5 ^ ((x5 ^ t0) & x4)
+    t4 = t0 & ~x4
+    t5 = t0 | ~x4
+    t6 = x5 & x4
+    t7 = ~x4
+    t8 = t0 & x4
+    t9 = x5 & ~x4
+    t10 = t0 | x4
+    t11 = t1 ^ ((t1 ^ t2) & x3)
+    t12 = t3 ^ ((t3 ^ t4) & x3)
+    t13 = t5 ^ ((t5 ^ x4) & x3)
+    t14 = t6 ^ ((t6 ^ t7) & x3)
+    t15 = t8 ^ ((t8 ^ t9) & x3)
+    t16 = t10 ^ ((t10 ^ t2) & x3)
+    t17 = x5 ^ ((x5 ^ t5) & x3)
+    t18 = t4 ^ ((t4 ^ x4) & x3)
+    t19 = t11 ^ ((t11 ^ t12) & x2)
+    t20 = t13 ^ ((t13 ^ t14) & x2)
+    t21 = t15 ^ ((t15 ^ t16) & x2)
+    t22 = t17 ^ ((t17 ^ t18) & x2)
+    t23 = t19 ^ ((t19 ^ t20) & x1)
+    t24 = t21 ^ ((t21 ^ t22) & x1)
+    t25 = t23 ^ ((t23 ^ t24) & x0)
+    t26 = x5 | x4
+    t27 = t1 ^ ((t1 ^ t3) & x3)
+    t28 = t0 ^ ((t0 ^ x5) & x3)
+    t29 = x5 ^ ((x5 ^ t3) & x3)
+    t30 = t1 ^ ((t1 ^ t0) & x3)
+    t31 = t4 ^ ((t4 ^ t2) & x3)
+    t32 = t3 ^ ((t3 ^ t1) & x3)
+    t33 = t26 ^ ((t26 ^ t8) & x3)
+    t34 = t1 ^ ((t1 ^ t7) & x3)
+    t35 = t27 ^ ((t27 ^ t28) & x2)
+    t36 = t29 ^ ((t29 ^ t30) & x2)
+    t37 = t31 ^ ((t31 ^ t32) & x2)
+    t38 = t33 ^ ((t33 ^ t34) & x2)
+    t39 = t35 ^ ((t35 ^ t36) & x1)
+    t40 = t37 ^ ((t37 ^ t38) & x1)
+    t41 = t39 ^ ((t39 ^ t40) & x0)
+    t42 = x4 & ~x3
+    t43 = t7 | ~x3
+    t44 = t4 | x3
+    t45 = t6 ^ ((t6 ^ x4) & x3)
+    t46 = t5 ^ ((t5 ^ x5) & x3)
+    t47 = t6 ^ ((t6 ^ t0) & x3)
+    t48 = t42 ^ ((t42 ^ t43) & x2)
+    t49 = t44 ^ ((t44 ^ t45) & x2)
+    t50 = t46 ^ ((t46 ^ t47) & x2)
+    t51 = t12 ^ ((t12 ^ t46) & x2)
+    t52 = t48 ^ ((t48 ^ t49) & x1)
+    t53 = t50 ^ ((t50 ^ t51) & x1)
+    t54 = t52 ^ ((t52 ^ t53) & x0)
+    t55 = t2 ^ ((t2 ^ t9) & x3)
+    t56 = x4 ^ ((x4 ^ t5) & x3)
+    t57 = x4 ^ ((x4 ^ t1) & x3)
+    t58 = t4 ^ ((t4 ^ t3) & x3)
+    t59 = t10 ^ ((t10 ^ x4) & x3)
+    t60 = t4 ^ ((t4 ^ t6) & x3)
+    t61 = t9 ^ ((t9 ^ t3) & x3)
+    t62 = t1 | ~x3
+    t63 = t55 ^ ((t55 ^ t56) & x2)
+    t64 = t57 ^ ((t57 ^ t58) & x2)
+    t65 = t59 ^ ((t59 ^ t60) & x2)
+    t66 = t61 ^ ((t61 ^ t62) & x2)
+    t67 = t63 ^ ((t63 ^ t64) & x1)
+    t68 = t65 ^ ((t65 ^ t66) & x1)
+    t69 = t67 ^ ((t67 ^ t68) & x0)
+    return t25, t41, t54, t69
+
+
+SBOX_CIRCUITS = [sbox0, sbox1, sbox2, sbox3, sbox4, sbox5, sbox6, sbox7]
@@ -0,0 +1,104 @@
+"""
+Generates des_sbox_circuits.py, the bitsliced S-box circuits used by
+des_keysearch.py, from the S-box truth tables in des.py.
+
+    python gen_sbox_circuits.py          # rewrite des_sbox_circuits.py
+    python gen_sbox_circuits.py --check  # verify the checked-in file is current and correct
+
+Each output bit is a multiplexer tree over the six inputs; constant leaves
+are folded and repeated sub-circuits are shared.
+"""
+import os
+import sys
+
+from des import SBOXES
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "des_sbox_circuits.py")
+
+HEADER = '''"""
+Bitsliced DES S-boxes as straight-line boolean circuits.
+
+Generated by gen_sbox_circuits.py from the truth tables in des.py; do not
+edit by hand. sbox<i>(x0, ..., x5, ONES, ZERO) takes the six input bits of
+S-box i (x0 first) as bit arrays and returns its four output bits, most
+significant first. ONES and ZERO are the all-ones and all-zero arrays.
+"""
+'''
+
+
+def sbox_circuit(index, sbox):
+    """
+    Source of the function computing one S-box.
+    """
+    lines, memo = [], {}
+
+    def node(expr):
+        if expr not in memo:
+            memo[expr] = f"t{len(memo)}"
+            lines.append(f"    {memo[expr]} = {expr}")
+        return memo[expr]
+
+    def mux(a, b, s):  # s ? b : a
+        if a == b:
+            return a
+        if (a, b) == (0, 1):
+            return s
+        if (a, b) == (1, 0):
+            return node(f"~{s}")
+        if a == 0:
+            return node(f"{b} & {s}")
+        if b == 0:
+            return node(f"{a} & ~{s}")
+        if a == 1:
+            return node(f"{b} | ~{s}")
+        if b == 1:
+            return node(f"{a} | {s}")
+        return node(f"{a} ^ (({a} ^ {b}) & {s})")
+
+    outputs = []
+    for bit in range(4):
+        level = []
+        for x in range(64):
+            value = sbox[(((x >> 4) & 2) | (x & 1)) * 16 + ((x >> 1) & 0xF)]
+            level.append((value >> (3 - bit)) & 1)
+        for var in range(5, -1, -1):  # x5 (last input) is the least significant bit
+            level = [mux(level[2 * i], level[2 * i + 1], f"x{var}") for i in range(len(level) // 2)]
+        outputs.append(level[0])
+    body = "\n".join(lines)
+    result = ", ".join(o if isinstance(o, str) else ("ONES" if o else "ZERO") for o in outputs)
+    return f"def sbox{index}(x0, x1, x2, x3, x4, x5, ONES, ZERO):\n{body}\n    return {result}\n"
+
+
+def module_source():
+    functions = "\n\n".join(sbox_circuit(i, sbox) for i, sbox in enumerate(SBOXES))
+    names = ", ".join(f"sbox{i}" for i in range(len(SBOXES)))
+    return f"{HEADER}\n\n{functions}\n\nSBOX_CIRCUITS = [{names}]\n"
+
+
+def check():
+    """
+    True if des_sbox_circuits.py matches the generator and every circuit
+    reproduces its S-box on all 64 inputs.
+    """
+    with open(OUTPUT) as f:
+        if f.read() != module_source():
+            print(f"{OUTPUT} is out of date; run gen_sbox_circuits.py")
+            return False
+    from des_sbox_circuits import SBOX_CIRCUITS
+    for i, (circuit, sbox) in enumerate(zip(SBOX_CIRCUITS, SBOXES)):
+        for x in range(64):
+            bits = [(x >> (5 - t)) & 1 for t in range(6)]
+            out = circuit(*bits, 1, 0)
+            value = sum((b & 1) << (3 - k) for k, b in enumerate(out))
+            if value != sbox[(((x >> 4) & 2) | (x & 1)) * 16 + ((x >> 1) & 0xF)]:
+                print(f"sbox{i} is wrong for input {x:06b}")
+                return False
+    return True
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--check"]:
+        sys.exit(0 if check() else 1)
+    with open(OUTPUT, "w") as f:
+        f.write(module_source())
+    print(f"wrote {OUTPUT}")
@@ -1,36 +1,188 @@
+import math
+import secrets
+
+SMALL_PRIMES = [p for p in range(3, 2000) if all(p % d for d in range(2, int(p ** 0.5) + 1))]
+DEFAULT_EXPONENT = 65537
+
+
 def gcd(a,b):
   while b:
     a,b=b,a%b
   return a
 
+
+def egcd(a, b):
+  """
+  Extended Euclid: returns (g, x, y) with a*x + b*y == g == gcd(a, b).
+  """
+  x0, x1, y0, y1 = 1, 0, 0, 1
+  while b:
+    q, a, b = a // b, b, a % b
+    x0, x1 = x1, x0 - q * x1
+    y0, y1 = y1, y0 - q * y1
+  return a, x0, y0
+
+
+def mod_inverse(a, m):
+  g, x, _ = egcd(a % m, m)
+  if g != 1:
+    raise ValueError(f"{a} has no inverse modulo {m}")
+  return x % m
+
+
+def is_probable_prime(n, rounds=None):
+  """
+  Miller-Rabin primality test after trial division by small primes.
+  The number of random bases grows with the size of n (error < 2**-80).
+  """
+  if n < 2:
+    return False
+  if n in (2, 3):
+    return True
+  if n % 2 == 0:
+    return False
+  for p in SMALL_PRIMES:
+    if n % p == 0:
+      return n == p
+  if rounds is None:
+    bits = n.bit_length()
+    rounds = 40 if bits < 512 else 12 if bits < 1024 else 6 if bits < 2048 else 4
+  d, s = n - 1, 0
+  while d % 2 == 0:
+    d //= 2
+    s += 1
+  for _ in range(rounds):
+    a = secrets.randbelow(n - 3) + 2
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+      continue
+    for _ in range(s - 1):
+      x = x * x % n
+      if x == n - 1:
+        break
+    else:
+      return False
+  return True
+
+
+def generate_prime(bits, e=DEFAULT_EXPONENT):
+  """
+  Random probable prime of exactly `bits` bits with gcd(p - 1, e) == 1.
+  """
+  while True:
+    candidate = secrets.randbits(bits) | (1 << (bits - 1)) | (1 << (bits - 2)) | 1
+    if math.gcd(e, candidate - 1) == 1 and is_probable_prime(candidate):
+      return candidate
+
+
+def _nonzero_random(n):
+  out = b""
+  while len(out) < n:
+    out += secrets.token_bytes(n - len(out)).replace(b"\x00", b"")
+  return out
+
+
+class RSAKey:
+  """
+  RSA key pair with the CRT parameters used for fast decryption.
+  - encrypt/decrypt work on integers; decryption uses the CRT (about 4x faster).
+  - encrypt_bytes/decrypt_bytes split messages into blocks with PKCS#1 v1.5 padding.
+  """
+
+  def __init__(self, p, q, e=DEFAULT_EXPONENT):
+    if p == q:
+      raise ValueError("p and q must be different primes")
+    phi = (p - 1) * (q - 1)
+    if gcd(e, phi) != 1:
+      raise ValueError("e must be coprime with phi(n)")
+    self.p, self.q, self.e = p, q, e
+    self.n = p * q
+    self.d = mod_inverse(e, phi)
+    self.dp = self.d % (p - 1)
+    self.dq = self.d % (q - 1)
+    self.qinv = mod_inverse(q, p)
+    self.size = (self.n.bit_length() + 7) // 8
+
+  @classmethod
+  def generate(cls, bits=2048, e=DEFAULT_EXPONENT):
+    """
+    New key pair with an n of `bits` bits built from Miller-Rabin probable primes.
+    """
+    while True:
+      p = generate_prime(bits - bits // 2, e)
+      q = generate_prime(bits // 2, e)
+      if p != q and (p * q).bit_length() == bits:
+        return cls(p, q, e)
+
+  def encrypt(self, m):
+    if not 0 <= m < self.n:
+      raise ValueError("message representative out of range")
+    return pow(m, self.e, self.n)
+
+  def decrypt(self, c):
+    m1 = pow(c, self.dp, self.p)
+    m2 = pow(c, self.dq, self.q)
+    h = self.qinv * (m1 - m2) % self.p
+    return m2 + h * self.q
+
+  def decrypt_no_crt(self, c):
+    return pow(c, self.d, self.n)
+
+  def encrypt_bytes(self, message):
+    """
+    Encrypts bytes of any length: every chunk of up to size-11 bytes is
+    padded as 00 02 <nonzero random> 00 <chunk> and encrypted into one
+    size-byte block.
+    """
+    chunk = self.size - 11
+    if chunk <= 0:
+      raise ValueError("key is too small for PKCS#1 v1.5 padding")
+    out = []
+    for start in range(0, max(len(message), 1), chunk):
+      block = message[start:start + chunk]
+      pad = _nonzero_random(self.size - 3 - len(block))
+      m = int.from_bytes(b"\x00\x02" + pad + b"\x00" + block, "big")
+      out.append(self.encrypt(m).to_bytes(self.size, "big"))
+    return b"".join(out)
+
+  def decrypt_bytes(self, ciphertext):
+    if len(ciphertext) % self.size:
+      raise ValueError("ciphertext length must be a multiple of the key size")
+    out = []
+    for start in range(0, len(ciphertext), self.size):
+      em = self.decrypt(int.from_bytes(ciphertext[start:start + self.size], "big")).to_bytes(self.size, "big")
+      sep = em.find(b"\x00", 2)
+      if em[:2] != b"\x00\x02" or sep < 10:
+        raise ValueError("decryption error")
+      out.append(em[sep + 1:])
+    return b"".join(out)
+
+
 def rsa(p,q,mes):
   n=p*q
   phi=(p-1)*(q-1)
-  
+
   for i in range(2,phi):
     if(gcd(i,phi)==1):
       e=i
       break
   print(e)
-  j=0
-  
-  while True:
-    if(j*e%phi)==1:
-      d=j
-      break
-    j+=1
-    
-  print(d) 
-  c=(mes**e)%n
+  key=RSAKey(p,q,e)
+  d=key.d
+
+  print(d)
+  c=key.encrypt(mes%n)
   print(f"Encrypted message: {c}")
-  
-  m=(c**d)%n
+
+  m=key.decrypt(c)
   print(f"Decrypted message: {m}")
-  
+
   if(mes==m):
     print("decryption is working")
 
-p=int(input("Enter a prime number p: "))
-q=int(input("Enter a prime number q: "))
-mes=int(input("Enter the message: "))
-rsa(p,q,mes)
+
+if __name__ == "__main__":
+  p=int(input("Enter a prime number p: "))
+  q=int(input("Enter a prime number q: "))
+  mes=int(input("Enter the message: "))
+  rsa(p,q,mes)
@@ -0,0 +1,71 @@
+"""
+Timing benchmark for the RSA module.
+
+- Toy primes: the original loop-based rsa() algorithm against RSAKey
+  (the original only finishes for tiny p and q).
+- 512-4096 bits: key generation, encryption, and decryption with and
+  without the CRT.
+
+    python rsa_benchmark.py [repeats]
+"""
+import sys
+import time
+
+from rsa import RSAKey, gcd
+
+TOY_PRIMES = [(17, 11), (61, 53), (257, 251), (1009, 1013)]
+
+
+def legacy_rsa(p, q, mes):
+  """
+  The original algorithm: linear search for d and full-size powers.
+  """
+  n = p * q
+  phi = (p - 1) * (q - 1)
+  e = next(i for i in range(2, phi) if gcd(i, phi) == 1)
+  d = 0
+  while d * e % phi != 1:
+    d += 1
+  c = (mes ** e) % n
+  return (c ** d) % n
+
+
+def fast_rsa(p, q, mes):
+  e = next(i for i in range(2, (p - 1) * (q - 1)) if gcd(i, (p - 1) * (q - 1)) == 1)
+  key = RSAKey(p, q, e)
+  return key.decrypt(key.encrypt(mes % key.n))
+
+
+def timed(fn, repeats):
+  start = time.perf_counter()
+  for _ in range(repeats):
+    fn()
+  return (time.perf_counter() - start) / repeats
+
+
+def main(repeats=20):
+  print("Toy primes: original rsa() vs RSAKey (ms per run)")
+  for p, q in TOY_PRIMES:
+    mes = p * q // 3
+    assert legacy_rsa(p, q, mes) == fast_rsa(p, q, mes) == mes
+    old = timed(lambda: legacy_rsa(p, q, mes), 1)
+    new = timed(lambda: fast_rsa(p, q, mes), repeats)
+    print(f"  {(p * q).bit_length():2d}-bit n  original {old * 1e3:10.2f}  RSAKey {new * 1e3:8.3f}  ({old / new:,.0f}x)")
+
+  print("\nRSAKey (ms per operation)")
+  print(f"  {'bits':>5} {'keygen':>10} {'encrypt':>10} {'decrypt':>10} {'no CRT':>10} {'speedup':>8}")
+  for bits in (512, 1024, 2048, 4096):
+    keygen_runs = max(1, repeats // (bits // 512))
+    keygen = timed(lambda: RSAKey.generate(bits), keygen_runs)
+    key = RSAKey.generate(bits)
+    m = key.n // 3
+    c = key.encrypt(m)
+    assert key.decrypt(c) == key.decrypt_no_crt(c) == m
+    enc = timed(lambda: key.encrypt(m), repeats * 10)
+    crt = timed(lambda: key.decrypt(c), repeats)
+    plain = timed(lambda: key.decrypt_no_crt(c), repeats)
+    print(f"  {bits:>5} {keygen * 1e3:10.1f} {enc * 1e3:10.3f} {crt * 1e3:10.3f} {plain * 1e3:10.3f} {plain / crt:7.1f}x")
+
+
+if __name__ == "__main__":
+  main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,40 @@
+"""
+Public-key generation with the fixed-base table vs plain pow, and bulk
+key exchange throughput, on the RFC 3526 2048-bit group.
+
+    python dh_benchmark.py [count] [private_bits]
+"""
+import sys
+import time
+
+from diffie_hellman import MODP_2048, DHGroup
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main(count=2000, private_bits=256):
+    group, setup = timed(lambda: DHGroup(MODP_2048, 2, private_bits))
+    print(f"Table setup ({len(group.table.rows)} x {1 << group.table.window} entries): {setup * 1e3:.1f} ms")
+
+    privates = [group.generate_private_key() for _ in range(count)]
+    plain, t_plain = timed(lambda: [pow(2, x, MODP_2048) for x in privates])
+    table, t_table = timed(lambda: [group.public_key(x) for x in privates])
+    assert plain == table
+    print(f"Public keys, pow:         {count / t_plain:10.0f} keys/s")
+    print(f"Public keys, fixed base:  {count / t_table:10.0f} keys/s  ({t_plain / t_table:.1f}x)")
+    print(f"Table pays for itself after {setup / (t_plain / count - t_table / count):.0f} keys")
+
+    pairs_a, t_pairs = timed(lambda: group.generate_keypairs(count))
+    pairs_b = group.generate_keypairs(count)
+    secrets_a, t_shared = timed(lambda: group.shared_secrets([x for x, _ in pairs_a], [y for _, y in pairs_b]))
+    assert secrets_a == group.shared_secrets([x for x, _ in pairs_b], [y for _, y in pairs_a])
+    print(f"generate_keypairs:        {count / t_pairs:10.0f} pairs/s")
+    print(f"shared_secrets:           {count / t_shared:10.0f} secrets/s")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
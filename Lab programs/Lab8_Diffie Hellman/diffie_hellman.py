@@ -1,13 +1,114 @@
-import math
-p=int(input("Enter the prime numbers"))
-a=int(input("Enter the primitive root"))
-Xa=int(input("Enter the private key of a"))
-Xb=int(input("enter the private key of b"))
-Ya=(math.pow(a,Xa))%p
-Yb=(math.pow(a,Xb))%p
-print(f"Public Key of a {Ya}")
-print(f"Public Key of b {Yb}")
-Qa=(math.pow(Ya,Xa))%p
-Qb=(math.pow(Yb,Xb))%p
-print(f"Shared Key of a {Qa}")
-print(f"Shared Key of b {Qb}")
\ No newline at end of file
+import secrets
+
+# RFC 3526 group 14 (2048-bit MODP group), generator 2
+MODP_2048 = int("""
+    FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74
+    020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F1437
+    4FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED
+    EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF05
+    98DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB
+    9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3B
+    E39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF695581718
+    3995497CEA956AE515D2261898FA051015728E5A8AACAA68FFFFFFFFFFFFFFFF
+""".replace("\n", "").replace(" ", ""), 16)
+
+
+class FixedBaseTable:
+    """
+    Precomputed powers of a fixed base for exponents of up to `bits` bits.
+    row i holds base^(d * 2^(window*i)) mod p for every window digit d, so
+    base^x costs one multiplication per non-zero digit of x and no squarings.
+    """
+
+    def __init__(self, base, p, bits, window=8):
+        self.p, self.bits, self.window = p, bits, window
+        self.mask = (1 << window) - 1
+        self.rows = []
+        step = base % p
+        for _ in range(-(-bits // window)):
+            row = [1] * (1 << window)
+            for d in range(1, 1 << window):
+                row[d] = row[d - 1] * step % p
+            self.rows.append(row)
+            step = row[-1] * step % p  # step^(2^window)
+        self.base = base % p
+
+    def pow(self, x):
+        if x.bit_length() > self.bits:
+            return pow(self.base, x, self.p)
+        p, w, mask = self.p, self.window, self.mask
+        result = 1
+        for row in self.rows:
+            d = x & mask
+            if d:
+                result = result * row[d] % p
+            x >>= w
+            if not x:
+                break
+        return result
+
+
+class DHGroup:
+    """
+    Integer Diffie-Hellman over Z_p* with generator a.
+    - Public keys use a fixed-base table for a built once per group.
+    - Private keys are `private_bits` long (default: 256, or the size of p for small p).
+    """
+
+    def __init__(self, p, a, private_bits=None, window=8):
+        if p < 5 or not 1 < a < p - 1:
+            raise ValueError("need a prime p >= 5 and a generator 1 < a < p - 1")
+        self.p, self.a = p, a
+        self.private_bits = private_bits or min(256, p.bit_length() - 1)
+        self.table = FixedBaseTable(a, p, self.private_bits, window)
+
+    def generate_private_key(self):
+        while True:
+            x = secrets.randbits(self.private_bits)
+            if 1 < x < self.p - 1:
+                return x
+
+    def public_key(self, x):
+        return self.table.pow(x)
+
+    def shared_secret(self, x, peer_public, check=True):
+        """
+        peer_public^x mod p. With check, public keys 0, 1 and p-1 (small
+        subgroup values) are rejected; pass check=False for textbook toy
+        parameters, where they come up honestly.
+        """
+        if check and not 1 < peer_public < self.p - 1:
+            raise ValueError("invalid peer public key")
+        return pow(peer_public, x, self.p)
+
+    def generate_keypairs(self, count):
+        """
+        Returns `count` (private, public) pairs.
+        """
+        pow_table = self.table.pow
+        return [(x, pow_table(x)) for x in (self.generate_private_key() for _ in range(count))]
+
+    def shared_secrets(self, privates, peer_publics):
+        """
+        Shared secret for every (private key, peer public key) pair.
+        """
+        return [self.shared_secret(x, y) for x, y in zip(privates, peer_publics)]
+
+
+if __name__ == "__main__":
+    p=int(input("Enter the prime numbers"))
+    a=int(input("Enter the primitive root"))
+    Xa=int(input("Enter the private key of a"))
+    Xb=int(input("enter the private key of b"))
+    group=DHGroup(p,a)
+    Ya=group.public_key(Xa)
+    Yb=group.public_key(Xb)
+    print(f"Public Key of a {Ya}")
+    print(f"Public Key of b {Yb}")
+    for name, Y in (("a", Ya), ("b", Yb)):
+        if not 1 < Y < p - 1:
+            print(f"Note: public key of {name} is {Y}, which a real protocol would reject (small subgroup)")
+    Qa=group.shared_secret(Xa,Yb,check=False)
+    Qb=group.shared_secret(Xb,Ya,check=False)
+    print(f"Shared Key of a {Qa}")
+    print(f"Shared Key of b {Qb}")
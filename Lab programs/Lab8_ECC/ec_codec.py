@@ -0,0 +1,210 @@
+"""
+SEC1 point encoding and a packed binary format for bulk public keys.
+
+- encode/decode follow SEC1 2.3.3/2.3.4: 0x02/0x03 || x (compressed),
+  0x04 || x || y (uncompressed), 0x00 for the point at infinity.
+- Decompression takes a square root mod p with the exponent precomputed
+  per curve ((p + 1) / 4 when p = 3 mod 4, Tonelli-Shanks constants otherwise).
+- A packed key file is a small header followed by fixed-size SEC1 records,
+  so record i is a memoryview slice at a computed offset: loading a file
+  (optionally memory-mapped) parses nothing until a key is used.
+"""
+import mmap
+import struct
+from functools import lru_cache
+
+from ec_engine import get_engine
+
+MAGIC = b"ECPK"
+VERSION = 1
+_HEADER = struct.Struct(">4sBBH")  # magic, version, flags, curve name length
+_COUNT = struct.Struct(">Q")
+FLAG_COMPRESSED = 1
+
+
+class PointCodec:
+    """
+    SEC1 codec for one registry curve; points are affine (x, y) tuples,
+    None for the point at infinity.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.name = engine.name
+        p = engine.p
+        self.size = (p.bit_length() + 7) // 8
+        if p % 4 == 3:
+            self._sqrt_exponent = (p + 1) // 4
+        else:
+            q, s = p - 1, 0
+            while q % 2 == 0:
+                q //= 2
+                s += 1
+            z = 2
+            while pow(z, (p - 1) // 2, p) != p - 1:
+                z += 1
+            self._sqrt_exponent = None
+            self._ts = (q, s, pow(z, q, p), (q + 1) // 2)
+
+    def sqrt(self, a):
+        """
+        A square root of a mod p, or None if a is not a square.
+        """
+        p = self.engine.p
+        if self._sqrt_exponent is not None:
+            r = pow(a, self._sqrt_exponent, p)
+            return r if r * r % p == a % p else None
+        q, m, c, half = self._ts
+        t, r = pow(a, q, p), pow(a, half, p)
+        while t != 1:
+            if t == 0:
+                return 0
+            i, t2 = 0, t
+            while t2 != 1:
+                t2 = t2 * t2 % p
+                i += 1
+                if i == m:
+                    return None
+            b = pow(c, 1 << (m - i - 1), p)
+            m, c = i, b * b % p
+            t, r = t * c % p, r * b % p
+        return r
+
+    def encode(self, point, compressed=True):
+        if point is None:
+            return b"\x00"
+        x, y = point
+        if compressed:
+            return bytes((2 | (y & 1),)) + x.to_bytes(self.size, "big")
+        return b"\x04" + x.to_bytes(self.size, "big") + y.to_bytes(self.size, "big")
+
+    def decode(self, data):
+        """
+        Point from a SEC1 encoding; raises ValueError for malformed
+        encodings and points that are not on the curve.
+        """
+        data = memoryview(data)
+        size, p = self.size, self.engine.p
+        if not data:
+            raise ValueError("empty point encoding")
+        if len(data) == 1 and data[0] == 0:
+            return None
+        prefix = data[0]
+        if prefix in (2, 3) and len(data) == 1 + size:
+            x = int.from_bytes(data[1:], "big")
+            if x >= p:
+                raise ValueError("x coordinate out of range")
+            y = self.sqrt((x * x * x + self.engine.a * x + self.engine.b) % p)
+            if y is None:
+                raise ValueError("point is not on the curve")
+            if y & 1 != prefix & 1:
+                if y == 0:
+                    raise ValueError("y is 0 but the prefix asks for an odd y")  # SEC1 2.3.4
+                y = p - y
+            return (x, y)
+        if prefix == 4 and len(data) == 1 + 2 * size:
+            x = int.from_bytes(data[1:1 + size], "big")
+            y = int.from_bytes(data[1 + size:], "big")
+            if x >= p or y >= p or (y * y - x * x * x - self.engine.a * x - self.engine.b) % p:
+                raise ValueError("point is not on the curve")
+            return (x, y)
+        raise ValueError("invalid SEC1 point encoding")
+
+    def record_size(self, compressed=True):
+        return 1 + self.size * (1 if compressed else 2)
+
+
+@lru_cache(maxsize=None)
+def get_codec(name="brainpoolP256r1"):
+    return PointCodec(get_engine(name))
+
+
+def pack_keys(name, points, compressed=True):
+    """
+    Packed key file contents for an iterable of (x, y) public keys.
+    """
+    codec = get_codec(name)
+    encode = codec.encode
+    records = [encode(point, compressed) for point in points]
+    if any(len(r) == 1 for r in records):
+        raise ValueError("the point at infinity is not a valid public key")
+    label = name.encode()
+    header = _HEADER.pack(MAGIC, VERSION, FLAG_COMPRESSED if compressed else 0, len(label))
+    return b"".join([header, label, _COUNT.pack(len(records))] + records)
+
+
+def save_keys(path, name, points, compressed=True):
+    with open(path, "wb") as f:
+        f.write(pack_keys(name, points, compressed))
+
+
+class PackedKeys:
+    """
+    Read-only view of a packed key file (bytes, bytearray or mmap).
+
+        with PackedKeys.load("directory.ecpk") as keys:
+            keys.raw(i)   # SEC1 bytes of key i (memoryview, no copy)
+            keys[i]       # decoded (x, y)
+
+    close() unmaps a file opened with load(); views from raw() must not
+    be kept past it.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self.view = memoryview(buffer)
+        magic, version, flags, name_len = _HEADER.unpack_from(self.view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a packed key file")
+        start = _HEADER.size
+        self.curve = bytes(self.view[start:start + name_len]).decode()
+        (self.count,) = _COUNT.unpack_from(self.view, start + name_len)
+        self.compressed = bool(flags & FLAG_COMPRESSED)
+        self.codec = get_codec(self.curve)
+        self.record = self.codec.record_size(self.compressed)
+        self.offset = start + name_len + _COUNT.size
+        if len(self.view) != self.offset + self.count * self.record:
+            raise ValueError("packed key file is truncated")
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        with open(path, "rb") as f:
+            if use_mmap:
+                return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            return cls(f.read())
+
+    def close(self):
+        self.view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def raw(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        start = self.offset + i * self.record
+        return self.view[start:start + self.record]
+
+    def __getitem__(self, i):
+        return self.codec.decode(self.raw(i))
+
+    def __iter__(self):
+        decode, record, view = self.codec.decode, self.record, self.view
+        for start in range(self.offset, self.offset + self.count * self.record, record):
+            yield decode(view[start:start + record])
+
+    def x_coordinates(self):
+        """
+        x of every key, read straight from the records without decompression.
+        """
+        size, view, from_bytes = self.codec.size, self.view, int.from_bytes
+        return [from_bytes(view[start + 1:start + 1 + size], "big")
+                for start in range(self.offset, self.offset + self.count * self.record, self.record)]
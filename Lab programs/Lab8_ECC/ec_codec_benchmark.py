@@ -0,0 +1,60 @@
+"""
+Storage size and load/parse speed of a public key directory: the hex
+strings of compress_point vs the packed SEC1 format.
+
+    python ec_codec_benchmark.py [count] [unique]
+
+`unique` distinct keys are generated and repeated up to `count` records.
+"""
+import os
+import secrets
+import sys
+import tempfile
+import time
+
+from ec_codec import PackedKeys, save_keys
+from ec_engine import get_engine
+
+
+def timed(label, count, fn):
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    print(f"  {label:<34} {seconds * 1e3:9.1f} ms  {count / seconds:14,.0f} keys/s")
+    return result
+
+
+def main(count=1_000_000, unique=10_000):
+    count, unique = int(count), int(unique)
+    engine = get_engine("brainpoolP256r1")
+    distinct = engine.mul_base_many([secrets.randbelow(engine.n) for _ in range(unique)])
+    points = (distinct * (count // unique + 1))[:count]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        hex_path = os.path.join(tmp, "keys.txt")
+        with open(hex_path, "w") as f:
+            f.writelines(hex(x) + hex(y % 2)[2:] + "\n" for x, y in points)
+        print(f"hex strings:          {os.path.getsize(hex_path) / count:6.1f} bytes/key")
+        for compressed in (True, False):
+            path = os.path.join(tmp, f"keys-{compressed}.ecpk")
+            save_keys(path, "brainpoolP256r1", points, compressed)
+            print(f"packed {'compressed' if compressed else 'uncompressed'}:"
+                  f"{'  ' if compressed else ''} {os.path.getsize(path) / count:6.1f} bytes/key")
+
+        print(f"\nLoading {count} keys")
+        with open(hex_path) as f:
+            lines = f.read().split()
+        timed("hex: parse x and parity", count, lambda: [(int(s[:-1], 16), s[-1]) for s in lines])
+        keys = timed("packed: load (mmap)", count, lambda: PackedKeys.load(os.path.join(tmp, "keys-True.ecpk")))
+        timed("packed: x coordinates", count, keys.x_coordinates)
+        timed("packed: raw SEC1 slices", count, lambda: [keys.raw(i) for i in range(count)])
+        sample = min(count, 20_000)
+        timed(f"packed: decompress {sample} keys", sample, lambda: [keys[i] for i in range(sample)])
+        full = PackedKeys.load(os.path.join(tmp, "keys-False.ecpk"))
+        timed("packed uncompressed: decode all", count, lambda: list(full))
+        keys.close()
+        full.close()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,343 @@
+"""
+Fast scalar multiplication for the tinyec registry curves.
+
+- Points are kept in Jacobian coordinates (X, Y, Z) ~ (X/Z^2, Y/Z^3), so
+  additions and doublings need no modular inversion; one inversion
+  converts the result back to affine.
+- Variable-base multiplication uses width-w NAF with a table of odd
+  multiples, normalised to affine with one simultaneous inversion.
+- Fixed-base multiplication by the generator uses a Lim-Lee comb table,
+  built once per curve and cached by get_engine().
+- Batches (mul_many, mul_base_many, ecdh_batch) share the affine
+  conversion across all their points and fan out to worker processes.
+
+Results are affine (x, y) tuples, or None for the point at infinity, and
+match tinyec's `k * point` exactly; to_point() converts them to tinyec points.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from tinyec import ec, registry
+
+WNAF_WIDTH = 5
+COMB_TEETH = 8
+COMB_TABLES = 8
+CHUNK_SIZE = 512  # scalars per worker task in ecdh_batch
+
+
+def batch_inverse(values, p):
+    """
+    Inverts every (non-zero) value mod p with a single modular inversion
+    (Montgomery's simultaneous inversion trick).
+    """
+    prefix, acc = [], 1
+    for v in values:
+        prefix.append(acc)
+        acc = acc * v % p
+    inv = pow(acc, -1, p)
+    out = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        out[i] = prefix[i] * inv % p
+        inv = inv * values[i] % p
+    return out
+
+
+def wnaf(k, width=WNAF_WIDTH):
+    """
+    Width-w non-adjacent form of k, least significant digit first.
+    Non-zero digits are odd and below 2^(width-1) in absolute value.
+    """
+    digits, full, half = [], 1 << width, 1 << (width - 1)
+    while k:
+        if k & 1:
+            d = k & (full - 1)
+            if d >= half:
+                d -= full
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+
+class CurveEngine:
+    """
+    Jacobian-coordinate arithmetic on y^2 = x^3 + ax + b over GF(p).
+
+        engine = get_engine("brainpoolP256r1")
+        public = engine.mul_base(private_key)      # (x, y)
+        shared = engine.mul(private_key, public)   # (x, y)
+    """
+
+    def __init__(self, curve, teeth=COMB_TEETH, tables=COMB_TABLES):
+        self.curve = curve
+        self.name = curve.name
+        self.p, self.a, self.b = curve.field.p, curve.a % curve.field.p, curve.b
+        self.n, self.h = curve.field.n, curve.field.h
+        self.g = (curve.g.x, curve.g.y)
+        self._build_comb(teeth, tables)
+
+    # --- Jacobian group law -------------------------------------------------
+
+    def double(self, P):
+        X, Y, Z = P
+        if not Z or not Y:
+            return (1, 1, 0)
+        p = self.p
+        YY = Y * Y % p
+        S = 4 * X * YY % p
+        ZZ = Z * Z % p
+        M = (3 * X * X + self.a * ZZ * ZZ) % p
+        X3 = (M * M - 2 * S) % p
+        return (X3, (M * (S - X3) - 8 * YY * YY) % p, 2 * Y * Z % p)
+
+    def add_affine(self, P, q):
+        """
+        P (Jacobian) + q (affine, not infinity).
+        """
+        X1, Y1, Z1 = P
+        if not Z1:
+            return (q[0], q[1], 1)
+        p = self.p
+        ZZ = Z1 * Z1 % p
+        H = (q[0] * ZZ - X1) % p
+        r = (q[1] * ZZ * Z1 - Y1) % p
+        if not H:
+            return self.double(P) if not r else (1, 1, 0)
+        HH = H * H % p
+        HHH = H * HH % p
+        V = X1 * HH % p
+        X3 = (r * r - HHH - 2 * V) % p
+        return (X3, (r * (V - X3) - Y1 * HHH) % p, Z1 * H % p)
+
+    def add(self, P, Q):
+        """
+        P + Q, both Jacobian.
+        """
+        X1, Y1, Z1 = P
+        X2, Y2, Z2 = Q
+        if not Z1:
+            return Q
+        if not Z2:
+            return P
+        p = self.p
+        Z1Z1, Z2Z2 = Z1 * Z1 % p, Z2 * Z2 % p
+        U1, U2 = X1 * Z2Z2 % p, X2 * Z1Z1 % p
+        S1, S2 = Y1 * Z2 * Z2Z2 % p, Y2 * Z1 * Z1Z1 % p
+        H, r = (U2 - U1) % p, (S2 - S1) % p
+        if not H:
+            return self.double(P) if not r else (1, 1, 0)
+        HH = H * H % p
+        HHH = H * HH % p
+        V = U1 * HH % p
+        X3 = (r * r - HHH - 2 * V) % p
+        return (X3, (r * (V - X3) - S1 * HHH) % p, Z1 * Z2 * H % p)
+
+    def to_affine(self, P):
+        X, Y, Z = P
+        if not Z:
+            return None
+        p = self.p
+        zi = pow(Z, -1, p)
+        zi2 = zi * zi % p
+        return (X * zi2 % p, Y * zi2 * zi % p)
+
+    def batch_to_affine(self, points):
+        """
+        Converts many Jacobian points with one modular inversion.
+        """
+        p = self.p
+        finite = [i for i, P in enumerate(points) if P[2]]
+        out = [None] * len(points)
+        for i, zi in zip(finite, batch_inverse([points[i][2] for i in finite], p)):
+            X, Y, _ = points[i]
+            zi2 = zi * zi % p
+            out[i] = (X * zi2 % p, Y * zi2 * zi % p)
+        return out
+
+    # --- scalar multiplication ---------------------------------------------
+
+    def _scalar(self, k):
+        return k % self.n if self.h == 1 else k
+
+    def mul(self, k, point, width=WNAF_WIDTH):
+        """
+        k * point by wNAF (point is an (x, y) tuple or a tinyec Point).
+        """
+        k, q = self._scalar(k), _coords(point)
+        if q is None or not k:
+            return None
+        return self.to_affine(self.mul_jacobian(k, q, width))
+
+    def mul_jacobian(self, k, q, width=WNAF_WIDTH, table=None):
+        """
+        k * q (affine) in Jacobian coordinates; `table` optionally holds the
+        affine odd multiples of q, as returned by _odd_multiples.
+        """
+        p = self.p
+        if table is None:
+            table = self._odd_multiples(q, width)
+        neg = [None if t is None else (t[0], (p - t[1]) % p) for t in table]
+        R = (1, 1, 0)
+        double, add_affine = self.double, self.add_affine
+        for d in reversed(wnaf(k, width)):
+            R = double(R)
+            if d > 0:
+                t = table[d >> 1]
+                R = add_affine(R, t) if t is not None else R
+            elif d < 0:
+                t = neg[(-d) >> 1]
+                R = add_affine(R, t) if t is not None else R
+        return R
+
+    def _odd_multiples_jacobian(self, q, width):
+        twice = self.double((q[0], q[1], 1))
+        points = [(q[0], q[1], 1)]
+        for _ in range((1 << (width - 2)) - 1):
+            points.append(self.add(points[-1], twice))
+        return points
+
+    def _odd_multiples(self, q, width):
+        """
+        Affine q, 3q, 5q, ..., (2^(width-1) - 1)q (None where a multiple is infinity).
+        """
+        return self.batch_to_affine(self._odd_multiples_jacobian(q, width))
+
+    def mul_many(self, scalars, points, width=WNAF_WIDTH):
+        """
+        k_i * P_i for every pair. The odd-multiple tables of all points, and
+        then all results, are normalised with one simultaneous inversion
+        each instead of one inversion per point.
+        """
+        jobs = [(self._scalar(k), _coords(q)) for k, q in zip(scalars, points)]
+        live = [i for i, (k, q) in enumerate(jobs) if k and q is not None]
+        size = 1 << (width - 2)
+        tables = self.batch_to_affine([P for i in live for P in self._odd_multiples_jacobian(jobs[i][1], width)])
+        results = [(1, 1, 0)] * len(jobs)
+        for n, i in enumerate(live):
+            k, q = jobs[i]
+            results[i] = self.mul_jacobian(k, q, width, tables[n * size:(n + 1) * size])
+        return self.batch_to_affine(results)
+
+    def _build_comb(self, teeth, tables):
+        """
+        Lim-Lee comb: with d = ceil(bits / teeth) and e = ceil(d / tables),
+        comb[s][i] = sum of bit j of i times 2^(j*d + s*e) * G.
+        """
+        bits = self.n.bit_length()
+        self.comb_teeth = teeth
+        self.comb_spacing = d = -(-bits // teeth)
+        self.comb_tables = tables
+        self.comb_step = e = -(-d // tables)
+        jacobian = []
+        base = (self.g[0], self.g[1], 1)
+        for s in range(tables):
+            # powers[j] = 2^(j*d + s*e) * G
+            powers, P = [], base
+            for j in range(teeth):
+                powers.append(P)
+                for _ in range(d):
+                    P = self.double(P)
+            row = [(1, 1, 0)] * (1 << teeth)
+            for i in range(1, 1 << teeth):
+                low = i & -i
+                row[i] = self.add(row[i ^ low], powers[low.bit_length() - 1])
+            jacobian.append(row)
+            for _ in range(e):
+                base = self.double(base)
+        flat = self.batch_to_affine([P for row in jacobian for P in row])
+        size = 1 << teeth
+        self.comb = [flat[s * size:(s + 1) * size] for s in range(tables)]
+
+    def mul_base(self, k):
+        """
+        k * G using the precomputed comb table.
+        """
+        k %= self.n
+        if not k:
+            return None
+        return self.to_affine(self.mul_base_jacobian(k))
+
+    def mul_base_many(self, scalars):
+        """
+        k * G for every scalar, with one inversion for the whole batch.
+        """
+        return self.batch_to_affine([self.mul_base_jacobian(k % self.n) for k in scalars])
+
+    def mul_base_jacobian(self, k):
+        d, e, teeth = self.comb_spacing, self.comb_step, self.comb_teeth
+        bits = format(k, f"0{teeth * d}b")[::-1]  # bits[i] is bit i of k
+        columns = [int(bits[c::d][::-1], 2) for c in range(d)]
+        columns.extend([0] * (e * self.comb_tables - d))
+        R = (1, 1, 0)
+        double, add_affine, comb = self.double, self.add_affine, self.comb
+        for c in range(e - 1, -1, -1):
+            R = double(R)
+            for s in range(self.comb_tables):
+                index = columns[c + s * e]
+                if index and comb[s][index] is not None:
+                    R = add_affine(R, comb[s][index])
+        return R
+
+    # --- tinyec interop -----------------------------------------------------
+
+    def to_point(self, xy):
+        """
+        tinyec Point (or Inf) for an affine tuple.
+        """
+        return ec.Inf(self.curve) if xy is None else ec.Point(self.curve, xy[0], xy[1])
+
+
+def _coords(point):
+    if point is None or isinstance(point, ec.Inf):
+        return None
+    return (point.x, point.y) if isinstance(point, ec.Point) else tuple(point)
+
+
+@lru_cache(maxsize=None)
+def get_engine(name="brainpoolP256r1"):
+    """
+    Engine for a tinyec registry curve; the comb table is built on first use.
+    """
+    return CurveEngine(registry.get_curve(name))
+
+
+def _ecdh_chunk(name, scalars, points):
+    engine = get_engine(name)
+    return engine.mul_base_many(scalars), engine.mul_many(scalars, points)
+
+
+def ecdh_batch(name, scalars, points, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Ephemeral ECDH for many recipients on a registry curve: for every
+    scalar k_i and peer point P_i, returns the lists [k_i * G] and
+    [k_i * P_i] (affine tuples). `points` may also be a single point
+    shared by all scalars.
+    Batches larger than chunk_size are split into chunks and spread over
+    `workers` processes (default: all CPUs); each chunk shares its
+    inversions as in mul_many/mul_base_many.
+    """
+    scalars = list(scalars)
+    if not scalars:
+        return [], []
+    if points is None or isinstance(points, (ec.Point, ec.Inf)):
+        points = [points] * len(scalars)
+    else:
+        points = list(points)  # may be a generator
+        if points and isinstance(points[0], int):  # one (x, y) pair for every scalar
+            points = [points] * len(scalars)
+    points = [_coords(q) for q in points]
+    workers = workers or os.cpu_count()
+    if workers == 1 or len(scalars) <= chunk_size:
+        return _ecdh_chunk(name, scalars, points)
+    publics, shared = [], []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_ecdh_chunk, name, scalars[i:i + chunk_size], points[i:i + chunk_size])
+                   for i in range(0, len(scalars), chunk_size)]
+        for future in futures:
+            chunk_publics, chunk_shared = future.result()
+            publics.extend(chunk_publics)
+            shared.extend(chunk_shared)
+    return publics, shared
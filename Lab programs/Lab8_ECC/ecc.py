@@ -1,31 +1,56 @@
 import tinyec
 from tinyec import registry
 import secrets
+from ec_engine import ecdh_batch, get_engine
+from ec_codec import get_codec
 
 curve = registry.get_curve("brainpoolP256r1")
+engine = get_engine("brainpoolP256r1")  # Jacobian/wNAF/comb arithmetic, same results as tinyec
+codec = get_codec("brainpoolP256r1")  # SEC1 encode/decode, see ec_codec.py
 def compress_point(point):
  return hex(point.x) + hex(point.y % 2)[2:]
 
+def decompress_point(compressed):
+ # Inverse of compress_point: hex(x) followed by the parity digit of y
+ x, parity = int(compressed[:-1], 16), int(compressed[-1])
+ return engine.to_point(codec.decode(bytes([2 | parity]) + x.to_bytes(codec.size, "big")))
+
+def compress_points(points):
+ # Batch compress_point for affine (x, y) tuples
+ return [hex(x) + hex(y % 2)[2:] for x, y in points]
+
 def getEnKey(pubKey):
  ciPrivateKey = secrets.randbelow(curve.field.n)
- ciPublicKey = ciPrivateKey * curve.g
- enKey = ciPublicKey * ciPrivateKey
+ ciPublicKey = engine.to_point(engine.mul_base(ciPrivateKey))
+ enKey = engine.to_point(engine.mul(ciPrivateKey, pubKey))
  return (enKey, ciPublicKey)
 
-senderPrivateKey = secrets.randbelow(curve.field.n)
-senderPublicKey = senderPrivateKey * curve.g
-print("Sender's private key : ", hex(senderPrivateKey))
-print("Sender's public key : ", compress_point(senderPublicKey))
-print("\n")
-(enKeySender, ciPublicKeySender) = getEnKey(senderPublicKey)
-print("Sender's ciphertext public key : ", compress_point(ciPublicKeySender))
-print("Sender's encryption key : ", compress_point(enKeySender))
-print("\n")
-receiverPrivateKey = secrets.randbelow(curve.field.n)
-receiverPublicKey = receiverPrivateKey * curve.g
-print("Receiver's private key : ",hex(receiverPrivateKey))
-print("Receiver's public key :",compress_point(receiverPublicKey))
-print("\n")
-(enKeyReceiver,ciPublicKeyReceiver) = getEnKey(receiverPublicKey)
-print("Receiver's ciphertext public key : ",compress_point(ciPublicKeyReceiver))
-print("Receiver encryption key : ",compress_point(enKeyReceiver))
\ No newline at end of file
+def getEnKeys(pubKeys, workers=None, compressed=False):
+ # getEnKey for many recipients at once: returns [(enKey, ciPublicKey), ...]
+ # as tinyec points, or as compress_point strings when compressed=True.
+ # Big batches are split over worker processes (see ec_engine.ecdh_batch).
+ pubKeys = list(pubKeys)  # may be a generator; it is read twice below
+ ciPrivateKeys = [secrets.randbelow(curve.field.n) for _ in pubKeys]
+ ciPublicKeys, enKeys = ecdh_batch(curve.name, ciPrivateKeys, pubKeys, workers=workers)
+ if compressed:
+  return list(zip(compress_points(enKeys), compress_points(ciPublicKeys)))
+ return [(engine.to_point(e), engine.to_point(c)) for e, c in zip(enKeys, ciPublicKeys)]
+
+if __name__ == "__main__":
+ senderPrivateKey = secrets.randbelow(curve.field.n)
+ senderPublicKey = engine.to_point(engine.mul_base(senderPrivateKey))
+ print("Sender's private key : ", hex(senderPrivateKey))
+ print("Sender's public key : ", compress_point(senderPublicKey))
+ print("\n")
+ (enKeySender, ciPublicKeySender) = getEnKey(senderPublicKey)
+ print("Sender's ciphertext public key : ", compress_point(ciPublicKeySender))
+ print("Sender's encryption key : ", compress_point(enKeySender))
+ print("\n")
+ receiverPrivateKey = secrets.randbelow(curve.field.n)
+ receiverPublicKey = engine.to_point(engine.mul_base(receiverPrivateKey))
+ print("Receiver's private key : ",hex(receiverPrivateKey))
+ print("Receiver's public key :",compress_point(receiverPublicKey))
+ print("\n")
+ (enKeyReceiver,ciPublicKeyReceiver) = getEnKey(receiverPublicKey)
+ print("Receiver's ciphertext public key : ",compress_point(ciPublicKeyReceiver))
+ print("Receiver encryption key : ",compress_point(enKeyReceiver))
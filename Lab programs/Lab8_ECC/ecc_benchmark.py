@@ -0,0 +1,66 @@
+"""
+Scalar multiplication keys/sec: tinyec vs the Jacobian engine, for the
+fixed base (k * G, comb table) and a variable base (k * P, wNAF), then
+ephemeral ECDH key derivation one key at a time vs batched.
+
+    python ecc_benchmark.py [count] [curve] [workers]
+"""
+import os
+import secrets
+import sys
+import time
+
+from tinyec import registry
+
+from ec_engine import ecdh_batch, get_engine
+
+
+def rate(fn, items):
+    start = time.perf_counter()
+    results = [fn(item) for item in items]
+    return results, len(items) / (time.perf_counter() - start)
+
+
+def main(count=1000, name="brainpoolP256r1", workers=os.cpu_count()):
+    count, workers = int(count), int(workers)
+    curve = registry.get_curve(name)
+    start = time.perf_counter()
+    engine = get_engine(name)
+    print(f"{name}: comb table built in {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    scalars = [secrets.randbelow(curve.field.n) for _ in range(count)]
+    sample = scalars[:max(1, count // 20)]  # tinyec is slow; time it on a sample
+    peer = secrets.randbelow(curve.field.n) * curve.g
+
+    reference, tinyec_base = rate(lambda k: k * curve.g, sample)
+    fast, engine_base = rate(engine.mul_base, scalars)
+    assert [engine.to_point(xy) for xy in fast[:len(sample)]] == reference
+    print(f"fixed base     tinyec {tinyec_base:8.0f} keys/s   engine {engine_base:8.0f} keys/s  "
+          f"({engine_base / tinyec_base:.0f}x)")
+
+    reference, tinyec_var = rate(lambda k: k * peer, sample)
+    fast, engine_var = rate(lambda k: engine.mul(k, peer), scalars)
+    assert [engine.to_point(xy) for xy in fast[:len(sample)]] == reference
+    print(f"variable base  tinyec {tinyec_var:8.0f} keys/s   engine {engine_var:8.0f} keys/s  "
+          f"({engine_var / tinyec_var:.0f}x)")
+
+    print(f"\nEphemeral ECDH for {count} recipients (k * G and k * P per recipient)")
+    recipients = [secrets.randbelow(curve.field.n) for _ in range(count)]
+    peers = engine.mul_base_many(recipients)
+    start = time.perf_counter()
+    single = [(engine.mul_base(k), engine.mul(k, q)) for k, q in zip(scalars, peers)]
+    report("one at a time", count, time.perf_counter() - start)
+    for label, w in (("batched", 1), (f"batched, {workers} workers", workers)):
+        start = time.perf_counter()
+        publics, shared = ecdh_batch(name, scalars, peers, workers=w)
+        report(label, count, time.perf_counter() - start)
+        assert list(zip(publics, shared)) == single
+    assert all(engine.mul(r, e) == s for r, e, s in zip(recipients[:20], publics, shared))
+
+
+def report(label, count, seconds):
+    print(f"  {label:<24} {count / seconds:8.0f} keys/s   {seconds / count * 1e6:8.1f} us/key")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
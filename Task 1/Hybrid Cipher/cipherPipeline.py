@@ -0,0 +1,237 @@
+"""
+Composable classical cipher pipeline (a generalisation of hybrid_encrypt).
+
+A scheme is declared as a chain of stages:
+- Substitution stages (Caesar, Vigenere, Monoalphabetic) are periodic families
+  of 26-letter tables. Adjacent substitutions are fused into one family, so any
+  run of them costs a single table lookup per letter.
+- Transposition stages (RailFence, Columnar) are index permutations. Adjacent
+  transpositions are composed into one permutation, applied as a single gather.
+
+Case is preserved and non-letters pass through every substitution unchanged;
+like the Vigenere module, keys advance over letters only.
+"""
+from math import lcm
+
+import numpy as np
+
+from hybridCipher import (FRAME_SIZE, _from_codes, _to_codes, frames, index_dtype, permutation_cache,
+                          rail_fence_permutation, rank_dtype)
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class Caesar:
+    def __init__(self, shift):
+        self.shift = shift
+
+    def tables(self):
+        return ((np.arange(26) + self.shift) % 26)[None, :]
+
+
+class Vigenere:
+    def __init__(self, key):
+        shifts = [ord(c) - ord('A') for c in key.upper() if 'A' <= c <= 'Z']
+        if not shifts:
+            raise ValueError("Key must contain at least one letter.")
+        self.key = key
+        self.shifts = np.array(shifts)
+
+    def tables(self):
+        return (np.arange(26)[None, :] + self.shifts[:, None]) % 26
+
+
+class Monoalphabetic:
+    def __init__(self, key):
+        key = "".join(key).upper()
+        if sorted(key) != list(ALPHABET):
+            raise ValueError("Key must be a permutation of the 26 letters.")
+        self.key = key
+
+    def tables(self):
+        return np.array([[ord(c) - ord('A') for c in self.key]])
+
+
+class RailFence:
+    def __init__(self, rails):
+        self.rails = rails
+
+    def permutation(self, length):
+        return rail_fence_permutation(length, self.rails)
+
+
+class Columnar:
+    """
+    Columnar transposition: text is written row by row under the key and
+    read column by column in alphabetical order of the key letters.
+    """
+
+    def __init__(self, key):
+        if not key:
+            raise ValueError("Key must not be empty.")
+        self.key = key
+        self.rank = np.argsort(np.argsort(list(key.upper()), kind="stable"), kind="stable")
+
+    def permutation(self, length):
+        return _columnar_permutation(length, tuple(self.rank))
+
+
+@permutation_cache
+def _columnar_permutation(length, rank):
+    columns = np.asarray(rank, dtype=rank_dtype(len(rank)))[np.arange(length) % len(rank)]
+    return np.argsort(columns, kind="stable").astype(index_dtype(length))
+
+
+STAGES = {
+    "caesar": lambda cfg: Caesar(cfg["shift"]),
+    "vigenere": lambda cfg: Vigenere(cfg["key"]),
+    "monoalphabetic": lambda cfg: Monoalphabetic(cfg["key"]),
+    "rail_fence": lambda cfg: RailFence(cfg["rails"]),
+    "columnar": lambda cfg: Columnar(cfg["key"]),
+}
+
+
+class _Substitution:
+    """
+    Fused run of substitution stages: tables[k] is used for the k-th letter
+    (mod period), and inverse[k] undoes it.
+    """
+
+    def __init__(self, stages):
+        tables = stages[0].tables()
+        for stage in stages[1:]:
+            nxt = stage.tables()
+            period = lcm(len(tables), len(nxt))
+            phase = np.arange(period)
+            tables = nxt[phase % len(nxt)][phase[:, None], tables[phase % len(tables)]]
+        self.period = len(tables)
+        self.forward = tables.astype(np.uint8)
+        self.inverse = np.argsort(tables, axis=1).astype(np.uint8)
+
+    def apply(self, codes, phase, decrypt):
+        """
+        Returns the substituted codes and the key phase after them.
+        """
+        upper = (codes >= 65) & (codes <= 90)
+        letters = np.flatnonzero(upper | ((codes >= 97) & (codes <= 122)))
+        if len(letters) == 0:
+            return codes, phase
+        base = np.where(upper[letters], 65, 97).astype(np.uint8)
+        index = (codes[letters] - base).astype(np.intp)
+        table = self.inverse if decrypt else self.forward
+        out = codes.copy()
+        out[letters] = table[(np.arange(len(letters)) + phase) % self.period, index] + base
+        return out, (phase + len(letters)) % self.period
+
+
+class _Transposition:
+    """
+    Fused run of transposition stages, composed into one permutation per length.
+    The last composed permutation is kept, so same-size frames reuse it.
+    """
+
+    def __init__(self, stages):
+        self.stages = stages
+        self._last = (None, None)
+
+    def permutation(self, length):
+        if self._last[0] == length:
+            return self._last[1]
+        perm = self.stages[0].permutation(length)
+        for stage in self.stages[1:]:
+            perm = perm[stage.permutation(length)]
+        self._last = (length, perm)
+        return perm
+
+    def apply(self, codes, decrypt):
+        perm = self.permutation(len(codes))
+        if not decrypt:
+            return codes[perm]
+        out = np.empty_like(codes)
+        out[perm] = codes
+        return out
+
+
+class CipherPipeline:
+    """
+    Chain of cipher stages compiled into fused substitution/transposition steps.
+
+        pipeline = CipherPipeline([Caesar(3), Vigenere("KEY"), RailFence(3)])
+        pipeline = CipherPipeline.from_config([{"type": "caesar", "shift": 3},
+                                               {"type": "rail_fence", "rails": 3}])
+    """
+
+    def __init__(self, stages):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage.")
+        self.steps = []
+        run = [stages[0]]
+        for stage in stages[1:]:
+            if _is_substitution(stage) == _is_substitution(run[-1]):
+                run.append(stage)
+            else:
+                self.steps.append(_fuse(run))
+                run = [stage]
+        self.steps.append(_fuse(run))
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Builds a pipeline from a list of dicts such as {"type": "caesar", "shift": 3}.
+        """
+        return cls([STAGES[cfg["type"]](cfg) for cfg in config])
+
+    @property
+    def streamable(self):
+        """
+        True when there are no transpositions, so any chunking gives the same result.
+        """
+        return all(isinstance(step, _Substitution) for step in self.steps)
+
+    def _run(self, data, phases, decrypt):
+        codes = _to_codes(data)
+        steps = list(enumerate(self.steps))
+        for i, step in (reversed(steps) if decrypt else steps):
+            if isinstance(step, _Substitution):
+                codes, phases[i] = step.apply(codes, phases[i], decrypt)
+            else:
+                codes = step.apply(codes, decrypt)
+        return _from_codes(codes, data)
+
+    def encrypt(self, text):
+        return self._run(text, [0] * len(self.steps), False)
+
+    def decrypt(self, text):
+        return self._run(text, [0] * len(self.steps), True)
+
+    def stream(self, chunks, decrypt=False, frame_size=FRAME_SIZE):
+        """
+        Runs the pipeline over a generator of str/bytes chunks in one pass.
+        - Without transpositions every chunk is processed as it arrives.
+        - With transpositions input is regrouped into frames of frame_size and
+          each frame is transposed on its own, so both sides must agree on it.
+        Substitution key phases carry across chunks and frames.
+        """
+        phases = [0] * len(self.steps)
+        if self.streamable:
+            for chunk in chunks:
+                yield self._run(chunk, phases, decrypt)
+            return
+        for frame in frames(chunks, frame_size):
+            yield self._run(frame, phases, decrypt)
+
+
+def _is_substitution(stage):
+    return hasattr(stage, "tables")
+
+
+def _fuse(run):
+    return _Substitution(run) if _is_substitution(run[0]) else _Transposition(run)
+
+
+if __name__ == "__main__":
+    plaintext = input("Enter the plain text")
+    pipeline = CipherPipeline([Caesar(3), Vigenere("KEY"), RailFence(3), Columnar("ZEBRA")])
+    encrypted_text = pipeline.encrypt(plaintext)
+    print("Encrypted:", encrypted_text)
+    print("Decrypted:", pipeline.decrypt(encrypted_text))
@@ -1,67 +1,150 @@
-def caesar_cipher(text, shift):
-    result = ""
-    for char in text:
-        if char.isalpha():
-            shift_base = 65 if char.isupper() else 97
-            result += chr((ord(char) - shift_base + shift) % 26 + shift_base)
-        else:
-            result += char  # Keep spaces or special characters unchanged
-    return result
-
-
-def caesar_decipher(text, shift):
-    return caesar_cipher(text, -shift)
+import os
+import sys
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Lab programs",
+                             "Lab1_Ceasure Cipher"))  # shared Caesar cipher and cracker
+from ceasureCipher import crack_caesar, crack_caesar_batch, decrypt as caesar_decipher, encrypt as caesar_cipher
+
+FRAME_SIZE = 1 << 20  # characters per frame when streaming rail fence
+PERMUTATION_CACHE_BYTES = 64 << 20  # total size of the cached permutation arrays
+
+
+def permutation_cache(build):
+    """
+    Memoises a permutation builder by its arguments, evicting the least
+    recently used arrays once they take more than PERMUTATION_CACHE_BYTES
+    together (a count limit would let a few huge messages pin gigabytes).
+    """
+    cache = OrderedDict()
+    lock = threading.Lock()
+    total = 0
+
+    @wraps(build)
+    def cached(*args):
+        nonlocal total
+        with lock:
+            perm = cache.get(args)
+            if perm is not None:
+                cache.move_to_end(args)
+                return perm
+        perm = build(*args)
+        perm.setflags(write=False)
+        if perm.nbytes <= PERMUTATION_CACHE_BYTES:
+            with lock:
+                if args not in cache:
+                    cache[args] = perm
+                    total += perm.nbytes
+                while total > PERMUTATION_CACHE_BYTES:
+                    total -= cache.popitem(last=False)[1].nbytes
+        return perm
+
+    def cache_clear():
+        nonlocal total
+        with lock:
+            cache.clear()
+            total = 0
+
+    cached.cache_clear = cache_clear
+    return cached
+
+
+def index_dtype(length):
+    """
+    Smallest index type for arrays of `length` items (int32 halves the
+    memory of the default int64 for anything under 2^31 characters).
+    """
+    return np.int32 if length < 1 << 31 else np.intp
+
+
+def rank_dtype(count):
+    """
+    Type for sort keys in range(count): uint16, which numpy's stable argsort
+    radix-sorts, when they fit, else a full index type.
+    """
+    return np.uint16 if count <= 1 << 16 else index_dtype(count)
+
+
+@permutation_cache
+def rail_fence_permutation(length, key):
+    """
+    Zigzag permutation for a message of `length` characters on `key` rails.
+    cipher[j] = text[perm[j]]; computed arithmetically in O(n) (with up to
+    2^16 rails the rail numbers fit in uint16, so the stable argsort is a
+    radix sort). Cached per (length, key) so messages of the same size reuse it.
+    """
+    if key <= 1 or length <= key:
+        return np.arange(length, dtype=index_dtype(length))  # every character stays in place
+    cycle = 2 * (key - 1)
+    phase = np.arange(length) % cycle
+    rails = np.minimum(phase, cycle - phase).astype(rank_dtype(key))
+    return np.argsort(rails, kind="stable").astype(index_dtype(length))
+
+
+def _to_codes(data):
+    if isinstance(data, str):
+        if data.isascii():
+            return np.frombuffer(data.encode("ascii"), dtype=np.uint8)
+        return np.frombuffer(data.encode("utf-32-le"), dtype=np.uint32)
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def _from_codes(codes, like):
+    if isinstance(like, str):
+        return codes.tobytes().decode("ascii" if codes.dtype == np.uint8 else "utf-32-le")
+    return codes.tobytes()
 
 
 def rail_fence_encrypt(text, key):
-    rail = [['\n' for _ in range(len(text))] for _ in range(key)]
-    direction_down = False
-    row, col = 0, 0
-
-    for char in text:
-        if row == 0 or row == key - 1:
-            direction_down = not direction_down
-        rail[row][col] = char
-        col += 1
-        row += 1 if direction_down else -1
-
-    result = ''.join([''.join(row) for row in rail if row != '\n'])
-    return result.replace('\n', '')
+    codes = _to_codes(text)
+    return _from_codes(codes[rail_fence_permutation(len(codes), key)], text)
 
 
 def rail_fence_decrypt(cipher, key):
-    rail = [['\n' for _ in range(len(cipher))] for _ in range(key)]
-    direction_down = None
-    row, col = 0, 0
-
-    for i in range(len(cipher)):
-        if row == 0:
-            direction_down = True
-        if row == key - 1:
-            direction_down = False
-        rail[row][col] = '*'
-        col += 1
-        row += 1 if direction_down else -1
-
-    index = 0
-    for i in range(key):
-        for j in range(len(cipher)):
-            if rail[i][j] == '*' and index < len(cipher):
-                rail[i][j] = cipher[index]
-                index += 1
-
-    result = []
-    row, col = 0, 0
-    for i in range(len(cipher)):
-        if row == 0:
-            direction_down = True
-        if row == key - 1:
-            direction_down = False
-        result.append(rail[row][col])
-        col += 1
-        row += 1 if direction_down else -1
-
-    return ''.join(result)
+    codes = _to_codes(cipher)
+    result = np.empty_like(codes)
+    result[rail_fence_permutation(len(codes), key)] = codes
+    return _from_codes(result, cipher)
+
+
+def rail_fence_stream(chunks, key, frame_size=FRAME_SIZE, decrypt=False):
+    """
+    Applies rail fence to an unbounded stream of str/bytes chunks.
+    Input is regrouped into fixed-size frames and every frame is
+    transposed on its own (the last frame may be shorter), so the
+    decrypting side must use the same frame_size.
+    Yields one transformed frame at a time.
+    """
+    transform = rail_fence_decrypt if decrypt else rail_fence_encrypt
+    for frame in frames(chunks, frame_size):
+        yield transform(frame, key)
+
+
+def frames(chunks, frame_size):
+    """
+    Regroups str/bytes chunks into frames of frame_size (the last may be
+    shorter). Chunks are collected in a list and joined once per frame, so
+    many small chunks cost O(n) rather than recopying a growing buffer.
+    """
+    pending, size = [], 0
+    for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        if size < frame_size:
+            continue
+        buffer = pending[0][:0].join(pending)
+        start = 0
+        while len(buffer) - start >= frame_size:
+            yield buffer[start:start + frame_size]
+            start += frame_size
+        rest = buffer[start:]
+        pending, size = ([rest] if rest else []), len(rest)
+    if size:
+        yield pending[0][:0].join(pending)
 
 
 def hybrid_encrypt(text, shift, rail_key):
@@ -76,13 +159,14 @@ def hybrid_decrypt(cipher, shift, rail_key):
     return caesar_decrypted
 
 
-# Example Usage
-plaintext = input("Enter the plain text")
-shift = int(input("Enter the shift key"))
-rail_key =int(input("Enter the rail key"))
+if __name__ == "__main__":
+    # Example Usage
+    plaintext = input("Enter the plain text")
+    shift = int(input("Enter the shift key"))
+    rail_key =int(input("Enter the rail key"))
 
-encrypted_text = hybrid_encrypt(plaintext, shift, rail_key)
-print("Encrypted:", encrypted_text)
+    encrypted_text = hybrid_encrypt(plaintext, shift, rail_key)
+    print("Encrypted:", encrypted_text)
 
-decrypted_text = hybrid_decrypt(encrypted_text, shift, rail_key)
-print("Decrypted:", decrypted_text)
+    decrypted_text = hybrid_decrypt(encrypted_text, shift, rail_key)
+    print("Decrypted:", decrypted_text)
@@ -0,0 +1,223 @@
+"""
+Vigenere key recovery (ciphertext-only) for auditing text encrypted with
+encrypt_vigenere / vignereCipher.
+
+- Key length estimation with the index of coincidence and Kasiski repeat
+  distances, used to shortlist the lengths worth decoding.
+- Chi-square scoring of all 26 shifts of every column at once.
+- Optional process-pool fan-out across key lengths and across many ciphertexts.
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from vignereCipher import decrypt_vigenere
+
+# Relative letter frequencies of English text (A-Z)
+ENGLISH_FREQ = np.array([
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966,
+    0.00153, 0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987,
+    0.06327, 0.09056, 0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+])
+ENGLISH_FREQ = ENGLISH_FREQ / ENGLISH_FREQ.sum()
+ENGLISH_IOC = float((ENGLISH_FREQ ** 2).sum())  # ~0.066
+
+# _SHIFT_INDEX[s, p] is the ciphertext letter that decrypts to p under shift s
+_SHIFT_INDEX = (np.arange(26)[None, :] + np.arange(26)[:, None]) % 26
+
+KeyCandidate = namedtuple("KeyCandidate", ["key", "length", "score", "ioc", "kasiski"])
+
+
+def letter_stream(text):
+    """
+    Letters of str/bytes text as a uint8 array of 0-25, case-insensitive.
+    Non-letters are dropped, matching how the key advances during encryption.
+    """
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    codes = np.frombuffer(text, dtype=np.uint8) | 0x20  # fold case
+    return codes[(codes >= 97) & (codes <= 122)] - 97
+
+
+def _column_counts(letters, length):
+    cols = np.arange(len(letters)) % length
+    return np.bincount(cols * 26 + letters, minlength=length * 26).reshape(length, 26)
+
+
+def index_of_coincidence(letters, length):
+    """
+    Mean index of coincidence of the columns for a given key length.
+    """
+    return _ioc(_column_counts(letters, length).astype(np.float64))
+
+
+def _ioc(counts):
+    n = counts.sum(axis=1)
+    valid = n > 1
+    ioc = (counts * (counts - 1)).sum(axis=1)[valid] / (n[valid] * (n[valid] - 1))
+    return float(ioc.mean()) if len(ioc) else 0.0
+
+
+def kasiski_distances(letters, ngram=3):
+    """
+    Distances between consecutive repeats of every n-gram in the letter stream.
+    """
+    if len(letters) <= ngram:
+        return np.empty(0, dtype=np.int64)
+    codes = np.zeros(len(letters) - ngram + 1, dtype=np.int64)
+    for i in range(ngram):
+        codes = codes * 26 + letters[i:len(letters) - ngram + 1 + i]
+    order = np.argsort(codes, kind="stable")
+    ordered = codes[order]
+    same = ordered[1:] == ordered[:-1]
+    return (order[1:] - order[:-1])[same]
+
+
+def kasiski_support(distances, length):
+    """
+    Share of repeat distances divisible by length, scaled so that 1.0 means chance.
+    """
+    if len(distances) == 0:
+        return 0.0
+    return float(np.count_nonzero(distances % length == 0)) / len(distances) * length
+
+
+def estimate_key_lengths(ciphertext, max_length=20):
+    """
+    Ranks key lengths 1..max_length by how close their column IoC is to English.
+    Returns a list of (length, ioc, kasiski) tuples, best first.
+    """
+    letters = letter_stream(ciphertext)
+    return _rank_lengths(letters, kasiski_distances(letters), min(max_length, max(len(letters) // 2, 1)))
+
+
+def _rank_lengths(letters, distances, max_length):
+    ranked = []
+    for length in range(1, max_length + 1):
+        ranked.append((length, index_of_coincidence(letters, length), kasiski_support(distances, length)))
+    ranked.sort(key=lambda r: (abs(r[1] - ENGLISH_IOC), -r[2]))
+    return ranked
+
+
+def shortlist_key_lengths(letters, distances, max_length, size):
+    """
+    Key lengths worth decoding: the `size` best by column IoC, plus the
+    size // 2 best by Kasiski support (which catches lengths whose columns
+    are too short for a stable IoC). Returns them in ascending order.
+    """
+    ranked = _rank_lengths(letters, distances, max_length)
+    by_kasiski = sorted(ranked, key=lambda r: -r[2])
+    return sorted({r[0] for r in ranked[:size]} | {r[0] for r in by_kasiski[:size // 2]})
+
+
+def chi_square_shifts(letters, length):
+    """
+    Chi-square statistic of every column against English for all 26 shifts.
+    Returns an array of shape (length, 26).
+    """
+    return _chi_square(_column_counts(letters, length).astype(np.float64))
+
+
+def _chi_square(counts):
+    expected = counts.sum(axis=1)[:, None, None] * ENGLISH_FREQ[None, None, :]
+    observed = counts[:, _SHIFT_INDEX]  # (length, shift, plain letter)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        chi = ((observed - expected) ** 2 / expected).sum(axis=2)
+    return np.nan_to_num(chi, nan=0.0)
+
+
+def _score_length(letters, length, distances):
+    counts = _column_counts(letters, length).astype(np.float64)
+    chi = _chi_square(counts)
+    shifts = chi.argmin(axis=1)
+    key = "".join(chr(65 + int(s)) for s in shifts)
+    score = float(chi[np.arange(length), shifts].sum()) / len(letters)
+    return KeyCandidate(key, length, score, _ioc(counts), kasiski_support(distances, length))
+
+
+def _score_length_job(args):
+    return _score_length(*args)
+
+
+def _shortest_period(key):
+    for length in range(1, len(key)):
+        if len(key) % length == 0 and key[:length] * (len(key) // length) == key:
+            return key[:length]
+    return key
+
+
+def crack_vigenere(ciphertext, max_length=20, top=5, workers=None, shortlist=8):
+    """
+    Recovers likely keys for a Vigenere ciphertext.
+    - Key lengths up to max_length are shortlisted by index of coincidence
+      and Kasiski support (shortlist_key_lengths); shortlist=None keeps all.
+    - Each shortlisted length is scored by the best per-column chi-square.
+    - Keys that are repetitions of a shorter candidate are folded into it.
+    - workers > 1 spreads the key lengths over a process pool.
+    Returns up to `top` KeyCandidate tuples ranked by score (lower is better).
+    """
+    letters = letter_stream(ciphertext)
+    if len(letters) == 0:
+        return []
+    distances = kasiski_distances(letters)
+    max_length = min(max_length, len(letters))
+    if shortlist is None or shortlist >= max_length:
+        lengths = range(1, max_length + 1)
+    else:
+        lengths = shortlist_key_lengths(letters, distances, max_length, shortlist)
+    jobs = [(letters, length, distances) for length in lengths]
+    if workers and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            scored = list(pool.map(_score_length_job, jobs))
+    else:
+        scored = [_score_length(*job) for job in jobs]
+    scored.sort(key=lambda c: c.score)
+    seen, ranked = set(), []
+    for candidate in scored:
+        key = _shortest_period(candidate.key)
+        if key in seen:
+            continue
+        seen.add(key)
+        ranked.append(candidate._replace(key=key, length=len(key)))
+        if len(ranked) == top:
+            break
+    return ranked
+
+
+def _crack_job(args):
+    ciphertext, max_length, top = args
+    return crack_vigenere(ciphertext, max_length, top)
+
+
+def crack_many(ciphertexts, max_length=20, top=5, workers=None):
+    """
+    Runs crack_vigenere over many ciphertexts, one process-pool task per ciphertext.
+    Returns a list of candidate lists in input order.
+    """
+    jobs = [(c, max_length, top) for c in ciphertexts]
+    if workers == 1:
+        return [_crack_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_crack_job, jobs, chunksize=max(1, len(jobs) // 64)))
+
+
+def recover_plaintext(ciphertext, max_length=20):
+    """
+    Decrypts ciphertext with the best recovered key.
+    Returns (key, plaintext), or (None, ciphertext) if there are no letters.
+    """
+    candidates = crack_vigenere(ciphertext, max_length, top=1)
+    if not candidates:
+        return None, ciphertext
+    key = candidates[0].key
+    return key, decrypt_vigenere(ciphertext, key)
+
+
+if __name__ == "__main__":
+    ciphertext = input("Enter the ciphertext\n")
+    for candidate in crack_vigenere(ciphertext):
+        print(f"Key: {candidate.key:<20} score={candidate.score:.3f} ioc={candidate.ioc:.4f} kasiski={candidate.kasiski:.2f}")
+    key, plaintext = recover_plaintext(ciphertext)
+    print(f"Best key: {key}")
+    print(f"Plaintext: {plaintext}")
@@ -1,49 +1,114 @@
+from functools import lru_cache
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 20  # 1 MiB per read when streaming files
+
+
 def generate_key(msg, key):
-    key = list(key)
-    if len(msg) == len(key):
-        return key
-    else:
-        for i in range(len(msg) - len(key)):
-            key.append(key[i % len(key)])
-    return "".join(key)
+    """
+    Repeats the key until it is as long as the message.
+    """
+    return (key * (len(msg) // len(key) + 1))[:len(msg)]
+
+
+@lru_cache(maxsize=64)
+def _key_shifts(key):
+    """
+    Shift vector (0-25) for the letters of the key, built once per key.
+    """
+    shifts = np.array([ord(c) - ord('A') for c in key.upper() if 'A' <= c <= 'Z'], dtype=np.int16)
+    if len(shifts) == 0:
+        raise ValueError("Key must contain at least one letter.")
+    shifts.setflags(write=False)
+    return shifts
+
+
+def _to_codes(data):
+    if isinstance(data, str):
+        if data.isascii():
+            return np.frombuffer(data.encode("ascii"), dtype=np.uint8)
+        return np.frombuffer(data.encode("utf-32-le"), dtype=np.uint32)
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def _from_codes(codes, like):
+    if isinstance(like, str):
+        return codes.tobytes().decode("ascii" if codes.dtype == np.uint8 else "utf-32-le")
+    return codes.tobytes()
+
+
+def _vigenere(data, key, sign, phase=0):
+    """
+    Vectorized Vigenere over str or bytes.
+    - Only A-Z and a-z are shifted, case is kept and everything else passes through.
+    - The key advances over alphabetic positions only, starting at `phase`.
+    Returns the transformed data and the key phase for the next chunk.
+    """
+    shifts = _key_shifts(key)
+    codes = _to_codes(data)
+    upper = (codes >= 65) & (codes <= 90)
+    letters = np.flatnonzero(upper | ((codes >= 97) & (codes <= 122)))
+    if len(letters) == 0:
+        return data, phase
+    # Tile the key stream over the letters only, rotated to the current phase.
+    stream = np.resize(np.roll(shifts, -phase), len(letters))
+    base = np.where(upper[letters], 65, 97).astype(np.int16)
+    out = codes.copy()
+    out[letters] = (codes[letters].astype(np.int16) - base + sign * stream) % 26 + base
+    return _from_codes(out, data), (phase + len(letters)) % len(shifts)
+
 
 def encrypt_vigenere(msg, key):
-    encrypted_text = []
-    key = generate_key(msg, key)
-    for i in range(len(msg)):
-        char = msg[i]
-        if char.isupper():
-            encrypted_char = chr((ord(char) + ord(key[i]) - 2 * ord('A')) % 26 + ord('A'))
-        elif char.islower():
-            encrypted_char = chr((ord(char) + ord(key[i]) - 2 * ord('a')) % 26 + ord('a'))
-        else:
-            encrypted_char = char
-        encrypted_text.append(encrypted_char)
-    return "".join(encrypted_text)
+    return _vigenere(msg, key, 1)[0]
+
 
 def decrypt_vigenere(msg, key):
-    decrypted_text = []
-    key = generate_key(msg, key)
-    for i in range(len(msg)):
-        char = msg[i]
-        if char.isupper():
-            decrypted_char = chr((ord(char) - ord(key[i]) + 26) % 26 + ord('A'))
-        elif char.islower():
-            decrypted_char = chr((ord(char) - ord(key[i]) + 26) % 26 + ord('a'))
-        else:
-            decrypted_char = char
-        decrypted_text.append(decrypted_char)
-    return "".join(decrypted_text)
-
-# Example usage
-text_to_encrypt = "Hello, World!"
-key = "KEY"
-
-encrypted_text = encrypt_vigenere(text_to_encrypt, key)
-print(f"Encrypted Text: {encrypted_text}")
-
-decrypted_text = decrypt_vigenere(encrypted_text, key)
-print(f"Decrypted Text: {decrypted_text}")
+    return _vigenere(msg, key, -1)[0]
+
+
+class VigenereStream:
+    """
+    Chunked Vigenere whose key phase carries across chunks,
+    so a large input can be processed piece by piece with the same result
+    as processing it in one go.
+    """
+
+    def __init__(self, key, decrypt=False):
+        _key_shifts(key)  # validate early
+        self.key = key
+        self.sign = -1 if decrypt else 1
+        self.phase = 0
+
+    def update(self, chunk):
+        result, self.phase = _vigenere(chunk, self.key, self.sign, self.phase)
+        return result
+
+    def process_file(self, src_path, dst_path, chunk_size=CHUNK_SIZE):
+        """
+        Streams a file through the cipher in fixed-size chunks.
+        Returns the number of bytes written.
+        """
+        written = 0
+        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                written += dst.write(self.update(chunk))
+        return written
+
+
+if __name__ == "__main__":
+    # Example usage
+    text_to_encrypt = "Hello, World!"
+    key = "KEY"
+
+    encrypted_text = encrypt_vigenere(text_to_encrypt, key)
+    print(f"Encrypted Text: {encrypted_text}")
+
+    decrypted_text = decrypt_vigenere(encrypted_text, key)
+    print(f"Decrypted Text: {decrypted_text}")
 
 #previous code was only support the upper case letters
-#this code can be apply on both
\ No newline at end of file
+#this code can be apply on both
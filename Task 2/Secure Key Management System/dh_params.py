@@ -0,0 +1,265 @@
+"""
+Diffie-Hellman parameter provider.
+
+- The RFC 3526 MODP groups and RFC 7919 ffdhe groups are built in and load
+  instantly (no prime generation).
+- Parameters generated with generate() are cached on disk, one PEM file per
+  (key size, generator), and validated when loaded.
+- Fresh generation runs in a background process and only when requested,
+  so process startup never waits for a safe prime.
+
+    provider = DHParameterProvider()
+    parameters = provider.get(2048)          # cached or ffdhe2048
+    future = provider.generate(2048, 5)      # background, result cached on disk
+"""
+import glob
+import hashlib
+import os
+import secrets
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import dh
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "dh_parameters")
+
+# Primes from RFC 3526 (modpN) and RFC 7919 (ffdheN); all use generator 2.
+GROUPS = {
+    "modp2048": """
+        FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74
+        020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F1437
+        4FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED
+        EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF05
+        98DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB
+        9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3B
+        E39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF695581718
+        3995497CEA956AE515D2261898FA051015728E5A8AACAA68FFFFFFFFFFFFFFFF
+    """,
+    "modp3072": """
+        FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74
+        020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F1437
+        4FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED
+        EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF05
+        98DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB
+        9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3B
+        E39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF695581718
+        3995497CEA956AE515D2261898FA051015728E5A8AAAC42DAD33170D04507A33
+        A85521ABDF1CBA64ECFB850458DBEF0A8AEA71575D060C7DB3970F85A6E1E4C7
+        ABF5AE8CDB0933D71E8C94E04A25619DCEE3D2261AD2EE6BF12FFA06D98A0864
+        D87602733EC86A64521F2B18177B200CBBE117577A615D6C770988C0BAD946E2
+        08E24FA074E5AB3143DB5BFCE0FD108E4B82D120A93AD2CAFFFFFFFFFFFFFFFF
+    """,
+    "modp4096": """
+        FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74
+        020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F1437
+        4FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED
+        EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF05
+        98DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB
+        9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3B
+        E39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF695581718
+        3995497CEA956AE515D2261898FA051015728E5A8AAAC42DAD33170D04507A33
+        A85521ABDF1CBA64ECFB850458DBEF0A8AEA71575D060C7DB3970F85A6E1E4C7
+        ABF5AE8CDB0933D71E8C94E04A25619DCEE3D2261AD2EE6BF12FFA06D98A0864
+        D87602733EC86A64521F2B18177B200CBBE117577A615D6C770988C0BAD946E2
+        08E24FA074E5AB3143DB5BFCE0FD108E4B82D120A92108011A723C12A787E6D7
+        88719A10BDBA5B2699C327186AF4E23C1A946834B6150BDA2583E9CA2AD44CE8
+        DBBBC2DB04DE8EF92E8EFC141FBECAA6287C59474E6BC05D99B2964FA090C3A2
+        233BA186515BE7ED1F612970CEE2D7AFB81BDD762170481CD0069127D5B05AA9
+        93B4EA988D8FDDC186FFB7DC90A6C08F4DF435C934063199FFFFFFFFFFFFFFFF
+    """,
+    "ffdhe2048": """
+        FFFFFFFFFFFFFFFFADF85458A2BB4A9AAFDC5620273D3CF1D8B9C583CE2D3695
+        A9E13641146433FBCC939DCE249B3EF97D2FE363630C75D8F681B202AEC4617A
+        D3DF1ED5D5FD65612433F51F5F066ED0856365553DED1AF3B557135E7F57C935
+        984F0C70E0E68B77E2A689DAF3EFE8721DF158A136ADE73530ACCA4F483A797A
+        BC0AB182B324FB61D108A94BB2C8E3FBB96ADAB760D7F4681D4F42A3DE394DF4
+        AE56EDE76372BB190B07A7C8EE0A6D709E02FCE1CDF7E2ECC03404CD28342F61
+        9172FE9CE98583FF8E4F1232EEF28183C3FE3B1B4C6FAD733BB5FCBC2EC22005
+        C58EF1837D1683B2C6F34A26C1B2EFFA886B423861285C97FFFFFFFFFFFFFFFF
+    """,
+    "ffdhe3072": """
+        FFFFFFFFFFFFFFFFADF85458A2BB4A9AAFDC5620273D3CF1D8B9C583CE2D3695
+        A9E13641146433FBCC939DCE249B3EF97D2FE363630C75D8F681B202AEC4617A
+        D3DF1ED5D5FD65612433F51F5F066ED0856365553DED1AF3B557135E7F57C935
+        984F0C70E0E68B77E2A689DAF3EFE8721DF158A136ADE73530ACCA4F483A797A
+        BC0AB182B324FB61D108A94BB2C8E3FBB96ADAB760D7F4681D4F42A3DE394DF4
+        AE56EDE76372BB190B07A7C8EE0A6D709E02FCE1CDF7E2ECC03404CD28342F61
+        9172FE9CE98583FF8E4F1232EEF28183C3FE3B1B4C6FAD733BB5FCBC2EC22005
+        C58EF1837D1683B2C6F34A26C1B2EFFA886B4238611FCFDCDE355B3B6519035B
+        BC34F4DEF99C023861B46FC9D6E6C9077AD91D2691F7F7EE598CB0FAC186D91C
+        AEFE130985139270B4130C93BC437944F4FD4452E2D74DD364F2E21E71F54BFF
+        5CAE82AB9C9DF69EE86D2BC522363A0DABC521979B0DEADA1DBF9A42D5C4484E
+        0ABCD06BFA53DDEF3C1B20EE3FD59D7C25E41D2B66C62E37FFFFFFFFFFFFFFFF
+    """,
+    "ffdhe4096": """
+        FFFFFFFFFFFFFFFFADF85458A2BB4A9AAFDC5620273D3CF1D8B9C583CE2D3695
+        A9E13641146433FBCC939DCE249B3EF97D2FE363630C75D8F681B202AEC4617A
+        D3DF1ED5D5FD65612433F51F5F066ED0856365553DED1AF3B557135E7F57C935
+        984F0C70E0E68B77E2A689DAF3EFE8721DF158A136ADE73530ACCA4F483A797A
+        BC0AB182B324FB61D108A94BB2C8E3FBB96ADAB760D7F4681D4F42A3DE394DF4
+        AE56EDE76372BB190B07A7C8EE0A6D709E02FCE1CDF7E2ECC03404CD28342F61
+        9172FE9CE98583FF8E4F1232EEF28183C3FE3B1B4C6FAD733BB5FCBC2EC22005
+        C58EF1837D1683B2C6F34A26C1B2EFFA886B4238611FCFDCDE355B3B6519035B
+        BC34F4DEF99C023861B46FC9D6E6C9077AD91D2691F7F7EE598CB0FAC186D91C
+        AEFE130985139270B4130C93BC437944F4FD4452E2D74DD364F2E21E71F54BFF
+        5CAE82AB9C9DF69EE86D2BC522363A0DABC521979B0DEADA1DBF9A42D5C4484E
+        0ABCD06BFA53DDEF3C1B20EE3FD59D7C25E41D2B669E1EF16E6F52C3164DF4FB
+        7930E9E4E58857B6AC7D5F42D69F6D187763CF1D5503400487F55BA57E31CC7A
+        7135C886EFB4318AED6A1E012D9E6832A907600A918130C46DC778F971AD0038
+        092999A333CB8B7A1A1DB93D7140003C2A4ECEA9F98D0ACC0A8291CDCEC97DCF
+        8EC9B55A7F88A46B4DB5A851F44182E1C68A007E5E655F6AFFFFFFFFFFFFFFFF
+    """,
+}
+GROUPS = {name: int("".join(p.split()), 16) for name, p in GROUPS.items()}
+
+SMALL_PRIMES = [p for p in range(3, 2000) if all(p % d for d in range(2, int(p ** 0.5) + 1))]
+
+
+@lru_cache(maxsize=None)
+def load_group(name):
+    """
+    DHParameters for a built-in group such as "ffdhe2048" or "modp3072".
+    """
+    if name not in GROUPS:
+        raise KeyError(f"Unknown DH group {name!r}; choose from {', '.join(GROUPS)}")
+    return dh.DHParameterNumbers(GROUPS[name], 2).parameters()
+
+
+def check_parameters(parameters, key_size, generator, full=False):
+    """
+    Raises ValueError unless parameters look like a safe-prime group of the
+    given size and generator. The quick checks (sizes, generator range, trial
+    division of p and (p-1)/2) run on every load; full=True adds
+    Miller-Rabin tests on both primes, as done right after generation.
+    """
+    numbers = parameters.parameter_numbers()
+    p, g = numbers.p, numbers.g
+    if p.bit_length() != key_size or g != generator:
+        raise ValueError("DH parameters do not match the requested size/generator")
+    q = (p - 1) // 2
+    if p % 4 != 3 or not 1 < g < p - 1:
+        raise ValueError("DH parameters are not a safe-prime group")
+    if any(p % s == 0 or q % s == 0 for s in SMALL_PRIMES):
+        raise ValueError("DH modulus is not a safe prime")
+    if full and not (_miller_rabin(q) and _miller_rabin(p)):
+        raise ValueError("DH modulus is not a safe prime")
+
+
+def _miller_rabin(n, rounds=8):
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for _ in range(rounds):
+        x = pow(secrets.randbelow(n - 3) + 2, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _cache_pattern(cache_dir, key_size, generator):
+    return os.path.join(cache_dir, f"dh-{key_size}-g{generator}-*.pem")
+
+
+def _generate_and_store(cache_dir, key_size, generator):
+    """
+    Worker task: generates parameters, checks them and writes the cache file.
+    The file name carries a digest of its contents, used to validate it on load.
+    """
+    parameters = dh.generate_parameters(generator=generator, key_size=key_size)
+    check_parameters(parameters, key_size, generator, full=True)
+    pem = parameters.parameter_bytes(serialization.Encoding.PEM, serialization.ParameterFormat.PKCS3)
+    digest = hashlib.sha256(pem).hexdigest()[:16]
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"dh-{key_size}-g{generator}-{digest}.pem")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(pem)
+    os.replace(tmp, path)
+    return path
+
+
+class DHParameterProvider:
+    """
+    Hands out DH parameters without generating them on the request path.
+    get() prefers cached generated parameters and falls back to the built-in
+    ffdhe group of the same size (generator 2).
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._loaded = {}
+        self._executor = None
+
+    def get(self, key_size=2048, generator=2):
+        if (key_size, generator) not in self._loaded:
+            parameters = self.load_cached(key_size, generator)
+            if parameters is None:
+                if generator != 2 or f"ffdhe{key_size}" not in GROUPS:
+                    raise LookupError(f"No cached {key_size}-bit DH parameters with generator {generator}; "
+                                      f"call generate({key_size}, {generator}) first")
+                parameters = load_group(f"ffdhe{key_size}")
+            self._loaded[key_size, generator] = parameters
+        return self._loaded[key_size, generator]
+
+    def load_cached(self, key_size, generator):
+        """
+        Newest valid cached parameters, or None. Files that fail validation
+        (digest mismatch, wrong size/generator, not a safe prime) are skipped.
+        """
+        paths = sorted(glob.glob(_cache_pattern(self.cache_dir, key_size, generator)),
+                       key=os.path.getmtime, reverse=True)
+        for path in paths:
+            try:
+                with open(path, "rb") as f:
+                    pem = f.read()
+                if not path.endswith(f"-{hashlib.sha256(pem).hexdigest()[:16]}.pem"):
+                    raise ValueError("DH parameter file is corrupted")
+                parameters = serialization.load_pem_parameters(pem)
+                check_parameters(parameters, key_size, generator)
+                return parameters
+            except (OSError, ValueError):
+                continue
+        return None
+
+    def generate(self, key_size=2048, generator=2):
+        """
+        Starts generating fresh parameters in a background process.
+        Returns a Future for the cache file path; later get() calls (and
+        later processes) use the new parameters.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=1)
+        future = self._executor.submit(_generate_and_store, self.cache_dir, key_size, generator)
+        future.add_done_callback(lambda _: self._loaded.pop((key_size, generator), None))
+        return future
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+if __name__ == "__main__":
+    # python dh_params.py                 -> list the available parameters
+    # python dh_params.py generate 2048 2 -> generate and cache new parameters
+    provider = DHParameterProvider()
+    if sys.argv[1:2] == ["generate"]:
+        args = [int(a) for a in sys.argv[2:4]]
+        key_size, generator = args + [2048, 2][len(args):]
+        print("Generating ... (this can take minutes)")
+        print("Cached:", provider.generate(key_size, generator).result())
+        provider.close()
+    else:
+        for name in GROUPS:
+            print(f"{name:<10} {GROUPS[name].bit_length()} bits, generator 2")
+        for path in sorted(glob.glob(_cache_pattern(provider.cache_dir, "*", "*"))):
+            print("cached    ", path)
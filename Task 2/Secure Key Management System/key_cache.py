@@ -0,0 +1,120 @@
+"""
+In-process cache with TTL and LRU eviction for derived key material.
+
+key_management.py keeps two of these:
+- (salt, iterations, password digest) -> derived Fernet key, so PBKDF2 runs
+  once per password and record instead of once per call.
+- key id -> loaded private key object (checked against the record it came
+  from), so the PEM is parsed once.
+
+Entries expire `ttl` seconds after they were stored and the least recently
+used entry is evicted once `maxsize` is reached. Passwords are never kept:
+lookups use password_digest(), an HMAC under a random per-process secret.
+"""
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+
+_DIGEST_SECRET = os.urandom(32)  # never leaves the process
+
+
+def password_digest(password):
+    """
+    Cache lookup key for a password (HMAC-SHA256 under a per-process secret).
+    """
+    if isinstance(password, str):
+        password = password.encode()
+    return hmac.new(_DIGEST_SECRET, password, hashlib.sha256).digest()
+
+
+class TTLCache:
+    """
+    Thread-safe mapping with per-entry expiry and LRU eviction.
+
+        cache = TTLCache(maxsize=256, ttl=900)
+        cache.put(key, value)
+        cache.get(key)      # value, or None when missing or expired
+        cache.metrics()     # size, hits, misses, evictions, expirations
+    """
+
+    def __init__(self, maxsize=256, ttl=900):
+        if maxsize < 1 or ttl <= 0:
+            raise ValueError("maxsize must be at least 1 and ttl positive.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value), oldest use first
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key):
+        """
+        Removes a key; returns its value (None if absent).
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return None if entry is None else entry[1]
+
+    def discard_where(self, predicate):
+        """
+        Removes every entry whose key satisfies predicate; returns the count.
+        """
+        with self._lock:
+            doomed = [key for key in self._entries if predicate(key)]
+            for key in doomed:
+                del self._entries[key]
+        return len(doomed)
+
+    def purge_expired(self):
+        """
+        Drops expired entries (they are otherwise dropped lazily on lookup).
+        """
+        now = time.monotonic()
+        with self._lock:
+            doomed = [key for key, (expires, _) in self._entries.items() if expires <= now]
+            for key in doomed:
+                del self._entries[key]
+            self.expirations += len(doomed)
+        return len(doomed)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
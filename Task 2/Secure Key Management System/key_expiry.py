@@ -0,0 +1,180 @@
+"""
+Expiry scheduler for keys with deadlines.
+
+Deadlines are kept in a min-heap, so the next due key is found without
+scanning the store and each schedule/expire step costs O(log n). A
+background thread sweeps the heap every `interval` seconds and handles
+at most `max_work` due entries per tick, so a burst of expiries is spread
+over several ticks instead of stalling the caller.
+
+Rescheduling or cancelling a key does not search the heap: the current
+deadline of every key is kept in a dict and heap entries that no longer
+match it are skipped when they reach the top.
+
+With a lead_time, `on_prepare` is called that many seconds before each
+deadline (e.g. to pre-generate a replacement key), and `on_expire` at
+the deadline itself. Both receive a list of (key_id, deadline) pairs, all
+the entries that fell due in one tick, so they can be handled in one batch.
+If a callback raises, its batch is put back and retried on the next tick;
+the sweeper thread counts the error and keeps running.
+"""
+import heapq
+import itertools
+import threading
+import time
+
+PREPARE, EXPIRE = 0, 1
+
+
+class ExpiryScheduler:
+    """
+    Min-heap of key deadlines swept by a background thread.
+
+        scheduler = ExpiryScheduler(on_expire, on_prepare, lead_time=60)
+        scheduler.schedule("Alice", time.time() + 3600)
+        scheduler.start(interval=1.0, max_work=1000)
+        scheduler.metrics()  # pending, expired, prepared, sweep lag, ...
+        scheduler.stop()
+    """
+
+    def __init__(self, on_expire, on_prepare=None, lead_time=0.0, clock=time.time):
+        self.on_expire = on_expire
+        self.on_prepare = on_prepare
+        self.lead_time = lead_time if on_prepare is not None else 0.0
+        self.clock = clock
+        self._heap = []  # (due time, sequence, kind, key id, deadline)
+        self._deadlines = {}  # key id -> current deadline
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.expired = self.prepared = self.ticks = self.errors = 0
+        self.max_lag = 0.0
+        self.last_error = None
+
+    def schedule(self, key_id, deadline):
+        """
+        Sets (or moves) the deadline of a key.
+        """
+        with self._lock:
+            self._deadlines[key_id] = deadline
+            if self.on_prepare is not None:
+                self._push(deadline - self.lead_time, PREPARE, key_id, deadline)
+            self._push(deadline, EXPIRE, key_id, deadline)
+
+    def schedule_many(self, items):
+        """
+        Loads many (key_id, deadline) pairs at once with a single heapify.
+        """
+        with self._lock:
+            for key_id, deadline in items:
+                self._deadlines[key_id] = deadline
+                if self.on_prepare is not None:
+                    self._heap.append((deadline - self.lead_time, next(self._sequence), PREPARE, key_id, deadline))
+                self._heap.append((deadline, next(self._sequence), EXPIRE, key_id, deadline))
+            heapq.heapify(self._heap)
+
+    def _push(self, due, kind, key_id, deadline):
+        heapq.heappush(self._heap, (due, next(self._sequence), kind, key_id, deadline))
+
+    def cancel(self, key_id):
+        with self._lock:
+            self._deadlines.pop(key_id, None)
+
+    def deadline(self, key_id):
+        return self._deadlines.get(key_id)
+
+    def __len__(self):
+        return len(self._deadlines)
+
+    def sweep(self, now=None, max_work=1000):
+        """
+        Handles up to max_work due entries; returns the number handled.
+        """
+        now = self.clock() if now is None else now
+        prepare, expire = [], []
+        with self._lock:
+            heap, deadlines = self._heap, self._deadlines
+            while heap and heap[0][0] <= now and len(prepare) + len(expire) < max_work:
+                due, _, kind, key_id, deadline = heapq.heappop(heap)
+                if deadlines.get(key_id) != deadline:
+                    continue  # cancelled or rescheduled
+                self.max_lag = max(self.max_lag, now - due)
+                if kind == PREPARE:
+                    prepare.append((key_id, deadline))
+                else:
+                    del deadlines[key_id]
+                    expire.append((key_id, deadline))
+            # Drop stale entries from the top so they don't count as work next tick
+            while heap and deadlines.get(heap[0][3]) != heap[0][4]:
+                heapq.heappop(heap)
+        self.ticks += 1
+        handled = len(prepare) + len(expire)
+        try:
+            if prepare:
+                self.on_prepare(prepare)
+                self.prepared += len(prepare)
+                prepare = []
+            if expire:
+                self.on_expire(expire)
+                self.expired += len(expire)
+        except Exception:
+            self._requeue(prepare, expire)
+            raise
+        return handled
+
+    def _requeue(self, prepare, expire):
+        """
+        Puts back entries whose callback failed so the next sweep retries
+        them, unless the key was rescheduled or cancelled meanwhile.
+        """
+        with self._lock:
+            for key_id, deadline in prepare:
+                if self._deadlines.get(key_id) == deadline:
+                    self._push(deadline - self.lead_time, PREPARE, key_id, deadline)
+            for key_id, deadline in expire:
+                if key_id not in self._deadlines:
+                    self._deadlines[key_id] = deadline
+                    self._push(deadline, EXPIRE, key_id, deadline)
+
+    def start(self, interval=1.0, max_work=1000):
+        """
+        Starts the background sweeper thread.
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval, max_work), daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self, interval, max_work):
+        while not self._stop.is_set():
+            try:
+                handled = self.sweep(max_work=max_work)
+            except Exception as exc:
+                # e.g. "database is locked"; the batch was requeued, retry next tick
+                self.errors += 1
+                self.last_error = exc
+                handled = 0
+            # Sweep again at once if the tick was full, otherwise wait for the next one
+            if handled < max_work:
+                self._stop.wait(interval)
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "pending": len(self._deadlines),
+                "heap_size": len(self._heap),
+                "expired": self.expired,
+                "prepared": self.prepared,
+                "ticks": self.ticks,
+                "max_lag": self.max_lag,
+                "errors": self.errors,
+                "last_error": repr(self.last_error) if self.last_error is not None else None,
+            }
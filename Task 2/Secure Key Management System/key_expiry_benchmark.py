@@ -0,0 +1,46 @@
+"""
+Cost of the expiry scheduler with millions of keys: loading the heap,
+rescheduling, and the time one sweeper tick takes when a large share of
+the keys are due at once.
+
+    python key_expiry_benchmark.py [keys] [max_work]
+"""
+import random
+import sys
+import time
+
+from key_expiry import ExpiryScheduler
+
+
+def main(keys=1_000_000, max_work=1000):
+    keys, max_work = int(keys), int(max_work)
+    handled = []
+    scheduler = ExpiryScheduler(handled.extend, lambda due: None, lead_time=60)
+    now = time.time()
+    # Half of the keys are already due, the rest expire over the next hour
+    deadlines = [(f"user{i}", now + random.uniform(-3600, 3600)) for i in range(keys)]
+
+    start = time.perf_counter()
+    scheduler.schedule_many(deadlines)
+    print(f"{keys} keys loaded in {(time.perf_counter() - start) * 1e3:.0f} ms")
+
+    sample = random.sample(range(keys), 100_000)
+    start = time.perf_counter()
+    for i in sample:
+        scheduler.schedule(f"user{i}", now + 7200)
+    print(f"reschedule: {(time.perf_counter() - start) / len(sample) * 1e6:.2f} us/key")
+
+    ticks = []
+    while True:
+        start = time.perf_counter()
+        if not scheduler.sweep(now=now, max_work=max_work):
+            break
+        ticks.append(time.perf_counter() - start)
+    ticks.sort()
+    print(f"{len(handled)} keys expired in {len(ticks)} ticks of at most {max_work}")
+    print(f"tick time: median {ticks[len(ticks) // 2] * 1e3:.2f} ms, "
+          f"max {ticks[-1] * 1e3:.2f} ms, {sum(ticks) / len(handled) * 1e6:.2f} us/key")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
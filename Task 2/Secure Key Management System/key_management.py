@@ -1,14 +1,31 @@
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives.asymmetric import rsa, dh, padding
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
-import os, time, base64
+import os, time, base64, hmac, struct
+from key_pool import KeyPairPool
+from dh_params import DHParameterProvider
+from key_cache import TTLCache, password_digest
+from key_store import KeyStore
+from key_expiry import ExpiryScheduler
+from revocation import RevocationList
+from tickets import MasterKeyRing, InvalidTicket, issue_ticket, open_ticket
 
-# Key Store Simulation (Dictionary-based for simplicity)
-key_store = {}  # Stores user keys (symmetric & asymmetric)
-revoked_keys = set()  # Stores revoked user IDs to prevent unauthorized access
+# Key store (SQLite, see key_store.py); in memory unless KEY_STORE_PATH names a file
+key_store = KeyStore()  # Stores user keys (symmetric & asymmetric) and revoked user IDs
+revocations = RevocationList(key_store, os.environ.get("REVOCATION_FILTER_PATH"))  # Bloom filter over revoked user IDs
+key_pool = None  # Pre-generated RSA key pairs (see start_key_pool)
+expiry_scheduler = None  # Evicts or rotates expired symmetric keys (see start_expiry_scheduler)
+replacement_keys = {}  # user id -> pre-generated symmetric key for the next rotation
+rotation_period = None  # Lifetime of rotated keys in seconds; None evicts instead of rotating
+ticket_keys = None  # Master key ring for stateless session tickets (see start_ticket_mode)
+dh_parameters = DHParameterProvider()  # Built-in and cached DH groups
+
+PBKDF2_ITERATIONS = 100000  # Iterations for newly encrypted private keys
+derived_keys = TTLCache(maxsize=256, ttl=900)  # (salt, iterations, password digest) -> Fernet key
+private_keys = TTLCache(maxsize=256, ttl=900)  # key id -> (password digest, record, private key object)
 
 # ============================
 # 1. CENTRALIZED KEY DISTRIBUTION (SYMMETRIC ENCRYPTION)
@@ -25,26 +42,129 @@ def store_symmetric_key(user_id, key, expiry_time=3600):  # Key expires in 1 hou
     Stores the generated symmetric key securely with an expiry time.
     If the key expires, a new one must be generated.
     """
-    if user_id not in key_store:
-        key_store[user_id] = {}
-    key_store[user_id]['symmetric'] = {'key': key, 'expiry': time.time() + expiry_time}
+    expiry = time.time() + expiry_time
+    key_store.put(user_id, 'symmetric', key, expiry=expiry)
+    if expiry_scheduler is not None:
+        expiry_scheduler.schedule(user_id, expiry)
     print(f"Symmetric key stored for {user_id}, expires in {expiry_time} seconds")
 
 def is_key_expired(user_id):
     """
     Checks if a symmetric key is expired based on the stored expiry time.
+    - True unless the user has a key that is still valid, so a key the
+      expiry scheduler has already evicted still reports as expired.
+    """
+    entry = key_store.get_entry(user_id, 'symmetric')
+    return entry is None or time.time() > entry[1]
+
+def get_symmetric_key(user_id):
+    """
+    Returns the user's symmetric key, or None if there is none or it has expired.
+    - When keys are being rotated, a key that expired before the sweeper got
+      to it is rotated here, using the pre-generated replacement.
+    """
+    entry = key_store.get_entry(user_id, 'symmetric')
+    if entry is not None and time.time() > entry[1] and expiry_scheduler is not None and rotation_period:
+        _expire_symmetric_keys([(user_id, entry[1])])
+        entry = key_store.get_entry(user_id, 'symmetric')
+    if entry is None or time.time() > entry[1]:
+        return None
+    return entry[0]
+
+def start_expiry_scheduler(rotate_every=None, lead_time=60, interval=1.0, max_work=1000):
+    """
+    Starts a background sweeper that handles symmetric keys as they expire.
+    - Without rotate_every, expired keys are deleted from the store.
+    - With rotate_every (seconds), each expired key is replaced by a new key
+      valid for that long; replacements are generated lead_time seconds
+      before the deadline, so rotation never waits on key generation.
+    - Deadlines are kept in a min-heap loaded once from the store; each tick
+      handles at most max_work keys, committed in one transaction.
+    """
+    global expiry_scheduler, rotation_period
+    if expiry_scheduler is None:
+        rotation_period = rotate_every
+        expiry_scheduler = ExpiryScheduler(_expire_symmetric_keys,
+                                           _prepare_replacement_keys if rotate_every else None,
+                                           lead_time=lead_time)
+        expiry_scheduler.schedule_many(key_store.expiries('symmetric'))
+        expiry_scheduler.start(interval=interval, max_work=max_work)
+    return expiry_scheduler
+
+def stop_expiry_scheduler():
+    """
+    Stops the sweeper; expired keys are then only noticed by is_key_expired().
+    """
+    global expiry_scheduler
+    if expiry_scheduler is not None:
+        expiry_scheduler.stop()
+        expiry_scheduler = None
+        replacement_keys.clear()
+
+def _prepare_replacement_keys(due):
+    """
+    Sweeper callback: generates the next key of users whose key expires soon.
+    """
+    for user_id, _ in due:
+        replacement_keys[user_id] = generate_symmetric_key()
+
+def _expire_symmetric_keys(due):
     """
-    return user_id in key_store and 'symmetric' in key_store[user_id] and time.time() > key_store[user_id]['symmetric']['expiry']
+    Sweeper callback: rotates or deletes keys that reached their deadline.
+    - Keys replaced or revoked since they were scheduled are left alone.
+    """
+    rotated = []
+    with key_store.batch():
+        for user_id, deadline in due:
+            entry = key_store.get_entry(user_id, 'symmetric')
+            if entry is None or entry[1] != deadline:
+                replacement_keys.pop(user_id, None)
+                continue
+            if rotation_period:
+                key = replacement_keys.pop(user_id, None) or generate_symmetric_key()
+                expiry = time.time() + rotation_period
+                key_store.put(user_id, 'symmetric', key, expiry=expiry)
+                rotated.append((user_id, expiry))
+            else:
+                key_store.delete(user_id, 'symmetric')
+    if expiry_scheduler is not None:
+        for user_id, expiry in rotated:
+            expiry_scheduler.schedule(user_id, expiry)
 
 # ============================
 # 2. PUBLIC KEY INFRASTRUCTURE (PKI) - ASYMMETRIC ENCRYPTION
 # ============================
 
+def start_key_pool(low_watermark=4, high_watermark=16, workers=None):
+    """
+    Starts background worker processes that keep RSA-2048 key pairs ready.
+    - generate_asymmetric_keys() is then served from the pool in microseconds.
+    - Pool depth, hits/misses and refill latency are available from key_pool.metrics().
+    """
+    global key_pool
+    if key_pool is None:
+        key_pool = KeyPairPool(key_size=2048, low_watermark=low_watermark,
+                               high_watermark=high_watermark, workers=workers)
+    return key_pool
+
+def stop_key_pool():
+    """
+    Stops the key pool; key generation falls back to the synchronous path.
+    """
+    global key_pool
+    if key_pool is not None:
+        key_pool.close()
+        key_pool = None
+
 def generate_asymmetric_keys():
     """
     Generates an RSA-2048 key pair.
     - RSA is used for secure key exchange and authentication.
+    - Takes a pre-generated pair from key_pool when the pool is running
+      (and generates synchronously if it is empty).
     """
+    if key_pool is not None:
+        return key_pool.get()
     private_key = rsa.generate_private_key(
         public_exponent=65537,  # Standard exponent for security
         key_size=2048,  # Ensures strong encryption
@@ -53,43 +173,124 @@ def generate_asymmetric_keys():
     public_key = private_key.public_key()
     return private_key, public_key
 
-def encrypt_private_key(private_key, password):
+def derive_fernet_key(password, salt, iterations=PBKDF2_ITERATIONS):
+    """
+    Derives the Fernet key protecting a private key from the password.
+    - Uses PBKDF2HMAC-SHA256 with the record's salt and iteration count.
+    - Results are cached in derived_keys, so PBKDF2 runs once per password
+      and record until the entry expires or is evicted.
+    """
+    cache_key = (salt, iterations, password_digest(password))
+    key = derived_keys.get(cache_key)
+    if key is None:
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=iterations)
+        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+        derived_keys.put(cache_key, key)
+    return key
+
+def encrypt_private_key(private_key, password, iterations=PBKDF2_ITERATIONS):
     """
     Encrypts the private key using a password-derived key.
     - Uses PBKDF2HMAC (Password-Based Key Derivation) for secure key encryption.
     - Generates a random salt to prevent brute-force attacks.
     - Uses AES-128 encryption via Fernet to store the private key securely.
+    - Returns (salt, encrypted key, iterations); the iteration count is kept
+      with the record so it can be raised later without breaking old records.
     """
     salt = os.urandom(16)  # Random salt for key derivation
-    kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=100000)
-    key = base64.urlsafe_b64encode(kdf.derive(password.encode()))  # Derive encryption key
+    key = derive_fernet_key(password, salt, iterations)  # Derive encryption key
     encrypted_key = Fernet(key).encrypt(private_key.private_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PrivateFormat.PKCS8,
         encryption_algorithm=serialization.NoEncryption()
     ))
-    return salt, encrypted_key
+    return salt, encrypted_key, iterations
 
-def decrypt_private_key(encrypted_key, salt, password):
+def decrypt_private_key(encrypted_key, salt, password, iterations=100000, key_id=None):
     """
     Decrypts the private key using the stored salt and password.
     - Uses the same PBKDF2HMAC key derivation technique.
+    - iterations defaults to 100000, the count used by records that predate it.
+    - With a key_id, the loaded key object is cached in private_keys and
+      returned directly the next time the same password is given for the
+      same record (salt, encrypted key and iterations).
+    """
+    digest = password_digest(password)
+    record = (salt, encrypted_key, iterations)
+    if key_id is not None:
+        cached = private_keys.get(key_id)
+        if cached is not None and cached[1] == record and hmac.compare_digest(cached[0], digest):
+            return cached[2]
+    key = derive_fernet_key(password, salt, iterations)
+    try:
+        decrypted_key = Fernet(key).decrypt(encrypted_key)
+    except InvalidToken:
+        derived_keys.pop((salt, iterations, digest))  # Don't keep keys from wrong passwords
+        raise
+    private_key = serialization.load_pem_private_key(decrypted_key, password=None, backend=default_backend())
+    if key_id is not None:
+        private_keys.put(key_id, (digest, record, private_key))
+    return private_key
+
+def load_private_key(user_id, password):
+    """
+    Returns the user's stored private key, decrypted with the password.
+    - The user id is the key id, so repeated loads (e.g. signing many
+      times in a session) skip both PBKDF2 and PEM parsing.
+    - Raises cryptography.fernet.InvalidToken for a wrong password.
+    """
+    record = key_store.get(user_id, 'private')
+    if record is None:
+        raise KeyError(f"No private key stored for {user_id}")
+    salt, encrypted_key, iterations = unpack_private_record(record)
+    return decrypt_private_key(encrypted_key, salt, password, iterations, key_id=user_id)
+
+def get_public_key(user_id):
+    """
+    Returns the user's stored public key, or None.
+    """
+    der = key_store.get(user_id, 'public')
+    return None if der is None else serialization.load_der_public_key(der)
+
+def forget_cached_keys(user_id):
+    """
+    Drops the user's loaded private key and derived Fernet keys from the caches.
+    """
+    private_keys.pop(user_id)
+    record = key_store.get(user_id, 'private')
+    if record is not None:
+        salt = unpack_private_record(record)[0]
+        derived_keys.discard_where(lambda cache_key: cache_key[0] == salt)
+
+def pack_private_record(salt, encrypted_key, iterations):
+    """
+    Stored form of an encrypted private key: salt length, salt, iterations, Fernet token.
     """
-    kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=100000)
-    key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-    decrypted_key = Fernet(key).decrypt(encrypted_key)
-    return serialization.load_pem_private_key(decrypted_key, password=None, backend=default_backend())
+    return bytes((len(salt),)) + salt + struct.pack(">I", iterations) + encrypted_key
 
-def store_asymmetric_keys(user_id, private_key, public_key, password):
+def unpack_private_record(record):
+    """
+    (salt, encrypted key, iterations) from pack_private_record().
+    """
+    salt_len = record[0]
+    salt = record[1:1 + salt_len]
+    (iterations,) = struct.unpack_from(">I", record, 1 + salt_len)
+    return salt, record[5 + salt_len:], iterations
+
+def store_asymmetric_keys(user_id, private_key, public_key, password, iterations=PBKDF2_ITERATIONS):
     """
     Stores encrypted private keys and public keys securely.
     - Encrypts private key before storing.
+    - The record is (salt, encrypted private key, PBKDF2 iterations).
+    - Both keys are written in one transaction.
     """
-    if user_id not in key_store:
-        key_store[user_id] = {}
-    salt, encrypted_private_key = encrypt_private_key(private_key, password)
-    key_store[user_id]['private'] = (salt, encrypted_private_key)
-    key_store[user_id]['public'] = public_key
+    forget_cached_keys(user_id)  # A replaced key must not be served from the cache
+    record = pack_private_record(*encrypt_private_key(private_key, password, iterations))
+    public_der = public_key.public_bytes(encoding=serialization.Encoding.DER,
+                                         format=serialization.PublicFormat.SubjectPublicKeyInfo)
+    with key_store.batch():
+        key_store.put(user_id, 'private', record)
+        key_store.put(user_id, 'public', public_der)
     print(f"Asymmetric keys stored securely for {user_id}")
 
 # ============================
@@ -98,10 +299,14 @@ def store_asymmetric_keys(user_id, private_key, public_key, password):
 
 def generate_dh_parameters():
     """
-    Generates Diffie-Hellman (DH) parameters for secure key exchange.
+    Returns Diffie-Hellman (DH) parameters for secure key exchange.
     - Used to generate shared secret keys between two parties.
+    - Uses cached generated parameters if present, otherwise the RFC 7919
+      ffdhe2048 group, so no safe prime is generated at startup.
+    - Fresh parameters are generated in the background only on request:
+      dh_parameters.generate(2048, 2).
     """
-    return dh.generate_parameters(generator=2, key_size=2048, backend=default_backend())
+    return dh_parameters.get(key_size=2048, generator=2)
 
 def generate_dh_private_key(parameters):
     """
@@ -164,54 +369,106 @@ def verify_signature(public_key, public_key_bytes, signature):
 def revoke_key(user_id):
     """
     Revokes all keys associated with a user, preventing further access.
+    - Cached derived keys and the loaded private key are dropped as well.
     """
-    if user_id in key_store:
-        revoked_keys.add(user_id)
-        del key_store[user_id]
+    if key_store.has_user(user_id):
+        forget_cached_keys(user_id)
+        if expiry_scheduler is not None:
+            expiry_scheduler.cancel(user_id)
+            replacement_keys.pop(user_id, None)
+        key_store.revoke(user_id)
+        revocations.add(user_id)
         print(f"All keys revoked for {user_id}")
 
 def is_key_revoked(user_id):
     """
     Checks if the user's keys have been revoked.
+    - A Bloom filter rules out almost all users that were never revoked;
+      only its positives are looked up in the key store.
+    """
+    return revocations.is_revoked(user_id)
+
+# ============================
+# 5. STATELESS SESSION TICKETS
+# ============================
+
+def start_ticket_mode(keyring_path=None):
+    """
+    Loads the master key ring used to seal session tickets.
+    - Every replica given the same key ring file can issue and open tickets,
+      so handing out session keys needs no shared key store.
+    - Without a path, a key ring with one random key is kept in memory.
+    """
+    global ticket_keys
+    if keyring_path:
+        ticket_keys = MasterKeyRing.load(keyring_path)
+    else:
+        ticket_keys = MasterKeyRing()
+        ticket_keys.rotate()
+    return ticket_keys
+
+def issue_session_ticket(user_id, lifetime=3600):
+    """
+    Returns (session key, ticket) for a user; nothing is stored.
+    - The ticket seals the user id, session key and expiry under the current
+      master key with AES-GCM (see tickets.py).
+    """
+    if ticket_keys is None:
+        start_ticket_mode()
+    if is_key_revoked(user_id):
+        raise PermissionError(f"Keys for {user_id} have been revoked")
+    return issue_ticket(ticket_keys, user_id, lifetime)
+
+def open_session_ticket(ticket):
+    """
+    Returns (user id, session key, expiry) from a ticket without a store lookup.
+    - Raises InvalidTicket for forged, expired or unknown-key tickets, and for
+      tickets of users revoked since they were issued.
     """
-    return user_id in revoked_keys
+    if ticket_keys is None:
+        start_ticket_mode()
+    user_id, session_key, expiry = open_ticket(ticket_keys, ticket)
+    if is_key_revoked(user_id):
+        raise InvalidTicket(f"Keys for {user_id} have been revoked")
+    return user_id, session_key, expiry
 
 # ============================
 # EXECUTION & TESTING
 # ============================
 
-user_id = input("Enter the user id: ")
-password = input("Enter the password: ")
-
-# Generate and store symmetric key
-symmetric_key = generate_symmetric_key()
-store_symmetric_key(user_id, symmetric_key)
-
-# Generate and store asymmetric keys
-private_key, public_key = generate_asymmetric_keys()
-store_asymmetric_keys(user_id, private_key, public_key, password)
-
-print("Symmetric key generated and securely stored.")  
-print(f"Symmetric key hash: {hash(symmetric_key)}")  # Masked representation
-
-# Diffie-Hellman Key Exchange with Signatures
-parameters = generate_dh_parameters()
-private_key_A = generate_dh_private_key(parameters)
-private_key_B = generate_dh_private_key(parameters)
-public_key_A = private_key_A.public_key()
-public_key_B = private_key_B.public_key()
-
-# Signing keys to prevent MITM attacks
-signature_A = sign_public_key(private_key, public_key_A.public_bytes(encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo))
-signature_B = sign_public_key(private_key, public_key_B.public_bytes(encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo))
-
-if verify_signature(public_key, public_key_A.public_bytes(encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo), signature_A) and \
-   verify_signature(public_key, public_key_B.public_bytes(encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo), signature_B):
-    print("Public keys authenticated!")
-else:
-    print("Warning: Possible MITM attack detected!")
-
-# Secure key derivation
-shared_secret_A = compute_shared_secret(private_key_A, public_key_B)
-symmetric_key_A = derive_key_from_secret(shared_secret_A)
-print("Secure symmetric key derived!")
+if __name__ == "__main__":
+    user_id = input("Enter the user id: ")
+    password = input("Enter the password: ")
+
+    # Generate and store symmetric key
+    symmetric_key = generate_symmetric_key()
+    store_symmetric_key(user_id, symmetric_key)
+
+    # Generate and store asymmetric keys
+    private_key, public_key = generate_asymmetric_keys()
+    store_asymmetric_keys(user_id, private_key, public_key, password)
+
+    print("Symmetric key generated and securely stored.")  
+    print(f"Symmetric key hash: {hash(symmetric_key)}")  # Masked representation
+
+    # Diffie-Hellman Key Exchange with Signatures
+    parameters = generate_dh_parameters()
+    private_key_A = generate_dh_private_key(parameters)
+    private_key_B = generate_dh_private_key(parameters)
+    public_key_A = private_key_A.public_key()
+    public_key_B = private_key_B.public_key()
+
+    # Signing keys to prevent MITM attacks
+    signature_A = sign_public_key(private_key, public_key_A.public_bytes(encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo))
+    signature_B = sign_public_key(private_key, public_key_B.public_bytes(encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo))
+
+    if verify_signature(public_key, public_key_A.public_bytes(encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo), signature_A) and \
+       verify_signature(public_key, public_key_B.public_bytes(encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo), signature_B):
+        print("Public keys authenticated!")
+    else:
+        print("Warning: Possible MITM attack detected!")
+
+    # Secure key derivation
+    shared_secret_A = compute_shared_secret(private_key_A, public_key_B)
+    symmetric_key_A = derive_key_from_secret(shared_secret_A)
+    print("Secure symmetric key derived!")
@@ -0,0 +1,330 @@
+"""
+Persistent key store backed by SQLite in WAL mode.
+
+- One row per (user, key type) in a WITHOUT ROWID table, so a lookup is a
+  single primary-key B-tree probe, O(log n) in the number of users; nothing
+  is loaded or deserialised when the store is opened.
+- Without a path (or KEY_STORE_PATH) the store lives in memory, like the
+  dicts it replaced, and nothing is written to disk.
+- In a database file, secret values (key types in SECRET_KEY_TYPES) are
+  sealed with AES-GCM under a wrapping key (or KEY_STORE_WRAPPING_KEY),
+  bound to their user id and key type; a file-backed store without a
+  wrapping key refuses to write them. The file is also created readable by
+  its owner only (0600); SQLite gives the WAL and shared-memory files the
+  same mode.
+- Every statement is a constant SQL string, so sqlite3 prepares it once
+  and reuses it from its statement cache.
+- Writes commit immediately, or once per batch inside `with store.batch():`
+  and put_many().
+- With the write-ahead log, a store reopened after a crash recovers every
+  committed transaction from the log tail; an interrupted batch is rolled
+  back as a whole.
+- Revocations are also numbered in a revocation log, so other processes
+  can fetch just the revocations after the last version they have seen.
+
+Values are bytes; serialize_key()/deserialize_key() convert the key objects
+used by the scripts (Fernet keys, RSA private and public keys).
+"""
+import base64
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+DEFAULT_PATH = ":memory:"
+SECRET_KEY_TYPES = frozenset({"symmetric", "private"})  # values sealed under the wrapping key
+_NONCE_SIZE = 12
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS keys (
+    user_id  TEXT NOT NULL,
+    key_type TEXT NOT NULL,
+    value    BLOB NOT NULL,
+    expiry   REAL,
+    PRIMARY KEY (user_id, key_type)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS revoked (
+    user_id    TEXT PRIMARY KEY,
+    revoked_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS revocation_log (
+    version INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL
+);
+"""
+_PUT = "INSERT OR REPLACE INTO keys (user_id, key_type, value, expiry) VALUES (?, ?, ?, ?)"
+_GET = "SELECT value, expiry FROM keys WHERE user_id = ? AND key_type = ?"
+_GET_USER = "SELECT key_type, value, expiry FROM keys WHERE user_id = ?"
+_DELETE = "DELETE FROM keys WHERE user_id = ? AND key_type = ?"
+_DELETE_USER = "DELETE FROM keys WHERE user_id = ?"
+_REVOKE = "INSERT OR IGNORE INTO revoked (user_id, revoked_at) VALUES (?, ?)"
+_LOG_REVOCATION = "INSERT INTO revocation_log (user_id) VALUES (?)"
+_REVOCATIONS_SINCE = "SELECT version, user_id FROM revocation_log WHERE version > ? ORDER BY version LIMIT ?"
+_REVOCATION_VERSION = "SELECT COALESCE(MAX(version), 0) FROM revocation_log"
+# Stores created before the log existed: log their revocations once
+_BACKFILL_LOG = """
+INSERT INTO revocation_log (user_id)
+SELECT user_id FROM revoked WHERE NOT EXISTS (SELECT 1 FROM revocation_log) ORDER BY revoked_at
+"""
+_IS_REVOKED = "SELECT 1 FROM revoked WHERE user_id = ?"
+_REVOKED = "SELECT user_id FROM revoked ORDER BY revoked_at"
+_COUNT = "SELECT COUNT(*) FROM keys"
+_EXPIRIES = "SELECT user_id, expiry FROM keys WHERE key_type = ? AND expiry IS NOT NULL"
+
+
+class KeyStore:
+    """
+    Keys by (user id, key type), with optional expiry times, plus the set
+    of revoked users.
+
+        store = KeyStore("keys.db", wrapping_key=wrapping_key)
+        store.put("Alice", "symmetric", key, expiry=time.time() + 3600)
+        store.get("Alice", "symmetric")    # bytes, or None
+        with store.batch():                # one commit for many writes
+            ...
+        store.revoke("Alice")              # deletes her keys, marks her revoked
+
+    The database is opened on first use, so creating a KeyStore is free.
+    wrapping_key is 32 raw bytes or their urlsafe base64 (see
+    generate_wrapping_key()).
+    """
+
+    def __init__(self, path=None, wrapping_key=None):
+        self.path = path or os.environ.get("KEY_STORE_PATH", DEFAULT_PATH)
+        wrapping_key = wrapping_key or os.environ.get("KEY_STORE_WRAPPING_KEY")
+        if isinstance(wrapping_key, str):
+            wrapping_key = base64.urlsafe_b64decode(wrapping_key)
+        self._wrap = AESGCM(wrapping_key) if wrapping_key else None
+        self._db = None
+        self._lock = threading.RLock()
+        self._depth = 0  # nesting level of batch()
+
+    @property
+    def db(self):
+        if self._db is None:
+            with self._lock:
+                if self._db is None:
+                    if self.path != ":memory:" and not self.path.startswith("file:"):
+                        # Create the file owner-only before SQLite does so with the default 0644
+                        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+                    db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False,
+                                         cached_statements=64)
+                    db.execute("PRAGMA journal_mode=WAL")
+                    db.execute("PRAGMA synchronous=NORMAL")  # fsync at checkpoints, not every commit
+                    db.executescript(_SCHEMA)
+                    db.execute(_BACKFILL_LOG)
+                    self._db = db
+        return self._db
+
+    @property
+    def in_memory(self):
+        return self.path == ":memory:"
+
+    @property
+    def can_store_secrets(self):
+        """
+        False for a database file without a wrapping key.
+        """
+        return self._wrap is not None or self.in_memory
+
+    def _seal(self, user_id, key_type, value):
+        if key_type not in SECRET_KEY_TYPES:
+            return value
+        if self._wrap is None:
+            if self.in_memory:
+                return value
+            raise ValueError(f"Refusing to write a {key_type} key to {self.path} in plaintext; "
+                             "give the store a wrapping key (KEY_STORE_WRAPPING_KEY).")
+        nonce = os.urandom(_NONCE_SIZE)
+        return nonce + self._wrap.encrypt(nonce, bytes(value), _associated_data(user_id, key_type))
+
+    def _unseal(self, user_id, key_type, value):
+        if value is None or self._wrap is None or key_type not in SECRET_KEY_TYPES:
+            return value
+        try:
+            return self._wrap.decrypt(value[:_NONCE_SIZE], value[_NONCE_SIZE:], _associated_data(user_id, key_type))
+        except InvalidTag:
+            raise ValueError(f"The {key_type} key of {user_id} does not open with this wrapping key.") from None
+
+    def _write(self, sql, params):
+        with self._lock:
+            self.db.execute(sql, params)
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups all writes made inside the block into one transaction.
+        """
+        with self._lock:
+            db = self.db
+            if self._depth == 0:
+                db.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    db.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                db.execute("COMMIT")
+
+    def put(self, user_id, key_type, value, expiry=None):
+        self._write(_PUT, (user_id, key_type, self._seal(user_id, key_type, value), expiry))
+
+    def put_many(self, rows):
+        """
+        Stores (user_id, key_type, value, expiry) rows in one transaction.
+        """
+        with self.batch():
+            self.db.executemany(_PUT, ((user_id, key_type, self._seal(user_id, key_type, value), expiry)
+                                       for user_id, key_type, value, expiry in rows))
+
+    def get(self, user_id, key_type):
+        """
+        Stored value, or None.
+        """
+        entry = self.get_entry(user_id, key_type)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, user_id, key_type):
+        """
+        (value, expiry) for a key, or None; expiry is None for keys that never expire.
+        """
+        with self._lock:
+            entry = self.db.execute(_GET, (user_id, key_type)).fetchone()
+        return None if entry is None else (self._unseal(user_id, key_type, entry[0]), entry[1])
+
+    def get_user(self, user_id):
+        """
+        {key_type: value} of all the user's keys.
+        """
+        with self._lock:
+            rows = self.db.execute(_GET_USER, (user_id,)).fetchall()
+        return {key_type: self._unseal(user_id, key_type, value) for key_type, value, _ in rows}
+
+    def delete(self, user_id, key_type):
+        self._write(_DELETE, (user_id, key_type))
+
+    def expiries(self, key_type):
+        """
+        (user_id, expiry) of every key of this type that has an expiry time.
+        Reads the whole table; meant for loading a scheduler at startup.
+        """
+        with self._lock:
+            return self.db.execute(_EXPIRIES, (key_type,)).fetchall()
+
+    def has_user(self, user_id):
+        with self._lock:
+            return self.db.execute(_GET_USER, (user_id,)).fetchone() is not None
+
+    def revoke(self, user_id):
+        """
+        Deletes all the user's keys and records the revocation, atomically.
+        """
+        self.revoke_many([user_id])
+
+    def revoke_many(self, user_ids):
+        with self.batch():
+            db, now = self.db, time.time()
+            for user_id in user_ids:
+                db.execute(_DELETE_USER, (user_id,))
+                if db.execute(_REVOKE, (user_id, now)).rowcount:
+                    db.execute(_LOG_REVOCATION, (user_id,))
+
+    def is_revoked(self, user_id):
+        with self._lock:
+            return self.db.execute(_IS_REVOKED, (user_id,)).fetchone() is not None
+
+    def revoked_users(self):
+        with self._lock:
+            return [user_id for (user_id,) in self.db.execute(_REVOKED)]
+
+    def revocations_since(self, version, limit=100000):
+        """
+        [(version, user_id)] of revocations after `version`, oldest first.
+        """
+        with self._lock:
+            return self.db.execute(_REVOCATIONS_SINCE, (version, limit)).fetchall()
+
+    def revocation_version(self):
+        """
+        Version of the latest revocation (0 if there are none).
+        """
+        with self._lock:
+            return self.db.execute(_REVOCATION_VERSION).fetchone()[0]
+
+    def __len__(self):
+        with self._lock:
+            return self.db.execute(_COUNT).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def generate_wrapping_key():
+    """
+    New random wrapping key as urlsafe base64, e.g. for KEY_STORE_WRAPPING_KEY.
+    """
+    return base64.urlsafe_b64encode(AESGCM.generate_key(bit_length=256)).decode()
+
+
+def _associated_data(user_id, key_type):
+    # Binds a sealed value to its row, so it cannot be moved to another user or key type
+    return f"{user_id}\0{key_type}".encode()
+
+
+def serialize_key(key):
+    """
+    Bytes for a key: Fernet keys and other bytes are kept as they are, RSA
+    private keys become unencrypted PKCS#8 DER (sealed by KeyStore.put) and public
+    keys SubjectPublicKeyInfo DER.
+    """
+    if isinstance(key, (bytes, bytearray, memoryview)):
+        return bytes(key)
+    if hasattr(key, "private_bytes"):
+        return key.private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+    if hasattr(key, "public_bytes"):
+        return key.public_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+    raise TypeError(f"Cannot store a key of type {type(key).__name__}")
+
+
+def deserialize_key(key_type, data):
+    """
+    Inverse of serialize_key for the "private" and "public" key types;
+    any other type is returned as bytes.
+    """
+    if data is None:
+        return None
+    if key_type == "private":
+        return serialization.load_der_private_key(data, password=None)
+    if key_type == "public":
+        return serialization.load_der_public_key(data)
+    return data
+
+
+if __name__ == "__main__":
+    print(generate_wrapping_key())  # python key_store.py > a new KEY_STORE_WRAPPING_KEY
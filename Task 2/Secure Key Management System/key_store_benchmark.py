@@ -0,0 +1,74 @@
+"""
+Bulk load, cold open and lookup speed of the SQLite key store, and
+recovery after a process is killed mid-write.
+
+    python key_store_benchmark.py [users] [batch]
+"""
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from key_store import KeyStore, generate_wrapping_key
+
+
+def timed(label, count, fn):
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    print(f"  {label:<30} {seconds * 1e3:10.2f} ms  {count / seconds:12,.0f} ops/s")
+    return result
+
+
+# Commits one row, then dies in the middle of a second, uncommitted batch.
+_CRASH = """
+import os, sys
+from key_store import KeyStore
+store = KeyStore(sys.argv[1], wrapping_key=sys.argv[2])
+store.put("committed", "symmetric", b"k" * 44)
+with store.batch():
+    store.put("uncommitted", "symmetric", b"k" * 44)
+    os._exit(1)
+"""
+
+
+def main(users=1_000_000, batch=10_000):
+    users, batch = int(users), int(batch)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "keys.db")
+        key = os.urandom(44)
+        wrapping_key = generate_wrapping_key()
+        store = KeyStore(path, wrapping_key=wrapping_key)
+
+        def load():
+            for start in range(0, users, batch):
+                store.put_many((f"user{i}", "symmetric", key, None) for i in range(start, min(users, start + batch)))
+
+        print(f"{users} users")
+        timed(f"put_many, {batch} per commit", users, load)
+        timed("put, one commit each", 1000, lambda: [store.put(f"single{i}", "symmetric", key) for i in range(1000)])
+        store.close()
+        print(f"  file size: {os.path.getsize(path) / users:.0f} bytes/user")
+
+        start = time.perf_counter()
+        store = KeyStore(path, wrapping_key=wrapping_key)
+        store.get("user0", "symmetric")
+        print(f"  {'open + first lookup':<30} {(time.perf_counter() - start) * 1e3:10.2f} ms")
+        names = [f"user{random.randrange(users)}" for _ in range(100_000)]
+        found = timed("random get", len(names), lambda: [store.get(name, "symmetric") for name in names])
+        assert all(value == key for value in found)
+        store.close()
+
+        crash_path = os.path.join(tmp, "crash.db")
+        here = os.path.dirname(os.path.abspath(__file__))
+        subprocess.run([sys.executable, "-c", _CRASH, crash_path, wrapping_key], cwd=here)
+        with KeyStore(crash_path, wrapping_key=wrapping_key) as store:
+            recovered = store.get("committed", "symmetric") is not None
+            lost = store.get("uncommitted", "symmetric") is None
+        print(f"\nAfter a crash: committed write recovered: {recovered}, interrupted batch rolled back: {lost}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,82 @@
+"""
+Memory and membership-check latency of the revocation list at scale:
+Bloom filter + exact key store vs a Python set, delta syncs and opening
+a published filter file with mmap.
+
+    python revocation_benchmark.py [revoked] [error_rate]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from key_store import KeyStore
+from revocation import BloomFilter, RevocationList
+
+CHUNK = 100_000
+
+
+def per_call(label, items, fn):
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    seconds = time.perf_counter() - start
+    print(f"  {label:<36} {seconds / len(items) * 1e6:8.2f} us")
+
+
+def set_bytes(names):
+    """
+    Approximate size of a set holding `names`, from a sample of 100,000.
+    """
+    sample = set(names[:100_000])
+    total = sys.getsizeof(sample) + sum(sys.getsizeof(name) for name in sample)
+    return total * len(names) / len(sample)
+
+
+def main(revoked=10_000_000, error_rate=0.001):
+    revoked, error_rate = int(revoked), float(error_rate)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = KeyStore(os.path.join(tmp, "keys.db"))
+        start = time.perf_counter()
+        for first in range(0, revoked, CHUNK):
+            store.revoke_many(f"user{i}" for i in range(first, min(revoked, first + CHUNK)))
+        print(f"{revoked} revocations written in {time.perf_counter() - start:.1f} s")
+
+        path = os.path.join(tmp, "revoked.bloom")
+        writer = RevocationList(store, path, capacity=revoked, error_rate=error_rate)
+        start = time.perf_counter()
+        writer.publish()
+        print(f"filter built and published in {time.perf_counter() - start:.1f} s")
+
+        start = time.perf_counter()
+        bloom = BloomFilter.load(path)
+        print(f"filter opened with mmap in {(time.perf_counter() - start) * 1e3:.2f} ms")
+        names = [f"user{i}" for i in range(revoked)]
+        print(f"\nMemory for {revoked} revoked ids")
+        print(f"  Bloom filter ({bloom.hashes} hashes)           {len(bloom.array) / 2 ** 20:8.1f} MiB  "
+              f"({bloom.bits / revoked:.1f} bits/entry)")
+        print(f"  Python set of ids (estimated)        {set_bytes(names) / 2 ** 20:8.1f} MiB")
+
+        worker = RevocationList(store, path)
+        worker.sync()
+        outsiders = [f"other{i}" for i in range(100_000)]
+        insiders = names[::max(1, revoked // 20_000)]
+        print("\nis_revoked latency")
+        per_call("not revoked (filter only)", outsiders, worker.is_revoked)
+        per_call("revoked (filter + store)", insiders, worker.is_revoked)
+        false_positives = sum(name in bloom for name in outsiders)
+        print(f"  false positives: {false_positives / len(outsiders):.4%} (expected {error_rate:.4%})")
+        members = set(names)
+        per_call("Python set", outsiders, members.__contains__)
+        del members
+
+        store.revoke_many(f"new{i}" for i in range(1000))
+        start = time.perf_counter()
+        pulled = worker.sync()
+        print(f"\ndelta sync of {pulled} new revocations: {(time.perf_counter() - start) * 1e3:.1f} ms")
+        assert all(worker.is_revoked(f"new{i}") for i in range(1000))
+        store.close()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
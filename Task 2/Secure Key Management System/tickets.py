@@ -0,0 +1,186 @@
+"""
+Stateless Kerberos-style session tickets.
+
+The KDC seals (client id, session key, expiry) under a master key with
+AES-256-GCM. The client gets the session key and the ticket; any replica
+or service holding the master key ring opens the ticket locally, so no
+key store lookup (and no shared store) is needed to hand back or check a
+session key.
+
+Ticket layout (bytes):
+    version (1) | master key id (4) | nonce (12) | AES-GCM(expiry (8) | session key (32) | client id) + tag (16)
+The version and key id are authenticated as associated data.
+
+Master keys rotate through key ids: new tickets are sealed under the
+current key, and older keys stay in the ring (until retired) so tickets
+issued before a rotation can still be opened.
+
+    python tickets.py new keyring.json      # create a key ring
+    python tickets.py rotate keyring.json   # add a key and make it current
+    python tickets.py retire keyring.json 1 # drop key 1
+"""
+import base64
+import json
+import os
+import struct
+import sys
+import threading
+import time
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+TICKET_VERSION = 1
+DEFAULT_LIFETIME = 3600
+_HEADER = struct.Struct(">BI")  # version, master key id
+_EXPIRY = struct.Struct(">Q")
+_NONCE_SIZE = 12
+_SESSION_KEY_SIZE = 32
+
+
+class InvalidTicket(ValueError):
+    pass
+
+
+class MasterKeyRing:
+    """
+    Master keys by id; `current` seals new tickets, all of them open tickets.
+
+        ring = MasterKeyRing.load("keyring.json")   # reloaded when the file changes
+        ticket = seal_ticket(ring, "User123", session_key)
+    """
+
+    def __init__(self, keys=None, current=None, path=None):
+        self.keys = {}  # key id -> AESGCM
+        self._raw = {}  # key id -> key bytes (for saving)
+        for key_id, key in (keys or {}).items():
+            self.add(int(key_id), key)
+        self.current = current if current is not None else max(self.keys, default=None)
+        self.path = path
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def add(self, key_id, key):
+        self.keys[key_id] = AESGCM(key)
+        self._raw[key_id] = key
+
+    def rotate(self):
+        """
+        Adds a new random key with the next id and makes it current.
+        """
+        key_id = max(self.keys, default=0) + 1
+        self.add(key_id, AESGCM.generate_key(bit_length=256))
+        self.current = key_id
+        return key_id
+
+    def retire(self, key_id):
+        """
+        Removes a key; tickets sealed under it no longer open.
+        """
+        if key_id == self.current:
+            raise ValueError("Cannot retire the current master key; rotate first.")
+        self.keys.pop(key_id, None)
+        self._raw.pop(key_id, None)
+
+    def save(self, path=None):
+        path = path or self.path
+        data = {"current": self.current,
+                "keys": {str(k): base64.b64encode(v).decode() for k, v in sorted(self._raw.items())}}
+        tmp = f"{path}.tmp{os.getpid()}"
+        with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        ring = cls(path=path)
+        ring.reload()
+        return ring
+
+    def reload(self):
+        """
+        Re-reads the key ring file if it changed since it was last read.
+        """
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self._mtime:
+            return False
+        with self._lock:
+            with open(self.path) as f:
+                data = json.load(f)
+            raw = {int(key_id): base64.b64decode(key) for key_id, key in data["keys"].items()}
+            # Swap whole dicts so concurrent open_ticket() calls never see a partial ring
+            self.keys, self._raw = {key_id: AESGCM(key) for key_id, key in raw.items()}, raw
+            self.current = data["current"]
+            self._mtime = mtime
+        return True
+
+
+def seal_ticket(ring, client_id, session_key, lifetime=DEFAULT_LIFETIME, now=None):
+    """
+    Ticket for (client id, session key) valid for `lifetime` seconds.
+    session_key is 32 raw bytes or a Fernet key.
+    """
+    if len(session_key) != _SESSION_KEY_SIZE:
+        session_key = base64.urlsafe_b64decode(session_key)
+    expiry = int((time.time() if now is None else now) + lifetime)
+    header = _HEADER.pack(TICKET_VERSION, ring.current)
+    nonce = os.urandom(_NONCE_SIZE)
+    plaintext = _EXPIRY.pack(expiry) + session_key + client_id.encode()
+    return header + nonce + ring.keys[ring.current].encrypt(nonce, plaintext, header)
+
+
+def open_ticket(ring, ticket, now=None):
+    """
+    (client id, session key as a Fernet key, expiry) from a ticket; raises
+    InvalidTicket if it is malformed, tampered with, sealed under an unknown
+    master key or expired.
+    """
+    ticket = bytes(ticket)
+    if len(ticket) < _HEADER.size + _NONCE_SIZE + _EXPIRY.size + _SESSION_KEY_SIZE + 16:
+        raise InvalidTicket("ticket is too short")
+    version, key_id = _HEADER.unpack_from(ticket)
+    if version != TICKET_VERSION:
+        raise InvalidTicket(f"unsupported ticket version {version}")
+    aead = ring.keys.get(key_id)
+    if aead is None:
+        raise InvalidTicket(f"unknown master key id {key_id}")
+    start = _HEADER.size + _NONCE_SIZE
+    try:
+        plaintext = aead.decrypt(ticket[_HEADER.size:start], ticket[start:], ticket[:_HEADER.size])
+    except InvalidTag:
+        raise InvalidTicket("ticket failed authentication") from None
+    (expiry,) = _EXPIRY.unpack_from(plaintext)
+    if (time.time() if now is None else now) > expiry:
+        raise InvalidTicket("ticket has expired")
+    session_key = base64.urlsafe_b64encode(plaintext[_EXPIRY.size:_EXPIRY.size + _SESSION_KEY_SIZE])
+    return plaintext[_EXPIRY.size + _SESSION_KEY_SIZE:].decode(), session_key, expiry
+
+
+def issue_ticket(ring, client_id, lifetime=DEFAULT_LIFETIME):
+    """
+    New session key and its ticket: (Fernet session key, ticket).
+    """
+    session_key = os.urandom(_SESSION_KEY_SIZE)
+    return base64.urlsafe_b64encode(session_key), seal_ticket(ring, client_id, session_key, lifetime)
+
+
+def main(command, path, *args):
+    if command == "new":
+        ring = MasterKeyRing(path=path)
+        ring.rotate()
+        ring.save()
+    else:
+        ring = MasterKeyRing.load(path)
+        if command == "rotate":
+            ring.rotate()
+        elif command == "retire":
+            ring.retire(int(args[0]))
+        elif command != "show":
+            raise SystemExit(f"unknown command {command!r}")
+        if command != "show":
+            ring.save()
+    print(f"{path}: key ids {sorted(ring.keys)}, current {ring.current}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
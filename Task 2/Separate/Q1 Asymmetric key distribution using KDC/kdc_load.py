@@ -0,0 +1,131 @@
+"""
+Load generator for kdc_server.py: many concurrent clients issuing and
+fetching keys through one pooled KDCClient, reporting requests/sec and
+p50/p99 latency.
+
+    python kdc_load.py [clients] [requests_per_client] [pool_size] [host:port]
+
+Without host:port, a server is started in a subprocess with a temporary
+key store and master key ring. While the fetch phase runs, RSA key pairs
+are generated in the background to show that they do not stall the
+server's event loop.
+"""
+import asyncio
+import base64
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from kdc_client import KDCClient, KDCError
+from tickets import MasterKeyRing
+
+USERS = 10_000
+KEY_PAIRS = 16  # RSA key pairs generated during the fetch phase
+
+
+def report(label, latencies, seconds):
+    latencies.sort()
+    n = len(latencies)
+    print(f"  {label:<30} {n / seconds:10,.0f} req/s   p50 {latencies[n // 2] * 1e3:7.2f} ms"
+          f"   p99 {latencies[min(n - 1, n * 99 // 100)] * 1e3:7.2f} ms")
+
+
+async def run_clients(clients, requests, call):
+    """
+    `clients` coroutines each making `requests` sequential calls; returns
+    (latencies, seconds).
+    """
+    latencies = []
+
+    async def client(index):
+        for i in range(requests):
+            start = time.perf_counter()
+            await call(index, i)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(c) for c in range(clients)))
+    return latencies, time.perf_counter() - start
+
+
+async def load(host, port, clients, requests, pool_size):
+    client = await KDCClient.connect(host, port, pool_size)
+    users = [f"user{i}" for i in range(USERS)]
+    print(f"{clients} concurrent clients, {requests} requests each, {pool_size} connections")
+
+    latencies, seconds = await run_clients(
+        clients, max(1, USERS // clients), lambda c, i: client.generate_symmetric_key(users[(c * USERS // clients + i) % USERS]))
+    report("generate_symmetric_key", latencies, seconds)
+
+    key_pairs = asyncio.gather(*(client.generate_key_pair(f"rsa{i}") for i in range(KEY_PAIRS)))
+    latencies, seconds = await run_clients(clients, requests, lambda c, i: client.get_key(random.choice(users)))
+    report(f"get_key (+{KEY_PAIRS} RSA keygens)", latencies, seconds)
+    start = time.perf_counter()
+    await key_pairs
+    print(f"  RSA key pairs finished {time.perf_counter() - start:.2f} s after the fetch phase")
+
+    latencies, seconds = await run_clients(clients, requests, lambda c, i: client.get_public_key(f"rsa{i % KEY_PAIRS}"))
+    report("get_public_key", latencies, seconds)
+
+    try:
+        latencies, seconds = await run_clients(clients, requests, lambda c, i: client.issue_ticket(users[c]))
+        report("issue_ticket", latencies, seconds)
+    except KDCError:
+        print("  issue_ticket: server is not in ticket mode")
+
+    start = time.perf_counter()
+    batches = 0
+    for _ in range(max(1, requests // 10)):
+        await client.get_keys(random.sample(users, 1000))
+        batches += 1
+    seconds = time.perf_counter() - start
+    print(f"  {'get_keys, batches of 1000':<30} {batches * 1000 / seconds:10,.0f} req/s")
+    await client.close()
+
+
+async def wait_for_server(host, port, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
+def main(clients=2000, requests=20, pool_size=4, address=None):
+    clients, requests, pool_size = int(clients), int(requests), int(pool_size)
+    if address:
+        host, port = address.rsplit(":", 1)
+        asyncio.run(load(host, int(port), clients, requests, pool_size))
+        return
+    host, port = "127.0.0.1", random.randrange(20000, 60000)
+    with tempfile.TemporaryDirectory() as tmp:
+        here = os.path.dirname(os.path.abspath(__file__))
+        keyring = MasterKeyRing(path=os.path.join(tmp, "keyring.json"))
+        keyring.rotate()
+        keyring.save()
+        wrapping_key = base64.urlsafe_b64encode(os.urandom(32)).decode()
+        server = subprocess.Popen([sys.executable, os.path.join(here, "kdc_server.py"), str(port),
+                                   os.path.join(tmp, "kdc.db"), keyring.path], cwd=here, stdout=subprocess.DEVNULL,
+                                  env=dict(os.environ, KEY_STORE_WRAPPING_KEY=wrapping_key))
+        try:
+            asyncio.run(wait_for_server(host, port))
+            asyncio.run(load(host, port, clients, requests, pool_size))
+        finally:
+            server.terminate()  # the server shuts down its process pool on SIGTERM
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
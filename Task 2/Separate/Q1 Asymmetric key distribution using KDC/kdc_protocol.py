@@ -0,0 +1,72 @@
+"""
+Wire format shared by kdc_server.py and kdc_client.py.
+
+Every message is a frame: a 4-byte big-endian length followed by that many
+bytes. A request frame carries (request id, operation, user id), a
+response frame (request id, status, body). Clients may send many requests
+without waiting (pipelining); responses carry the request id because slow
+operations can complete out of order.
+"""
+import asyncio
+import struct
+
+# Operations
+GENERATE_SYMMETRIC_KEY = 1  # new Fernet key for the user, stored and returned
+GET_KEY = 2  # the user's stored symmetric key
+GENERATE_KEY_PAIR = 3  # new RSA key pair: public key stored, PKCS#8 DER private key returned
+GET_PUBLIC_KEY = 4  # the user's stored public key (SubjectPublicKeyInfo DER)
+ISSUE_TICKET = 5  # new session key (44-byte Fernet key) followed by its ticket (tickets.py); nothing is stored
+
+# Response status
+OK = 0
+NOT_FOUND = 1
+ERROR = 2
+
+MAX_FRAME = 1 << 20
+_LENGTH = struct.Struct(">I")
+_REQUEST = struct.Struct(">IIB")  # length, request id, operation
+_RESPONSE = struct.Struct(">IIB")  # length, request id, status
+_HEADER = struct.Struct(">IB")  # request id, operation or status
+
+
+def encode_request(request_id, op, user_id):
+    user = user_id.encode()
+    return _REQUEST.pack(_REQUEST.size - 4 + len(user), request_id, op) + user
+
+
+def decode_request(frame):
+    """
+    (request id, operation, user id) from a request frame body.
+    """
+    if len(frame) < _HEADER.size:
+        raise ValueError(f"request frame of {len(frame)} bytes is too short")
+    request_id, op = _HEADER.unpack_from(frame)
+    return request_id, op, bytes(frame[_HEADER.size:]).decode()
+
+
+def encode_response(request_id, status, body=b""):
+    return _RESPONSE.pack(_RESPONSE.size - 4 + len(body), request_id, status) + body
+
+
+def decode_response(frame):
+    """
+    (request id, status, body) from a response frame body.
+    """
+    if len(frame) < _HEADER.size:
+        raise ValueError(f"response frame of {len(frame)} bytes is too short")
+    request_id, status = _HEADER.unpack_from(frame)
+    return request_id, status, bytes(frame[_HEADER.size:])
+
+
+async def read_frame(reader):
+    """
+    Next frame body from a StreamReader, or None at end of stream.
+    """
+    try:
+        header = await reader.readexactly(4)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = _LENGTH.unpack(header)
+    if length > MAX_FRAME:
+        raise ValueError(f"frame of {length} bytes exceeds the limit")
+    return await reader.readexactly(length)
@@ -0,0 +1,189 @@
+"""
+asyncio Key Distribution Center serving keys over TCP (kdc_protocol.py).
+
+    python kdc_server.py [port] [database] [keyring]
+
+- Every connection is read in a loop and requests are answered as they
+  arrive, so a client can pipeline any number of them. At end of stream
+  its outstanding requests are answered before the connection is closed.
+- Key store lookups and Fernet key generation take microseconds and are
+  answered inline. RSA key generation takes tens of milliseconds and runs
+  in a process pool; the request completes later, out of order, while the
+  event loop keeps serving other requests.
+- Responses are written without waiting for each to be sent; the loop
+  only waits (drain) when a slow reader lets the send buffer grow.
+- With a master key ring (tickets.py), ISSUE_TICKET returns a session key
+  sealed in a ticket without touching the store, so any number of
+  replicas sharing the key ring file can issue and open tickets. The
+  file is re-read once a second to pick up rotations.
+"""
+import asyncio
+import multiprocessing
+import os
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Secure Key Management System"))  # shared key_store.py
+from key_store import KeyStore
+from kdc_protocol import (ERROR, GENERATE_KEY_PAIR, GENERATE_SYMMETRIC_KEY, GET_KEY, GET_PUBLIC_KEY,
+                          ISSUE_TICKET, NOT_FOUND, OK, decode_request, encode_response, read_frame)
+from tickets import MasterKeyRing, issue_ticket
+
+DEFAULT_PORT = 8765
+SEND_BUFFER_LIMIT = 1 << 20  # wait for the client to read once this much is queued
+
+
+def generate_key_pair_der(key_size=2048):
+    """
+    Worker task: (PKCS#8 DER private key, SubjectPublicKeyInfo DER public key).
+    """
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    private_der = private_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+    public_der = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return private_der, public_der
+
+
+class KDCServer:
+    """
+    Serves symmetric keys and RSA public keys from a KeyStore.
+
+        server = KDCServer(KeyStore("kdc.db"))
+        await server.start("127.0.0.1", 8765)
+        await server.serve_forever()
+    """
+
+    def __init__(self, store, key_size=2048, workers=None, keyring=None):
+        self.store = store
+        self.keyring = keyring
+        self.key_size = key_size
+        # Workers forked from this process would inherit its client sockets and hold
+        # them open after handle() closes them, so they come from a fork server
+        context = multiprocessing.get_context("forkserver") if "forkserver" in multiprocessing.get_all_start_methods() else None
+        self.executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=context)
+        self.server = None
+        self._tasks = set()  # running slow requests
+        self.requests = 0
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT):
+        self.server = await asyncio.start_server(self.handle, host, port)
+        if self.keyring is not None and self.keyring.path:
+            task = asyncio.create_task(self._reload_keyring())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return self.server
+
+    async def _reload_keyring(self, interval=1.0):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.keyring.reload()
+            except (OSError, ValueError):
+                pass  # keep the current keys until the file is readable again
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def handle(self, reader, writer):
+        pending = set()  # this connection's key pair requests
+        try:
+            while True:
+                frame = await read_frame(reader)
+                if frame is None:
+                    break
+                self.requests += 1
+                request_id, op, user_id = decode_request(frame)
+                if op == GENERATE_KEY_PAIR:
+                    task = asyncio.create_task(self._generate_key_pair(request_id, user_id, writer))
+                    for tasks in (self._tasks, pending):
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                else:
+                    writer.write(self.answer(request_id, op, user_id))
+                    if writer.transport.get_write_buffer_size() > SEND_BUFFER_LIMIT:
+                        await writer.drain()
+            # The client finished sending; answer its outstanding key pairs before closing
+            await asyncio.gather(*pending, return_exceptions=True)
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def answer(self, request_id, op, user_id):
+        """
+        Response frame for a request that is answered inline.
+        """
+        if op == GENERATE_SYMMETRIC_KEY:
+            key = Fernet.generate_key()
+            self.store.put(user_id, "symmetric", key)
+            return encode_response(request_id, OK, key)
+        if op in (GET_KEY, GET_PUBLIC_KEY):
+            value = self.store.get(user_id, "symmetric" if op == GET_KEY else "public")
+            return encode_response(request_id, NOT_FOUND) if value is None else encode_response(request_id, OK, value)
+        if op == ISSUE_TICKET:
+            if self.keyring is None:
+                return encode_response(request_id, ERROR, b"ticket mode is not enabled")
+            session_key, ticket = issue_ticket(self.keyring, user_id)
+            return encode_response(request_id, OK, session_key + ticket)
+        return encode_response(request_id, ERROR, b"unknown operation")
+
+    async def _generate_key_pair(self, request_id, user_id, writer):
+        loop = asyncio.get_running_loop()
+        try:
+            private_der, public_der = await loop.run_in_executor(self.executor, generate_key_pair_der, self.key_size)
+            self.store.put(user_id, "public", public_der)
+            response = encode_response(request_id, OK, private_der)
+        except Exception as exc:
+            response = encode_response(request_id, ERROR, str(exc).encode())
+        if not writer.is_closing():
+            writer.write(response)
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass  # the client went away; handle() closes the writer
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+        for task in self._tasks:
+            task.cancel()
+        self.executor.shutdown(cancel_futures=True)
+
+
+async def main(port=DEFAULT_PORT, database=None, keyring=None):
+    store = KeyStore(database)
+    if not store.can_store_secrets:
+        raise SystemExit(f"{store.path} needs a wrapping key for the keys it stores: set KEY_STORE_WRAPPING_KEY "
+                         "(python key_store.py prints a new one).")
+    server = KDCServer(store, keyring=MasterKeyRing.load(keyring) if keyring else None)
+    await server.start("127.0.0.1", int(port))
+    print(f"KDC listening on 127.0.0.1:{port}", flush=True)
+    # Shut down cleanly on SIGTERM too, so the process pool workers exit with the server
+    stop = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    except NotImplementedError:
+        pass  # no signal handlers on Windows event loops; Ctrl+C still works
+    try:
+        await stop.wait()
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(*sys.argv[1:]))
+    except KeyboardInterrupt:
+        pass
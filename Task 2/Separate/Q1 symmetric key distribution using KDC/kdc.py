@@ -1,22 +1,34 @@
+import os
+import sys
 from cryptography.fernet import Fernet
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Secure Key Management System"))  # shared key_store.py
+from key_store import KeyStore
+from tickets import MasterKeyRing, issue_ticket, open_ticket
 
 # Generate a symmetric key
 def generate_symmetric_key():
     key = Fernet.generate_key()
     return key
 
-# Securely store the key (simulated storage)
-stored_keys = {}
+# Securely store the key (SQLite database, see key_store.py)
+stored_keys = KeyStore()
 def store_key(user_id, key):
-    stored_keys[user_id] = key  # In practice, store securely in a database
+    stored_keys.put(user_id, "symmetric", key)
 
 # Secure key retrieval
 def get_key(user_id):
-    return stored_keys.get(user_id, None)
+    return stored_keys.get(user_id, "symmetric")
 
-# Example Usage
-user_id = "User123"
-symmetric_key = generate_symmetric_key()
-store_key(user_id, symmetric_key)
+# Example Usage (run as a script; importing this module touches no files)
+if __name__ == "__main__":
+    user_id = "User123"
+    symmetric_key = generate_symmetric_key()
+    store_key(user_id, symmetric_key)
 
-print(f"Distributed Symmetric Key for {user_id}: {get_key(user_id)}")
+    print(f"Distributed Symmetric Key for {user_id}: {get_key(user_id)}")
+
+    # Stateless alternative: a ticket that any KDC replica or service holding the master keys can open
+    master_keys = MasterKeyRing()
+    master_keys.rotate()
+    session_key, ticket = issue_ticket(master_keys, user_id)
+    print(f"Ticket for {user_id} ({len(ticket)} bytes) opens to: {open_ticket(master_keys, ticket)[:2]}")
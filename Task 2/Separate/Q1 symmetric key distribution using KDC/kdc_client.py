@@ -0,0 +1,204 @@
+"""
+asyncio client for kdc_server.py.
+
+- A KDCClient keeps a pool of connections and sends each request on the
+  live connection with the fewest requests in flight. Connections the
+  server closed are reopened in the background.
+- Requests are pipelined: each gets a request id and a future, and one
+  reader task per connection resolves the futures as responses arrive.
+- Requests made in the same event loop iteration are batched: they are
+  buffered and written to the socket together by one write call.
+
+    client = await KDCClient.connect("127.0.0.1", 8765, pool_size=4)
+    key = await client.generate_symmetric_key("Alice")
+    keys = await client.get_keys(["Alice", "Bob"])
+    await client.close()
+"""
+import asyncio
+import itertools
+
+from kdc_protocol import (GENERATE_KEY_PAIR, GENERATE_SYMMETRIC_KEY, GET_KEY, GET_PUBLIC_KEY,
+                          ISSUE_TICKET, NOT_FOUND, OK, decode_response, encode_request, read_frame)
+
+FERNET_KEY_SIZE = 44
+
+
+class KDCError(Exception):
+    pass
+
+
+class KDCConnection:
+    """
+    One pipelined connection; use KDCClient rather than this directly.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pending = {}  # request id -> future
+        self._ids = itertools.count(1)
+        self._buffer = []
+        self._loop = asyncio.get_running_loop()
+        self._reader_task = asyncio.create_task(self._read_responses())
+
+    @property
+    def closed(self):
+        return self._reader_task.done()
+
+    def request(self, op, user_id):
+        """
+        Queues a request; returns a future for (status, body).
+        """
+        if self.closed:
+            raise ConnectionError("KDC connection is closed")
+        request_id = next(self._ids) & 0xFFFFFFFF
+        future = self._loop.create_future()
+        self.pending[request_id] = future
+        if not self._buffer:
+            self._loop.call_soon(self._flush)
+        self._buffer.append(encode_request(request_id, op, user_id))
+        return future
+
+    def _flush(self):
+        if self._buffer and not self.writer.is_closing():
+            self.writer.write(b"".join(self._buffer))
+        self._buffer.clear()
+
+    async def _read_responses(self):
+        error = ConnectionError("KDC closed the connection")
+        try:
+            while True:
+                frame = await read_frame(self.reader)
+                if frame is None:
+                    break
+                request_id, status, body = decode_response(frame)
+                future = self.pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result((status, body))
+        except (ConnectionError, ValueError) as exc:
+            error = exc
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self.pending.clear()
+
+    async def close(self):
+        self._flush()
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._reader_task
+
+
+class KDCClient:
+    """
+    Pool of pipelined connections to one KDC server.
+    """
+
+    def __init__(self, connections, host="127.0.0.1", port=8765):
+        self.connections = connections
+        self.host = host
+        self.port = port
+        self._reconnecting = {}  # pool slot -> task reopening its connection
+        self._closed = False
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=8765, pool_size=4):
+        connections = []
+        for _ in range(pool_size):
+            reader, writer = await asyncio.open_connection(host, port)
+            connections.append(KDCConnection(reader, writer))
+        return cls(connections, host, port)
+
+    async def request(self, op, user_id):
+        """
+        (status, body) of one request. Raises ConnectionError only when no
+        connection in the pool is alive.
+        """
+        alive = [connection for connection in self.connections if not connection.closed]
+        if len(alive) < len(self.connections):
+            self._reconnect_closed()
+        if not alive:
+            raise ConnectionError("no KDC connection is alive")
+        connection = min(alive, key=lambda c: len(c.pending))
+        return await connection.request(op, user_id)
+
+    def _reconnect_closed(self):
+        """
+        Starts reopening every closed connection that is not already being
+        reopened; a failed attempt is retried by the next request.
+        """
+        if self._closed:
+            return
+        for slot, connection in enumerate(self.connections):
+            if connection.closed and slot not in self._reconnecting:
+                self._reconnecting[slot] = asyncio.create_task(self._reconnect(slot))
+
+    async def _reconnect(self, slot):
+        try:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+            old, self.connections[slot] = self.connections[slot], KDCConnection(reader, writer)
+            await old.close()
+        except OSError:
+            pass
+        finally:
+            self._reconnecting.pop(slot, None)
+
+    async def _value(self, op, user_id):
+        status, body = await self.request(op, user_id)
+        if status == OK:
+            return body
+        if status == NOT_FOUND:
+            return None
+        raise KDCError(body.decode(errors="replace"))
+
+    async def generate_symmetric_key(self, user_id):
+        return await self._value(GENERATE_SYMMETRIC_KEY, user_id)
+
+    async def get_key(self, user_id):
+        """
+        The user's symmetric key, or None.
+        """
+        return await self._value(GET_KEY, user_id)
+
+    async def get_keys(self, user_ids):
+        """
+        Symmetric keys of many users, sent as one batch of pipelined requests.
+        """
+        return await asyncio.gather(*(self._value(GET_KEY, user_id) for user_id in user_ids))
+
+    async def generate_key_pair(self, user_id):
+        """
+        New RSA key pair for the user; returns the private key as PKCS#8 DER
+        (the KDC keeps only the public key).
+        """
+        return await self._value(GENERATE_KEY_PAIR, user_id)
+
+    async def get_public_key(self, user_id):
+        """
+        The user's public key as SubjectPublicKeyInfo DER, or None.
+        """
+        return await self._value(GET_PUBLIC_KEY, user_id)
+
+    async def issue_ticket(self, user_id):
+        """
+        (session key, ticket) from a KDC in ticket mode. Services holding the
+        master key ring open the ticket with tickets.open_ticket().
+        """
+        body = await self._value(ISSUE_TICKET, user_id)
+        return body[:FERNET_KEY_SIZE], body[FERNET_KEY_SIZE:]
+
+    async def close(self):
+        self._closed = True
+        for task in list(self._reconnecting.values()):
+            task.cancel()
+        await asyncio.gather(*self._reconnecting.values(), return_exceptions=True)
+        await asyncio.gather(*(connection.close() for connection in self.connections))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -0,0 +1,72 @@
+"""
+Ticket issue/verify throughput on one core and on all cores, compared
+with looking the session key up in the key store.
+
+    python tickets_benchmark.py [count] [workers]
+"""
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Secure Key Management System"))  # shared key_store.py
+from key_store import KeyStore, generate_wrapping_key
+from tickets import MasterKeyRing, issue_ticket, open_ticket
+
+
+def rate(fn, count):
+    start = time.perf_counter()
+    fn(count)
+    return count / (time.perf_counter() - start)
+
+
+def _issue(ring, count):
+    for i in range(count):
+        issue_ticket(ring, f"user{i}")
+
+
+def _verify(ring, tickets, count):
+    for i in range(count):
+        open_ticket(ring, tickets[i % len(tickets)])
+
+
+def _worker(count):
+    """
+    (issued/s, verified/s) in one process.
+    """
+    ring = MasterKeyRing()
+    ring.rotate()
+    tickets = [issue_ticket(ring, f"user{i}")[1] for i in range(1000)]
+    return rate(lambda n: _issue(ring, n), count), rate(lambda n: _verify(ring, tickets, n), count)
+
+
+def main(count=200_000, workers=os.cpu_count()):
+    count, workers = int(count), int(workers)
+    ring = MasterKeyRing()
+    ring.rotate()
+    session_key, ticket = issue_ticket(ring, "User123")
+    print(f"ticket size for a 7-character client id: {len(ticket)} bytes")
+    ring.rotate()
+    assert open_ticket(ring, ticket)[:2] == ("User123", session_key)  # still opens after a rotation
+
+    issued, verified = _worker(count)
+    print(f"\nOne core:  issue {issued:10,.0f} tickets/s   verify {verified:10,.0f} tickets/s")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        start = time.perf_counter()
+        list(pool.map(_worker, [count] * workers))
+        seconds = time.perf_counter() - start
+    total = 2 * count * workers
+    print(f"{workers} processes: {total:,} issues + verifies in {seconds:.1f} s "
+          f"({total / seconds:,.0f} ops/s, {total / seconds / workers:,.0f} per core)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = KeyStore(os.path.join(tmp, "keys.db"), wrapping_key=generate_wrapping_key())
+        store.put_many((f"user{i}", "symmetric", os.urandom(44), None) for i in range(100_000))
+        lookups = rate(lambda n: [store.get(f"user{i % 100_000}", "symmetric") for i in range(n)], count)
+        store.close()
+    print(f"\nKey store lookup (for comparison, one process): {lookups:10,.0f} keys/s")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
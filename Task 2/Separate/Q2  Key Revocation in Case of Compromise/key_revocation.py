@@ -1,10 +1,17 @@
+import os
+import sys
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives import serialization
+from key_pool import KeyPairPool
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Secure Key Management System"))  # shared key_store.py
+from key_store import KeyStore, serialize_key, deserialize_key
+from revocation import RevocationList
 
-# Key Storage
-key_store = {}  # Stores active keys
-revoked_keys = set()  # Stores revoked user IDs
+# Key Storage (SQLite database, see key_store.py)
+key_store = KeyStore()  # Stores active keys and revoked user IDs
+revocations = RevocationList(key_store, os.environ.get("REVOCATION_FILTER_PATH"))  # Bloom filter over revoked user IDs
+key_pool = None  # Pre-generated RSA key pairs (see start_key_pool)
 
 
 # Function to Generate a Symmetric Key (AES-256 using Fernet)
@@ -12,8 +19,27 @@ def generate_symmetric_key():
     return Fernet.generate_key()
 
 
-# Function to Generate an Asymmetric Key Pair (RSA-2048)
+# Function to Start the Key Pool (worker processes keep RSA-2048 key pairs ready)
+def start_key_pool(low_watermark=4, high_watermark=16, workers=None):
+    global key_pool
+    if key_pool is None:
+        key_pool = KeyPairPool(key_size=2048, low_watermark=low_watermark,
+                               high_watermark=high_watermark, workers=workers)
+    return key_pool
+
+
+# Function to Stop the Key Pool (key generation becomes synchronous again)
+def stop_key_pool():
+    global key_pool
+    if key_pool is not None:
+        key_pool.close()
+        key_pool = None
+
+
+# Function to Generate an Asymmetric Key Pair (RSA-2048), taken from the key pool when it is running
 def generate_asymmetric_keys():
+    if key_pool is not None:
+        return key_pool.get()
     private_key = rsa.generate_private_key(
         public_exponent=65537,
         key_size=2048
@@ -24,20 +50,23 @@ def generate_asymmetric_keys():
 
 # Function to Store Keys Securely
 def store_key(user_id, key_type, key):
-    if user_id in revoked_keys:
+    if revocations.is_revoked(user_id):
         print(f"Cannot store key for {user_id}, as they are revoked.")
         return
-    if user_id not in key_store:
-        key_store[user_id] = {}
-    key_store[user_id][key_type] = key
+    key_store.put(user_id, key_type, serialize_key(key))
     print(f"Stored {key_type} key for {user_id}")
 
 
+# Function to Load a Stored Key (None if the user has no key of that type)
+def get_key(user_id, key_type):
+    return deserialize_key(key_type, key_store.get(user_id, key_type))
+
+
 # Function to Revoke a User's Keys
 def revoke_key(user_id):
-    if user_id in key_store:
-        revoked_keys.add(user_id)
-        del key_store[user_id]
+    if key_store.has_user(user_id):
+        key_store.revoke(user_id)
+        revocations.add(user_id)
         print(f"Revoked all keys for {user_id}")
     else:
         print(f"No keys found for {user_id}")
@@ -45,42 +74,46 @@ def revoke_key(user_id):
 
 # Function to Check if a User's Key is Revoked
 def is_key_revoked(user_id):
-    return user_id in revoked_keys
+    return revocations.is_revoked(user_id)
 
 
-# Function to Print Revoked Keys
-def print_revoked_keys():
-    if revoked_keys:
+# Function to Print Revoked Keys (the first `limit`, in order of revocation)
+def print_revoked_keys(limit=20):
+    total = key_store.revocation_version()
+    if total:
         print("\nRevoked Keys List:")
-        for user in revoked_keys:
+        for _, user in key_store.revocations_since(0, limit):
             print(f"- {user}")
+        if total > limit:
+            print(f"... and {total - limit} more")
     else:
         print("\nNo revoked keys found.")
 
 
 # Example Usage
-user_id1 = "User123"
-user_id2 = "User456"
+if __name__ == "__main__":
+    user_id1 = "User123"
+    user_id2 = "User456"
 
-# Step 1: Generate Keys
-symmetric_key1 = generate_symmetric_key()
-private_key1, public_key1 = generate_asymmetric_keys()
+    # Step 1: Generate Keys
+    symmetric_key1 = generate_symmetric_key()
+    private_key1, public_key1 = generate_asymmetric_keys()
 
-symmetric_key2 = generate_symmetric_key()
-private_key2, public_key2 = generate_asymmetric_keys()
+    symmetric_key2 = generate_symmetric_key()
+    private_key2, public_key2 = generate_asymmetric_keys()
 
-# Step 2: Store Keys
-store_key(user_id1, "symmetric", symmetric_key1)
-store_key(user_id1, "private", private_key1)
-store_key(user_id1, "public", public_key1)
+    # Step 2: Store Keys
+    store_key(user_id1, "symmetric", symmetric_key1)
+    store_key(user_id1, "private", private_key1)
+    store_key(user_id1, "public", public_key1)
 
-store_key(user_id2, "symmetric", symmetric_key2)
-store_key(user_id2, "private", private_key2)
-store_key(user_id2, "public", public_key2)
+    store_key(user_id2, "symmetric", symmetric_key2)
+    store_key(user_id2, "private", private_key2)
+    store_key(user_id2, "public", public_key2)
 
-# Step 3: Revoke Keys and Print Revoked List
-revoke_key(user_id1)
-revoke_key(user_id2)
+    # Step 3: Revoke Keys and Print Revoked List
+    revoke_key(user_id1)
+    revoke_key(user_id2)
 
-# Step 4: Display Revoked Keys
-print_revoked_keys()
+    # Step 4: Display Revoked Keys
+    print_revoked_keys()
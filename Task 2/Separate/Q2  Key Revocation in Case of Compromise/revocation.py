@@ -0,0 +1,270 @@
+"""
+Fast revocation checks for many worker processes.
+
+- A Bloom filter answers "certainly not revoked" for almost every user
+  without touching the key store; only its positives (real revocations
+  and a configurable false-positive rate) are confirmed against the exact
+  `revoked` table of the key store.
+- Revocations are numbered in the key store's revocation log. A
+  RevocationList remembers the last version it has seen and pulls only
+  the newer revocations (the delta) when it syncs.
+- A filter is saved as a small header followed by its bit array. Workers
+  open the file with mmap, so all processes on a host share one read-only
+  copy in the page cache; revocations newer than the file are kept in a
+  small in-process set until the next file is published.
+"""
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+
+MAGIC = b"RVBF"
+VERSION = 1
+_HEADER = struct.Struct(">4sBBHQQQ")  # magic, format version, hashes, reserved, bits, count, list version
+
+
+class BloomFilter:
+    """
+    Bloom filter over strings, using double hashing of one BLAKE2b digest.
+
+        bloom = BloomFilter.for_capacity(10_000_000, error_rate=0.001)
+        bloom.add("Alice")
+        "Alice" in bloom   # True; "Bob" in bloom is False except for false positives
+    """
+
+    def __init__(self, bits, hashes, buffer=None, count=0, version=0):
+        self.bits = bits
+        self.hashes = hashes
+        self.array = bytearray((bits + 7) // 8) if buffer is None else buffer
+        self.count = count
+        self.version = version  # revocation log version included in the filter
+
+    @classmethod
+    def for_capacity(cls, capacity, error_rate=0.001):
+        """
+        Filter sized for `capacity` entries at the given false-positive rate.
+        """
+        capacity = max(1, capacity)
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        return cls(bits, max(1, round(bits / capacity * math.log(2))))
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        bits = self.bits
+        return [(h1 + i * h2) % bits for i in range(self.hashes)]
+
+    def add(self, item):
+        array = self.array
+        for pos in self._positions(item):
+            array[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        array = self.array
+        for pos in self._positions(item):
+            if not array[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def false_positive_rate(self):
+        """
+        Expected false-positive rate at the current number of entries.
+        """
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+    def to_bytes(self):
+        header = _HEADER.pack(MAGIC, VERSION, self.hashes, 0, self.bits, self.count, self.version)
+        return header + bytes(self.array)
+
+    def save(self, path):
+        """
+        Writes the filter atomically: readers see the old file or the new one.
+        """
+        tmp = f"{path}.tmp{os.getpid()}"
+        with open(tmp, "wb") as f:
+            f.write(self.to_bytes())
+        os.replace(tmp, path)
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        magic, version, hashes, _, bits, count, list_version = _HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a revocation filter file")
+        array = memoryview(buffer)[_HEADER.size:]
+        if len(array) != (bits + 7) // 8:
+            raise ValueError("revocation filter file is truncated")
+        return cls(bits, hashes, array, count, list_version)
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """
+        Opens a saved filter; with mmap it is read-only and shared between processes.
+        """
+        with open(path, "rb") as f:
+            if use_mmap:
+                return cls.from_buffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            return cls.from_buffer(bytearray(f.read()))
+
+    def close(self):
+        """
+        Unmaps a filter opened with load(); it cannot be queried afterwards.
+        """
+        if isinstance(self.array, memoryview):
+            buffer = self.array.obj
+            self.array.release()
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+
+class RevocationList:
+    """
+    Revocation checks backed by a KeyStore: Bloom filter first, exact
+    store for positives, deltas pulled from the revocation log.
+
+        revocations = RevocationList(key_store, filter_path="revoked.bloom")
+        revocations.is_revoked("Alice")
+        revocations.publish()   # writer: save an up-to-date filter file
+
+    Without a filter file (or when it is missing), the filter is built from
+    the revocation log. Deltas are pulled at most every `sync_interval`
+    seconds, so a revocation made by another process is seen within that
+    time; revocations made through add() are seen at once.
+    """
+
+    def __init__(self, store, filter_path=None, capacity=1_000_000, error_rate=0.001,
+                 sync_interval=1.0):
+        self.store = store
+        self.filter_path = filter_path
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.bloom = None
+        self.recent = set()  # revocations newer than the filter
+        self.version = 0
+        self._next_sync = 0.0
+        self._filter_id = None
+        self._lock = threading.Lock()
+        self.checks = self.filter_hits = self.false_positives = 0
+
+    def _open(self):
+        """
+        Switches to the filter file when it is new or has been republished,
+        otherwise (first call, no file) starts an in-process filter.
+        """
+        try:
+            # publish() replaces the file, so a new inode marks a new filter even when
+            # the coarse file clock gives two publishes the same mtime
+            st = os.stat(self.filter_path) if self.filter_path else None
+            file_id = None if st is None else (st.st_ino, st.st_mtime_ns)
+        except FileNotFoundError:
+            file_id = None
+        if file_id is not None and file_id != self._filter_id:
+            old, self.bloom = self.bloom, BloomFilter.load(self.filter_path)
+            self._filter_id = file_id
+            # Everything in `recent` is either in the new filter or in the delta after
+            # it, which the caller pulls next
+            self.recent = set()
+            self.version = self.bloom.version
+            if old is not None:
+                old.close()
+        elif self.bloom is None:
+            self.bloom = BloomFilter.for_capacity(max(self.capacity, self.store.revocation_version() * 2),
+                                                  self.error_rate)
+
+    def sync(self):
+        """
+        Pulls revocations newer than the last seen version; returns how many.
+        """
+        with self._lock:
+            self._open()
+            return self._pull()
+
+    def _pull(self):
+        pulled = 0
+        writable = isinstance(self.bloom.array, bytearray)
+        while True:
+            delta = self.store.revocations_since(self.version)
+            if not delta:
+                break
+            for version, user_id in delta:
+                if writable:
+                    self.bloom.add(user_id)
+                    self.recent.discard(user_id)  # folded into the filter
+                else:
+                    self.recent.add(user_id)
+            self.version = delta[-1][0]
+            pulled += len(delta)
+        if writable:
+            self.bloom.version = self.version
+        self._next_sync = time.monotonic() + self.sync_interval
+        return pulled
+
+    def add(self, user_id):
+        """
+        Records a revocation made by this process (already written to the store).
+        """
+        if self.bloom is None:
+            self.sync()
+        self.recent.add(user_id)
+
+    def might_be_revoked(self, user_id):
+        """
+        Filter check only: False means certainly not revoked.
+        """
+        if self.bloom is None or time.monotonic() >= self._next_sync:
+            self.sync()
+        try:
+            return user_id in self.recent or user_id in self.bloom
+        except ValueError:  # another thread swapped in a new filter and closed this one
+            return user_id in self.recent or user_id in self.bloom
+
+    def is_revoked(self, user_id):
+        self.checks += 1
+        if not self.might_be_revoked(user_id):
+            return False
+        self.filter_hits += 1
+        if self.store.is_revoked(user_id):
+            return True
+        self.false_positives += 1
+        return False
+
+    def publish(self, path=None):
+        """
+        Saves a filter with every revocation up to now and switches to it;
+        workers that reopen the file get it without replaying the log.
+        """
+        path = path or self.filter_path
+        if path is None:
+            raise ValueError("publish() needs a path when the list has no filter_path")
+        with self._lock:
+            version = self.store.revocation_version()
+            bloom = BloomFilter.for_capacity(max(self.capacity, version), self.error_rate)
+            start = 0
+            while True:
+                delta = self.store.revocations_since(start)
+                if not delta:
+                    break
+                for _, user_id in delta:
+                    bloom.add(user_id)
+                start = delta[-1][0]
+            bloom.version = start
+            bloom.save(path)
+            self.filter_path, self._filter_id = path, None
+            self._open()
+            self._pull()
+        return path
+
+    def metrics(self):
+        return {
+            "version": self.version,
+            "filter_entries": self.bloom.count if self.bloom is not None else 0,
+            "recent": len(self.recent),
+            "checks": self.checks,
+            "filter_hits": self.filter_hits,
+            "false_positives": self.false_positives,
+        }
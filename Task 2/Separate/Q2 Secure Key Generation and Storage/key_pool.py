@@ -0,0 +1,215 @@
+"""
+Pool of pre-generated RSA key pairs for instant key issuance.
+
+Worker processes generate key pairs in the background and a feeder thread
+keeps the pool between two watermarks:
+- get() pops a ready pair (a few microseconds).
+- When the depth drops below low_watermark, the pool is refilled up to
+  high_watermark.
+- When the pool is empty, get() falls back to generating a pair synchronously.
+- A failed generation is counted in metrics(); if a worker dies (e.g. it is
+  OOM-killed) the process pool is replaced and refilling carries on.
+
+Key pairs leave the workers as unencrypted PKCS#8 DER and never touch disk.
+They are loaded without OpenSSL's RSA key check (see _load_generated_key).
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+
+def generate_key_pair(key_size=2048, public_exponent=65537):
+    """
+    Generates an RSA key pair synchronously.
+    """
+    private_key = rsa.generate_private_key(public_exponent=public_exponent, key_size=key_size)
+    return private_key, private_key.public_key()
+
+
+def _generate_der(key_size, public_exponent):
+    """
+    Worker task: returns (PKCS#8 DER private key, seconds taken).
+    """
+    start = time.perf_counter()
+    private_key, _ = generate_key_pair(key_size, public_exponent)
+    der = private_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+    return der, time.perf_counter() - start
+
+
+def _load_generated_key(der):
+    """
+    Private key object for DER made by _generate_der.
+
+    unsafe_skip_rsa_key_validation skips the consistency check OpenSSL runs
+    on every RSA key it loads (primes, CRT values, d * e = 1), which exists
+    for keys from untrusted sources. These keys come from
+    rsa.generate_private_key in one of the pool's own worker processes and
+    only cross the executor's local pipe, so the check would re-prove what
+    the generator just built, at a cost (about 30 ms for RSA-2048) above
+    that of generating the key, paid in the process serving get().
+    Never use this for keys read from files, the key store or the network.
+    """
+    return serialization.load_der_private_key(der, password=None, unsafe_skip_rsa_key_validation=True)
+
+
+class KeyPairPool:
+    """
+    Bounded pool of RSA key pairs refilled by worker processes.
+
+        pool = KeyPairPool(low_watermark=4, high_watermark=16)
+        private_key, public_key = pool.get()
+        pool.metrics()  # depth, hits, misses, refill latency, ...
+        pool.close()
+    """
+
+    def __init__(self, key_size=2048, public_exponent=65537, low_watermark=4,
+                 high_watermark=16, workers=None):
+        if not 0 <= low_watermark < high_watermark:
+            raise ValueError("Watermarks must satisfy 0 <= low_watermark < high_watermark.")
+        self.key_size = key_size
+        self.public_exponent = public_exponent
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self._pairs = deque()
+        self._lock = threading.Condition()
+        self._wake = threading.Event()
+        self._closed = False
+        self._stats = {"hits": 0, "misses": 0, "generated": 0, "refills": 0, "failures": 0,
+                       "executor_restarts": 0, "generation_seconds": 0.0, "last_refill_seconds": None}
+        self._workers = workers
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._feeder = threading.Thread(target=self._feed, name="key-pool-feeder", daemon=True)
+        self._feeder.start()
+        self._wake.set()  # initial fill
+
+    def get(self):
+        """
+        Returns (private_key, public_key): a pooled pair when one is ready,
+        otherwise a freshly generated one.
+        """
+        with self._lock:
+            pair = self._pairs.popleft() if self._pairs else None
+            self._stats["hits" if pair else "misses"] += 1
+            if len(self._pairs) < self.low_watermark:
+                self._wake.set()
+        return pair or generate_key_pair(self.key_size, self.public_exponent)
+
+    def depth(self):
+        with self._lock:
+            return len(self._pairs)
+
+    def wait_until_full(self, timeout=None):
+        """
+        Blocks until the pool reaches high_watermark. Returns False on timeout.
+        """
+        with self._lock:
+            return self._lock.wait_for(lambda: len(self._pairs) >= self.high_watermark, timeout)
+
+    def metrics(self):
+        """
+        Snapshot of pool depth, hit/miss counts and refill/generation latency.
+        """
+        with self._lock:
+            stats = dict(self._stats, depth=len(self._pairs))
+        generated = stats.pop("generation_seconds")
+        stats["mean_generation_seconds"] = generated / stats["generated"] if stats["generated"] else None
+        return stats
+
+    def _feed(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                return
+            started = time.perf_counter()
+            restarted = False
+            while not self._closed:
+                with self._lock:
+                    missing = self.high_watermark - len(self._pairs)
+                if missing <= 0:
+                    break
+                failed = broken = False
+                try:
+                    futures = [self._executor.submit(_generate_der, self.key_size, self.public_exponent)
+                               for _ in range(missing)]
+                except BrokenProcessPool:
+                    futures, failed, broken = [], True, True
+                except RuntimeError:  # executor shut down by close()
+                    return
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    try:
+                        der, seconds = future.result()
+                        private_key = _load_generated_key(der)
+                    except Exception as exc:
+                        failed = True
+                        broken = broken or isinstance(exc, BrokenProcessPool)
+                        with self._lock:
+                            self._stats["failures"] += 1
+                        continue
+                    with self._lock:
+                        self._pairs.append((private_key, private_key.public_key()))
+                        self._stats["generated"] += 1
+                        self._stats["generation_seconds"] += seconds
+                        self._lock.notify_all()
+                if broken and not restarted:
+                    self._restart_executor()
+                    restarted = True
+                    continue  # retry once on the fresh pool
+                if failed:
+                    break  # don't spin on failing workers; the next get() below low_watermark retries
+            with self._lock:
+                self._stats["refills"] += 1
+                self._stats["last_refill_seconds"] = time.perf_counter() - started
+
+    def _restart_executor(self):
+        """
+        Replaces a process pool that lost a worker; a broken pool accepts no new tasks.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            broken, self._executor = self._executor, ProcessPoolExecutor(max_workers=self._workers)
+            self._stats["executor_restarts"] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        """
+        Stops the feeder and the worker processes; pooled keys are dropped.
+        """
+        self._closed = True
+        self._wake.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._feeder.join()
+        self._executor.shutdown(wait=True)  # in case the feeder replaced a broken pool meanwhile
+        with self._lock:
+            self._pairs.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    with KeyPairPool(low_watermark=2, high_watermark=8) as pool:
+        start = time.perf_counter()
+        generate_key_pair()
+        print(f"Synchronous generation: {(time.perf_counter() - start) * 1e3:.1f} ms")
+        pool.wait_until_full()
+        start = time.perf_counter()
+        for _ in range(8):
+            pool.get()
+        print(f"Pooled get:             {(time.perf_counter() - start) / 8 * 1e6:.1f} us")
+        print(pool.metrics())
@@ -1,13 +1,37 @@
+import os
+import sys
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives import serialization
+from key_pool import KeyPairPool
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Secure Key Management System"))  # shared key_store.py
+from key_store import KeyStore, serialize_key, deserialize_key
+
+key_pool = None  # Pre-generated RSA key pairs (see start_key_pool)
 
 # Generate a Symmetric Key (AES-256 using Fernet)
 def generate_symmetric_key():
     return Fernet.generate_key()
 
-# Generate an Asymmetric Key Pair (RSA-2048)
+# Start the Key Pool (worker processes keep RSA-2048 key pairs ready)
+def start_key_pool(low_watermark=4, high_watermark=16, workers=None):
+    global key_pool
+    if key_pool is None:
+        key_pool = KeyPairPool(key_size=2048, low_watermark=low_watermark,
+                               high_watermark=high_watermark, workers=workers)
+    return key_pool
+
+# Stop the Key Pool (key generation becomes synchronous again)
+def stop_key_pool():
+    global key_pool
+    if key_pool is not None:
+        key_pool.close()
+        key_pool = None
+
+# Generate an Asymmetric Key Pair (RSA-2048), taken from the key pool when it is running
 def generate_asymmetric_keys():
+    if key_pool is not None:
+        return key_pool.get()
     private_key = rsa.generate_private_key(
         public_exponent=65537,
         key_size=2048
@@ -15,35 +39,41 @@ def generate_asymmetric_keys():
     public_key = private_key.public_key()
     return private_key, public_key
 
-# Store keys securely (Simulated database)
-key_store = {}
+# Store keys securely (SQLite database, see key_store.py); each key type is kept separately
+key_store = KeyStore()
 
 def store_key(user_id, key_type, key):
-    key_store[user_id] = {key_type: key}
+    key_store.put(user_id, key_type, serialize_key(key))
     print(f"Stored {key_type} key for {user_id}")
 
+# Load a stored key (None if the user has no key of that type)
+def get_key(user_id, key_type):
+    return deserialize_key(key_type, key_store.get(user_id, key_type))
+
 # Example Usage
-user_id = "User123"
-symmetric_key = generate_symmetric_key()
-private_key, public_key = generate_asymmetric_keys()
-
-store_key(user_id, "symmetric", symmetric_key)
-store_key(user_id, "private", private_key)
-store_key(user_id, "public", public_key)
-
-# Display the Keys
-print("\nGenerated Symmetric Key:")
-print(symmetric_key.decode())
-
-print("\nGenerated Private Key (RSA-2048):")
-print(private_key.private_bytes(
-    encoding=serialization.Encoding.PEM,
-    format=serialization.PrivateFormat.TraditionalOpenSSL,
-    encryption_algorithm=serialization.NoEncryption()
-).decode())
-
-print("\nGenerated Public Key (RSA-2048):")
-print(public_key.public_bytes(
-    encoding=serialization.Encoding.PEM,
-    format=serialization.PublicFormat.SubjectPublicKeyInfo
-).decode())
+if __name__ == "__main__":
+    user_id = "User123"
+    symmetric_key = generate_symmetric_key()
+    private_key, public_key = generate_asymmetric_keys()
+
+    store_key(user_id, "symmetric", symmetric_key)
+    store_key(user_id, "private", private_key)
+    store_key(user_id, "public", public_key)
+    print(f"Key types on record for {user_id}: {sorted(key_store.get_user(user_id))}")
+
+    # Display the Keys
+    print("\nGenerated Symmetric Key:")
+    print(symmetric_key.decode())
+
+    print("\nGenerated Private Key (RSA-2048):")
+    print(private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.NoEncryption()
+    ).decode())
+
+    print("\nGenerated Public Key (RSA-2048):")
+    print(public_key.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode())
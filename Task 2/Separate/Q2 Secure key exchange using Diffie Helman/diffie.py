@@ -1,7 +1,8 @@
-from cryptography.hazmat.primitives.asymmetric import dh
+from dh_params import DHParameterProvider
 
-# Generate DH parameters
-parameters = dh.generate_parameters(generator=2, key_size=2048)
+# Load DH parameters (cached generated ones, or the RFC 7919 ffdhe2048 group)
+# Fresh parameters: python dh_params.py generate 2048 2
+parameters = DHParameterProvider().get(key_size=2048, generator=2)
 
 # Generate Private Keys for two parties
 private_key_A = parameters.generate_private_key()
@@ -0,0 +1,36 @@
+"""
+Loads the lab and task scripts by path for the tests.
+
+The scripts are not packages and several directories have modules of the
+same name (vignereCipher.py, playfairCipher.py, dh_params.py, ...), so
+load() puts the script's own directory first on sys.path and drops any
+same-named module another directory loaded before importing it.
+"""
+import importlib
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_loaded = {}
+
+
+def load(relative_path):
+    """
+    The module at ROOT/relative_path, imported once.
+    """
+    path = os.path.join(ROOT, relative_path)
+    if path not in _loaded:
+        directory, name = os.path.split(path)
+        for sibling in os.listdir(directory):
+            stem, ext = os.path.splitext(sibling)
+            module = sys.modules.get(stem)
+            if ext == ".py" and module is not None and os.path.dirname(getattr(module, "__file__", "") or "") != directory:
+                del sys.modules[stem]
+        sys.path.insert(0, directory)
+        try:
+            _loaded[path] = importlib.import_module(os.path.splitext(name)[0])
+        finally:
+            # Keep the directory searchable, last, for lazy imports and process pool workers
+            sys.path.remove(directory)
+            sys.path.append(directory)
+    return _loaded[path]
@@ -0,0 +1,43 @@
+import random
+
+from modules import load
+
+pipeline = load("Task 1/Hybrid Cipher/cipherPipeline.py")
+
+
+def columnar(text, key):
+    order = sorted(range(len(key)), key=lambda i: (key.upper()[i], i))
+    return "".join(text[column::len(key)] for column in order)
+
+
+def test_columnar_known_answer():
+    assert columnar("WEAREDISCOVEREDFLEEATONCE", "ZEBRAS") == "EVLNACDTESEAROFODEECWIREE"
+    stage = pipeline.CipherPipeline([pipeline.Columnar("ZEBRAS")])
+    assert stage.encrypt("WEAREDISCOVEREDFLEEATONCE") == "EVLNACDTESEAROFODEECWIREE"
+    assert stage.decrypt("EVLNACDTESEAROFODEECWIREE") == "WEAREDISCOVEREDFLEEATONCE"
+
+
+def test_columnar_long_key():
+    # More than 2^16 columns: the column ranks no longer fit in uint16
+    rng = random.Random(1)
+    key = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(70_000))
+    text = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz ") for _ in range(150_000))
+    stage = pipeline.CipherPipeline([pipeline.Columnar(key)])
+    assert stage.encrypt(text) == columnar(text, key)
+    assert stage.decrypt(stage.encrypt(text)) == text
+
+
+def test_substitution_known_answers():
+    assert pipeline.CipherPipeline([pipeline.Caesar(3)]).encrypt("Hello, World") == "Khoor, Zruog"
+    assert pipeline.CipherPipeline([pipeline.Vigenere("LEMON")]).encrypt("ATTACKATDAWN") == "LXFOPVEFRNHR"
+
+
+def test_pipeline_round_trip_and_stream():
+    stages = [pipeline.Caesar(3), pipeline.Vigenere("KEY"), pipeline.RailFence(3), pipeline.Columnar("ZEBRA")]
+    chain = pipeline.CipherPipeline(stages)
+    text = "The quick brown fox jumps over the lazy dog. " * 40
+    cipher = chain.encrypt(text)
+    assert chain.decrypt(cipher) == text
+    chunks = [text[i:i + 37] for i in range(0, len(text), 37)]
+    streamed = "".join(chain.stream(chunks, frame_size=256))
+    assert "".join(chain.stream([streamed], decrypt=True, frame_size=256)) == text
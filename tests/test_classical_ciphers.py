@@ -0,0 +1,100 @@
+import pytest
+
+from modules import load
+
+caesar = load("Lab programs/Lab1_Ceasure Cipher/ceasureCipher.py")
+mono = load("Lab programs/Lab2_Monoalphabetic Cipher/monoalphabeticCipher.py")
+hill = load("Lab programs/Lab4_Hill Cipher/hillCipher.py")
+lab_vigenere = load("Lab programs/Lab5_vigenere Cipher/vignereCipher.py")
+vigenere = load("Task 1/Vigniere Cipher/vignereCipher.py")
+analysis = load("Task 1/Vigniere Cipher/vigenereAnalysis.py")
+
+ENGLISH = ("It is a truth universally acknowledged, that a single man in possession of a good "
+           "fortune, must be in want of a wife. However little known the feelings or views of such "
+           "a man may be on his first entering a neighbourhood, this truth is so well fixed in the "
+           "minds of the surrounding families, that he is considered the rightful property of some "
+           "one or other of their daughters.")
+
+
+def test_caesar_known_answer_and_types():
+    assert caesar.encrypt("Hello, World!", 3) == "Khoor, Zruog!"
+    assert caesar.encrypt(b"Hello, World!", 3) == b"Khoor, Zruog!"
+    assert caesar.decrypt(bytearray(b"Khoor"), 3) == b"Hello"
+    assert caesar.encrypt("xyz", 29) == "abc"
+    assert caesar.decrypt(caesar.encrypt(ENGLISH, 11), 11) == ENGLISH
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_caesar_file_round_trip(tmp_path, use_mmap):
+    src, enc, dec = tmp_path / "plain", tmp_path / "enc", tmp_path / "dec"
+    src.write_bytes(ENGLISH.encode() * 50)
+    assert caesar.encrypt_file(src, enc, 7, chunk_size=1000, use_mmap=use_mmap) == src.stat().st_size
+    assert enc.read_bytes() == caesar.encrypt(src.read_bytes(), 7)
+    caesar.decrypt_file(enc, dec, 7, chunk_size=1000, use_mmap=use_mmap)
+    assert dec.read_bytes() == src.read_bytes()
+    (tmp_path / "empty").write_bytes(b"")
+    assert caesar.encrypt_file(tmp_path / "empty", tmp_path / "out", 7, use_mmap=use_mmap) == 0
+
+
+def test_crack_caesar():
+    assert caesar.crack_caesar(caesar.encrypt(ENGLISH, 19)) == (19, ENGLISH)
+    messages = [caesar.encrypt(ENGLISH, shift) for shift in range(26)]
+    assert [shift for shift, _ in caesar.crack_caesar_batch(messages)] == list(range(26))
+    assert caesar.crack_caesar_batch([]) == []
+
+
+def test_substitution_known_answer():
+    cipher = mono.SubstitutionCipher(mono.keys)
+    assert cipher.encrypt("hello") == "eyiil"
+    assert cipher.encrypt("Hello, World 42!") == "Eyiil, Qlaix 42!"
+    assert cipher.decrypt(b"Eyiil") == b"Hello"
+    assert cipher.decrypt_many(cipher.encrypt_many([ENGLISH, "abc"])) == [ENGLISH, "abc"]
+    with pytest.raises(ValueError):
+        mono.SubstitutionCipher("abc")
+
+
+def test_substitution_file_round_trip(tmp_path):
+    cipher = mono.SubstitutionCipher("QWERTYUIOPASDFGHJKLZXCVBNM")
+    (tmp_path / "plain").write_bytes(ENGLISH.encode() * 20)
+    cipher.encrypt_file(tmp_path / "plain", tmp_path / "enc", chunk_size=333)
+    cipher.decrypt_file(tmp_path / "enc", tmp_path / "dec", chunk_size=333)
+    assert (tmp_path / "dec").read_bytes() == ENGLISH.encode() * 20
+
+
+def test_hill_known_answer():
+    key = [[3, 3], [2, 5]]
+    assert hill.hill_cipher_encrypt("HELP", key) == ("HIAT", 0)
+    assert hill.hill_cipher_decrypt("HIAT", key, 0) == "HELP"
+
+
+def test_hill_round_trip_and_batch():
+    key = [[6, 24, 1], [13, 16, 10], [20, 17, 15]]
+    messages = ["ACT", "attack at dawn", "HELLOWORLD"]
+    batch = hill.hill_cipher_encrypt_batch(messages, key)
+    assert batch == [hill.hill_cipher_encrypt(m, key) for m in messages]
+    assert hill.hill_cipher_decrypt_batch(batch, key) == [m.upper().replace(" ", "") for m in messages]
+    assert hill.hill_cipher_encrypt("ACT", key)[0] == "POH"
+    with pytest.raises(ValueError):
+        hill.key_inverse([[2, 4], [6, 8]])  # determinant shares a factor with 26
+
+
+def test_vigenere_known_answer():
+    assert lab_vigenere.vignereCipher("ATTACKATDAWN", "LEMON") == "LXFOPVEFRNHR"
+    assert lab_vigenere.vignereCipher_decrypt("LXFOPVEFRNHR", "LEMON") == "ATTACKATDAWN"
+    assert vigenere.encrypt_vigenere("Attack at dawn!", "LEMON") == "Lxfopv ef rnhr!"
+    assert vigenere.decrypt_vigenere(b"Lxfopv ef rnhr!", "LEMON") == b"Attack at dawn!"
+    with pytest.raises(ValueError):
+        vigenere.encrypt_vigenere("text", "123")
+
+
+def test_vigenere_stream_matches_one_shot():
+    stream = vigenere.VigenereStream("KEYWORD")
+    chunks = [ENGLISH[i:i + 17] for i in range(0, len(ENGLISH), 17)]
+    assert "".join(stream.update(c) for c in chunks) == vigenere.encrypt_vigenere(ENGLISH, "KEYWORD")
+
+
+def test_vigenere_analysis_recovers_key():
+    cipher = vigenere.encrypt_vigenere(ENGLISH * 3, "LEMON")
+    key, plain = analysis.recover_plaintext(cipher)
+    assert key == "LEMON"
+    assert plain == ENGLISH * 3
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from modules import load
+
+des = load("Lab programs/Lab6_DES/des.py")
+
+KEY = bytes.fromhex("133457799BBCDFF1")
+IV = bytes.fromhex("1234567890ABCDEF")
+
+
+def reference(key, mode):
+    algorithms = pytest.importorskip("cryptography.hazmat.decrepit.ciphers.algorithms")
+    from cryptography.hazmat.primitives.ciphers import Cipher
+    return Cipher(algorithms.TripleDES(key), mode)
+
+
+def test_des_known_answer():
+    cipher = des.DES(KEY)
+    assert cipher.encrypt_block(bytes.fromhex("0123456789ABCDEF")) == bytes.fromhex("85E813540F0AB405")
+    assert cipher.decrypt_block(bytes.fromhex("85E813540F0AB405")) == bytes.fromhex("0123456789ABCDEF")
+
+
+def test_des_batch_matches_single_blocks():
+    cipher = des.DES(KEY)
+    data = os.urandom(8 * 100)
+    expected = b"".join(cipher.encrypt_block(data[i:i + 8]) for i in range(0, len(data), 8))
+    assert cipher.encrypt_blocks(data) == expected
+    assert cipher.decrypt_blocks(expected) == data
+
+
+def test_triple_des_with_equal_keys_is_des():
+    block = bytes.fromhex("0123456789ABCDEF")
+    assert des.TripleDES(KEY * 3).encrypt_block(block) == des.DES(KEY).encrypt_block(block)
+
+
+def test_triple_des_matches_cryptography():
+    from cryptography.hazmat.primitives.ciphers import modes
+    key = bytes(range(1, 25))
+    data = os.urandom(1000)
+    ours = des.TripleDES(key)
+    padded = des.pkcs7_pad(data)
+    expected_ecb = reference(key, modes.ECB()).encryptor().update(padded)
+    expected_cbc = reference(key, modes.CBC(IV)).encryptor().update(padded)
+    start = int.from_bytes(IV, "big")
+    counters = b"".join(((start + i) % 2**64).to_bytes(8, "big") for i in range(-(-len(data) // 8)))
+    stream = reference(key, modes.ECB()).encryptor().update(counters)
+    expected_ctr = bytes(a ^ b for a, b in zip(data, stream))
+    assert ours.encrypt_ecb(data) == expected_ecb
+    assert ours.encrypt_cbc(data, IV) == expected_cbc
+    assert ours.ctr(data, IV) == expected_ctr
+
+
+@pytest.mark.parametrize("size", [0, 1, 8, 15, 16, 1000])
+def test_modes_round_trip(size):
+    cipher = des.DES(KEY)
+    data = os.urandom(size)
+    assert cipher.decrypt_ecb(cipher.encrypt_ecb(data)) == data
+    assert cipher.decrypt_cbc(cipher.encrypt_cbc(data, IV), IV) == data
+    assert cipher.ctr(cipher.ctr(data, IV), IV) == data
+
+
+def test_rejects_bad_lengths():
+    cipher = des.DES(KEY)
+    with pytest.raises(ValueError):
+        cipher.decrypt_cbc(b"", IV)
+    with pytest.raises(ValueError):
+        cipher.decrypt_cbc(b"x" * 12, IV)
+    with pytest.raises(ValueError):
+        cipher.encrypt_cbc(b"data", IV[:7])
+    with pytest.raises(ValueError):
+        cipher.decrypt_cbc(b"x" * 16, IV + b"\0")
+    with pytest.raises(ValueError):
+        cipher.ctr(b"data", b"short")
+    with pytest.raises(ValueError):
+        des.DES(b"short")
+    with pytest.raises(ValueError):
+        cipher.decrypt_ecb(cipher.encrypt_blocks(b"A" * 8))  # no valid padding
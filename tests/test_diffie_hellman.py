@@ -0,0 +1,36 @@
+import pytest
+
+from modules import load
+
+diffie_hellman = load("Lab programs/Lab8_Diffie Hellman/diffie_hellman.py")
+
+
+def test_textbook_example():
+    group = diffie_hellman.DHGroup(23, 5)
+    assert (group.public_key(6), group.public_key(15)) == (8, 19)
+    assert group.shared_secret(6, 19) == group.shared_secret(15, 8) == 2
+
+
+def test_fixed_base_table_matches_pow():
+    p = 2 ** 127 - 1
+    group = diffie_hellman.DHGroup(p, 3)
+    for x, y in group.generate_keypairs(20):
+        assert y == pow(3, x, p)
+
+
+def test_batch_agreement():
+    group = diffie_hellman.DHGroup(2 ** 127 - 1, 3)
+    alice, bob = group.generate_keypairs(10), group.generate_keypairs(10)
+    ours = group.shared_secrets([x for x, _ in alice], [y for _, y in bob])
+    theirs = group.shared_secrets([x for x, _ in bob], [y for _, y in alice])
+    assert ours == theirs
+
+
+def test_rejects_small_subgroup_keys():
+    group = diffie_hellman.DHGroup(23, 5)
+    for bad in (0, 1, 22):
+        with pytest.raises(ValueError):
+            group.shared_secret(6, bad)
+    assert group.shared_secret(6, 22, check=False) == 1
+    with pytest.raises(ValueError):
+        diffie_hellman.DHGroup(23, 1)
@@ -0,0 +1,68 @@
+import secrets
+
+import pytest
+
+from modules import load
+
+ec_engine = load("Lab programs/Lab8_ECC/ec_engine.py")
+ec_codec = load("Lab programs/Lab8_ECC/ec_codec.py")
+
+CURVE = "brainpoolP256r1"
+
+
+def random_points(count):
+    engine = ec_engine.get_engine(CURVE)
+    return [engine.mul_base(secrets.randbelow(engine.n - 1) + 1) for _ in range(count)]
+
+
+def test_generator_encodings():
+    codec = ec_codec.get_codec(CURVE)
+    engine = codec.engine
+    g = engine.mul_base(1)
+    x, y = (v.to_bytes(32, "big") for v in g)
+    assert codec.encode(g, compressed=False) == b"\x04" + x + y
+    assert codec.encode(g) == bytes([2 | (g[1] & 1)]) + x
+    assert codec.encode(None) == b"\x00" and codec.decode(b"\x00") is None
+
+
+@pytest.mark.parametrize("compressed", [True, False])
+def test_round_trip(compressed):
+    codec = ec_codec.get_codec(CURVE)
+    for point in random_points(50):
+        data = codec.encode(point, compressed)
+        assert len(data) == codec.record_size(compressed)
+        assert codec.decode(data) == point
+
+
+def test_rejects_invalid_encodings():
+    codec = ec_codec.get_codec(CURVE)
+    point = random_points(1)[0]
+    data = codec.encode(point, compressed=False)
+    off_curve = data[:-1] + bytes([data[-1] ^ 1])
+    for bad in [b"", b"\x05" + data[1:], data[:-1], off_curve, b"\x02" + b"\xff" * 32]:
+        with pytest.raises(ValueError):
+            codec.decode(bad)
+
+
+def test_sqrt():
+    codec = ec_codec.get_codec(CURVE)
+    p = codec.engine.p
+    for a in [0, 1, 4, secrets.randbelow(p)]:
+        square = a * a % p
+        root = codec.sqrt(square)
+        assert root * root % p == square
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_packed_key_file(tmp_path, use_mmap):
+    points = random_points(20)
+    path = tmp_path / "keys.ecpk"
+    ec_codec.save_keys(path, CURVE, points)
+    with ec_codec.PackedKeys.load(path, use_mmap=use_mmap) as keys:
+        assert len(keys) == 20 and keys.curve == CURVE
+        assert list(keys) == points and keys[7] == points[7]
+        assert keys.x_coordinates() == [x for x, _ in points]
+    with pytest.raises(ValueError):
+        ec_codec.pack_keys(CURVE, [None])
+    with pytest.raises(ValueError):
+        ec_codec.PackedKeys(ec_codec.pack_keys(CURVE, points)[:-1])
@@ -0,0 +1,54 @@
+import secrets
+
+from tinyec import registry
+
+from modules import load
+
+ec_engine = load("Lab programs/Lab8_ECC/ec_engine.py")
+
+CURVE = "brainpoolP256r1"
+
+
+def reference(k, point):
+    result = k * point
+    return None if result.x is None else (result.x, result.y)
+
+
+def test_mul_and_mul_base_match_tinyec():
+    engine = ec_engine.get_engine(CURVE)
+    g = registry.get_curve(CURVE).g
+    for k in [1, 2, 3, 255, engine.n - 1, engine.n, secrets.randbelow(engine.n)]:
+        assert engine.mul_base(k) == reference(k, g)
+        assert engine.mul(k, g) == reference(k, g)
+        assert engine.mul(k, (g.x, g.y)) == reference(k, g)
+
+
+def test_mul_many_matches_mul():
+    engine = ec_engine.get_engine(CURVE)
+    g = registry.get_curve(CURVE).g
+    points = [engine.mul_base(secrets.randbelow(engine.n)) for _ in range(20)] + [None]
+    scalars = [secrets.randbelow(engine.n) for _ in points[:-1]] + [5]
+    scalars[3] = 0
+    assert engine.mul_many(scalars, points) == [engine.mul(k, q) for k, q in zip(scalars, points)]
+    assert engine.mul_base_many(scalars) == [reference(k, g) for k in scalars]
+
+
+def test_ecdh_batch_agrees_with_both_sides():
+    engine = ec_engine.get_engine(CURVE)
+    peers = [secrets.randbelow(engine.n - 1) + 1 for _ in range(10)]
+    peer_publics = [engine.mul_base(d) for d in peers]
+    scalars = [secrets.randbelow(engine.n - 1) + 1 for _ in peers]
+    # points as a generator: it is read once
+    publics, shared = ec_engine.ecdh_batch(CURVE, scalars, (q for q in peer_publics), workers=1)
+    assert publics == [engine.mul_base(k) for k in scalars]
+    assert shared == [engine.mul(d, q) for d, q in zip(peers, publics)]
+
+
+def test_ecdh_batch_with_one_shared_point_and_workers():
+    engine = ec_engine.get_engine(CURVE)
+    peer = engine.mul_base(12345)
+    scalars = [secrets.randbelow(engine.n - 1) + 1 for _ in range(9)]
+    expected = [engine.mul(k, peer) for k in scalars]
+    assert ec_engine.ecdh_batch(CURVE, scalars, peer, workers=1)[1] == expected
+    assert ec_engine.ecdh_batch(CURVE, scalars, list(peer), workers=1)[1] == expected
+    assert ec_engine.ecdh_batch(CURVE, scalars, engine.to_point(peer), workers=2, chunk_size=4)[1] == expected
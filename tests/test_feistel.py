@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from modules import load
+
+feistel = load("Lab programs/Lab5_Fiestal Cipher/fiestalCipher.py")
+
+IV = bytes(range(8))
+
+
+def test_string_feistel_round_trip():
+    keys = [3, 17, 42, 99]
+    assert feistel.feistel_decrypt(feistel.feistel_encrypt("HELLOWORLD", keys), keys) == "HELLOWORLD"
+
+
+def test_vectorized_matches_scalar_rounds():
+    cipher = feistel.FeistelCipher.from_key(b"secret key")
+    data = os.urandom(8 * 64)
+    expected = b""
+    for i in range(0, len(data), 8):
+        left, right = (int.from_bytes(data[i + j:i + j + 4], "big") for j in (0, 4))
+        left, right = cipher._encrypt_halves(left, right)
+        expected += left.to_bytes(4, "big") + right.to_bytes(4, "big")
+    assert cipher.encrypt_blocks(data) == expected
+    assert cipher.decrypt_blocks(expected) == data
+
+
+@pytest.mark.parametrize("size", [0, 1, 8, 15, 16, 1000])
+def test_modes_round_trip(size):
+    cipher = feistel.FeistelCipher.from_key(b"secret key")
+    data = os.urandom(size)
+    assert cipher.decrypt_ecb(cipher.encrypt_ecb(data)) == data
+    assert cipher.decrypt_cbc(cipher.encrypt_cbc(data, IV), IV) == data
+    assert cipher.ctr(cipher.ctr(data, IV), IV) == data
+
+
+def test_parallel_ctr_matches_serial():
+    cipher = feistel.FeistelCipher.from_key(b"secret key")
+    data = os.urandom(10_000)
+    assert cipher.ctr(data, IV, workers=2, segment_size=1000) == cipher.ctr(data, IV)
+
+
+def test_rejects_bad_lengths():
+    cipher = feistel.FeistelCipher.from_key(b"secret key")
+    with pytest.raises(ValueError):
+        cipher.decrypt_cbc(b"", IV)
+    with pytest.raises(ValueError):
+        cipher.decrypt_cbc(b"x" * 12, IV)
+    with pytest.raises(ValueError):
+        cipher.encrypt_cbc(b"data", IV[:4])
+    with pytest.raises(ValueError):
+        cipher.decrypt_cbc(b"x" * 16, IV * 2)
+    with pytest.raises(ValueError):
+        cipher.ctr(b"data", b"short")
@@ -0,0 +1,49 @@
+from modules import load
+
+hybrid = load("Task 1/Hybrid Cipher/hybridCipher.py")
+
+
+def zigzag(text, key):
+    rows, row, step = [[] for _ in range(key)], 0, 1
+    for ch in text:
+        rows[row].append(ch)
+        if key > 1:
+            step = 1 if row == 0 else -1 if row == key - 1 else step
+            row += step
+    return "".join("".join(r) for r in rows)
+
+
+def test_rail_fence_known_answer():
+    assert hybrid.rail_fence_encrypt("WEAREDISCOVEREDFLEEATONCE", 3) == "WECRLTEERDSOEEFEAOCAIVDEN"
+    assert hybrid.rail_fence_decrypt("WECRLTEERDSOEEFEAOCAIVDEN", 3) == "WEAREDISCOVEREDFLEEATONCE"
+
+
+def test_rail_fence_matches_zigzag():
+    text = "The quick brown fox jumps over the lazy dog, 0123456789!"
+    for key in range(1, len(text) + 2):
+        assert hybrid.rail_fence_encrypt(text, key) == zigzag(text, key)
+        assert hybrid.rail_fence_decrypt(zigzag(text, key), key) == text
+
+
+def test_rail_fence_long_key():
+    # More than 2^16 rails: the rail numbers no longer fit in uint16
+    text = "".join(chr(ord("A") + i % 26) for i in range(150_000))
+    cipher = hybrid.rail_fence_encrypt(text, 70_000)
+    assert cipher == zigzag(text, 70_000)
+    assert hybrid.rail_fence_decrypt(cipher, 70_000) == text
+    assert hybrid.rail_fence_encrypt(text, 200_000) == text  # more rails than characters
+
+
+def test_hybrid_round_trip():
+    for text in ["HELLO WORLD", "Attack at dawn!", "Zebra-crossing 42"]:
+        cipher = hybrid.hybrid_encrypt(text, 7, 4)
+        assert hybrid.hybrid_decrypt(cipher, 7, 4) == text
+
+
+def test_crack_hybrid_ciphertext():
+    text = "It was the best of times, it was the worst of times, it was the age of wisdom."
+    cipher = hybrid.hybrid_encrypt(text, 11, 5)
+    shift, _ = hybrid.crack_caesar(cipher)
+    assert shift == 11
+    assert hybrid.rail_fence_decrypt(hybrid.caesar_decipher(cipher, shift), 5) == text
+    assert [s for s, _ in hybrid.crack_caesar_batch([cipher, cipher.encode()])] == [11, 11]
@@ -0,0 +1,35 @@
+import asyncio
+
+from modules import load
+
+kdc_server = load("Task 2/Separate/Q1 symmetric key distribution using KDC/kdc_server.py")
+protocol = load("Task 2/Separate/Q1 symmetric key distribution using KDC/kdc_protocol.py")
+key_store = load("Task 2/Secure Key Management System/key_store.py")
+
+
+async def pipelined_then_eof():
+    server = kdc_server.KDCServer(key_store.KeyStore(), key_size=1024, workers=1)
+    await server.start("127.0.0.1", 0)
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.server.sockets[0].getsockname()[1])
+        writer.write(protocol.encode_request(1, protocol.GENERATE_KEY_PAIR, "Alice")
+                     + protocol.encode_request(2, protocol.GENERATE_SYMMETRIC_KEY, "Bob")
+                     + protocol.encode_request(3, protocol.GET_KEY, "Bob"))
+        writer.write_eof()  # the client is done sending; the server answers and then closes
+        responses = {}
+        while (frame := await asyncio.wait_for(protocol.read_frame(reader), 30)) is not None:
+            request_id, status, body = protocol.decode_response(frame)
+            responses[request_id] = (status, body)
+        writer.close()
+        return server, responses
+    finally:
+        server.close()
+
+
+def test_answers_key_pairs_before_closing_on_eof():
+    server, responses = asyncio.run(pipelined_then_eof())
+    assert sorted(responses) == [1, 2, 3]
+    assert all(status == protocol.OK for status, _ in responses.values())
+    assert responses[2][1] == responses[3][1]
+    assert server.store.get("Alice", "public") is not None
+    assert not server._tasks
@@ -0,0 +1,71 @@
+import pytest
+
+from modules import load
+
+key_expiry = load("Task 2/Secure Key Management System/key_expiry.py")
+
+
+def make_scheduler(lead_time=0.0, fail=None):
+    calls = {"expire": [], "prepare": []}
+
+    def on_expire(batch):
+        if fail and fail.pop():
+            raise RuntimeError("store is locked")
+        calls["expire"].append(batch)
+
+    def on_prepare(batch):
+        calls["prepare"].append(batch)
+
+    scheduler = key_expiry.ExpiryScheduler(on_expire, on_prepare if lead_time else None,
+                                           lead_time=lead_time, clock=lambda: 0.0)
+    return scheduler, calls
+
+
+def test_expires_in_deadline_order():
+    scheduler, calls = make_scheduler()
+    scheduler.schedule_many([("Carol", 30.0), ("Alice", 10.0)])
+    scheduler.schedule("Bob", 20.0)
+    assert scheduler.sweep(now=5.0) == 0
+    assert scheduler.sweep(now=25.0) == 2
+    assert calls["expire"] == [[("Alice", 10.0), ("Bob", 20.0)]]
+    assert len(scheduler) == 1 and scheduler.deadline("Carol") == 30.0
+
+
+def test_cancel_and_reschedule():
+    scheduler, calls = make_scheduler()
+    scheduler.schedule("Alice", 10.0)
+    scheduler.schedule("Bob", 10.0)
+    scheduler.schedule("Alice", 50.0)
+    scheduler.cancel("Bob")
+    assert scheduler.sweep(now=20.0) == 0
+    assert scheduler.metrics()["heap_size"] == 1  # stale entries were dropped
+    scheduler.sweep(now=50.0)
+    assert calls["expire"] == [[("Alice", 50.0)]]
+
+
+def test_prepare_runs_lead_time_before_expiry():
+    scheduler, calls = make_scheduler(lead_time=5.0)
+    scheduler.schedule("Alice", 10.0)
+    scheduler.sweep(now=6.0)
+    assert calls == {"prepare": [[("Alice", 10.0)]], "expire": []}
+    scheduler.sweep(now=10.0)
+    assert calls["expire"] == [[("Alice", 10.0)]]
+    metrics = scheduler.metrics()
+    assert (metrics["prepared"], metrics["expired"], metrics["pending"]) == (1, 1, 0)
+
+
+def test_max_work_spreads_a_burst():
+    scheduler, calls = make_scheduler()
+    scheduler.schedule_many((f"user{i}", float(i)) for i in range(10))
+    assert [scheduler.sweep(now=100.0, max_work=4) for _ in range(4)] == [4, 4, 2, 0]
+    assert sum(len(batch) for batch in calls["expire"]) == 10
+
+
+def test_failed_batch_is_retried():
+    scheduler, calls = make_scheduler(fail=[False, True])  # popped from the end: fail once
+    scheduler.schedule("Alice", 10.0)
+    with pytest.raises(RuntimeError):
+        scheduler.sweep(now=10.0)
+    assert scheduler.deadline("Alice") == 10.0
+    assert scheduler.sweep(now=11.0) == 1
+    assert calls["expire"] == [[("Alice", 10.0)]]
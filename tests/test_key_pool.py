@@ -0,0 +1,29 @@
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+
+from modules import load
+
+key_pool = load("Task 2/Secure Key Management System/key_pool.py")
+
+
+def test_pooled_pairs_are_valid_keys():
+    with key_pool.KeyPairPool(key_size=1024, low_watermark=0, high_watermark=2, workers=1) as pool:
+        assert pool.wait_until_full(timeout=60)
+        private_key, public_key = pool.get()
+        assert pool.metrics()["hits"] == 1
+    # The pool skipped OpenSSL's check on load; the full check accepts the key
+    der = private_key.private_bytes(serialization.Encoding.DER, serialization.PrivateFormat.PKCS8,
+                                    serialization.NoEncryption())
+    checked = serialization.load_der_private_key(der, password=None)
+    assert checked.private_numbers() == private_key.private_numbers()
+    signature = private_key.sign(b"message", padding.PKCS1v15(), hashes.SHA256())
+    public_key.verify(signature, b"message", padding.PKCS1v15(), hashes.SHA256())
+
+
+def test_empty_pool_generates_synchronously():
+    with key_pool.KeyPairPool(key_size=1024, low_watermark=0, high_watermark=1, workers=1) as pool:
+        pool.wait_until_full(timeout=60)
+        pool.get()
+        private_key, public_key = pool.get()
+        assert public_key.public_numbers() == private_key.public_key().public_numbers()
+        assert pool.metrics()["misses"] >= 1
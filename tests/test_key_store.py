@@ -0,0 +1,126 @@
+import os
+import stat
+import subprocess
+import sys
+
+import pytest
+
+from modules import load
+
+key_store = load("Task 2/Secure Key Management System/key_store.py")
+
+
+@pytest.fixture
+def wrapping_key():
+    return key_store.generate_wrapping_key()
+
+
+def test_memory_store_by_default(monkeypatch):
+    monkeypatch.delenv("KEY_STORE_PATH", raising=False)
+    monkeypatch.delenv("KEY_STORE_WRAPPING_KEY", raising=False)
+    with key_store.KeyStore() as store:
+        assert store.in_memory and store.can_store_secrets
+        store.put("Alice", "symmetric", b"secret", expiry=123.0)
+        assert store.get("Alice", "symmetric") == b"secret"
+        assert store.get_entry("Alice", "symmetric") == (b"secret", 123.0)
+        assert store.get("Bob", "symmetric") is None
+
+
+def test_file_store_seals_secrets(tmp_path, wrapping_key):
+    path = str(tmp_path / "keys.db")
+    with key_store.KeyStore(path, wrapping_key=wrapping_key) as store:
+        store.put("Alice", "symmetric", b"fernet-key")
+        store.put("Alice", "public", b"public-der")
+        store.put_many([("Bob", "private", b"private-der", None)])
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    raw = open(path, "rb").read() + (open(path + "-wal", "rb").read() if os.path.exists(path + "-wal") else b"")
+    assert b"fernet-key" not in raw and b"private-der" not in raw
+    with key_store.KeyStore(path, wrapping_key=wrapping_key) as store:
+        assert store.get_user("Alice") == {"symmetric": b"fernet-key", "public": b"public-der"}
+        assert store.get("Bob", "private") == b"private-der"
+    with key_store.KeyStore(path, wrapping_key=key_store.generate_wrapping_key()) as store:
+        with pytest.raises(ValueError):
+            store.get("Alice", "symmetric")
+
+
+def test_file_store_refuses_plaintext_secrets(tmp_path, monkeypatch):
+    monkeypatch.delenv("KEY_STORE_WRAPPING_KEY", raising=False)
+    with key_store.KeyStore(str(tmp_path / "keys.db")) as store:
+        assert not store.can_store_secrets
+        store.put("Alice", "public", b"public-der")  # public material needs no wrapping
+        with pytest.raises(ValueError):
+            store.put("Alice", "symmetric", b"secret")
+        with pytest.raises(ValueError):
+            store.put_many([("Alice", "private", b"secret", None)])
+
+
+def test_sealed_value_is_bound_to_its_row(tmp_path, wrapping_key):
+    with key_store.KeyStore(str(tmp_path / "keys.db"), wrapping_key=wrapping_key) as store:
+        store.put("Alice", "symmetric", b"alice-key")
+        sealed = store.db.execute("SELECT value FROM keys WHERE user_id = 'Alice'").fetchone()[0]
+        store.db.execute("INSERT INTO keys VALUES ('Mallory', 'symmetric', ?, NULL)", (sealed,))
+        with pytest.raises(ValueError):
+            store.get("Mallory", "symmetric")
+
+
+def test_batch_rolls_back_on_error():
+    store = key_store.KeyStore()
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            store.put("Alice", "symmetric", b"a")
+            raise RuntimeError
+    assert len(store) == 0
+    with store.batch():
+        with store.batch():
+            store.put("Alice", "symmetric", b"a")
+        store.put("Bob", "symmetric", b"b")
+    assert len(store) == 2
+
+
+def test_revocations():
+    store = key_store.KeyStore()
+    store.put("Alice", "symmetric", b"a")
+    store.put("Alice", "public", b"p")
+    store.revoke("Alice")
+    store.revoke_many(["Bob", "Alice"])  # revoking again is not logged twice
+    assert not store.has_user("Alice") and store.is_revoked("Alice")
+    assert store.revoked_users() == ["Alice", "Bob"]
+    assert store.revocation_version() == 2
+    assert store.revocations_since(1) == [(2, "Bob")]
+
+
+def test_expiries():
+    store = key_store.KeyStore()
+    store.put("Alice", "symmetric", b"a", expiry=10.0)
+    store.put("Bob", "symmetric", b"b")
+    assert store.expiries("symmetric") == [("Alice", 10.0)]
+
+
+def test_committed_writes_survive_a_crash(tmp_path, wrapping_key):
+    path = str(tmp_path / "keys.db")
+    script = (
+        "import os, sys\n"
+        "from key_store import KeyStore\n"
+        "store = KeyStore(sys.argv[1], wrapping_key=sys.argv[2])\n"
+        "store.put('Alice', 'symmetric', b'committed')\n"
+        "batch = store.batch()\nbatch.__enter__()\n"
+        "store.put('Bob', 'symmetric', b'interrupted')\n"
+        "os._exit(1)\n"
+    )
+    subprocess.run([sys.executable, "-c", script, path, wrapping_key],
+                   cwd=os.path.dirname(key_store.__file__), check=False)
+    with key_store.KeyStore(path, wrapping_key=wrapping_key) as store:
+        assert store.get("Alice", "symmetric") == b"committed"
+        assert store.get("Bob", "symmetric") is None
+
+
+def test_serialize_round_trip():
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=1024)
+    for key_type, key in [("private", private_key), ("public", private_key.public_key())]:
+        data = key_store.serialize_key(key)
+        restored = key_store.deserialize_key(key_type, data)
+        assert key_store.serialize_key(restored) == data
+    assert key_store.serialize_key(b"raw") == key_store.deserialize_key("symmetric", b"raw") == b"raw"
+    with pytest.raises(TypeError):
+        key_store.serialize_key(42)
@@ -0,0 +1,32 @@
+import pytest
+
+from modules import load
+
+lab3 = load("Lab programs/Lab3_Playfair Cipher/playfairCipher.py")
+task1 = load("Task 1/Playfair Cipher/playfairCipher.py")
+
+
+@pytest.mark.parametrize("module", [lab3, task1])
+def test_known_answer(module):
+    cipher = module.playfair("playfair example", "Hide the gold in the tree stump")
+    assert cipher == "BMODZBXDNABEKUDMUIXMMOUVIF"
+    assert module.playfair_decrypt("playfair example", cipher) == "HIDETHEGOLDINTHETREESTUMP"
+
+
+def test_key_with_digits_spaces_and_punctuation():
+    assert lab3.playfair("Play-fair 2024, example!", "HELLO") == lab3.playfair("PLAYFAIREXAMPLE", "HELLO")
+    assert lab3.playfair("123 !?", "HELLO") == lab3.playfair("", "HELLO")
+    with pytest.raises(TypeError):
+        lab3.playfair(None, "HELLO")
+
+
+def test_round_trip():
+    text = "THEQUICKBROWNDOGIUMPSOVERTHELAZYCAT"  # no doubled letters, J, or X
+    for key in ["MONARCHY", "keyword", "zebras!"]:
+        assert lab3.playfair_decrypt(key, lab3.playfair(key, text)) == text
+
+
+def test_digraphs_split_doubles_and_pad():
+    x = lab3.INDEX["X"]
+    assert list(lab3.digraphs("ball")) == [lab3.INDEX["B"] * 25 + lab3.INDEX["A"],
+                                          lab3.INDEX["L"] * 25 + x, lab3.INDEX["L"] * 25 + x]
@@ -0,0 +1,60 @@
+import pytest
+
+from modules import load
+
+key_store = load("Task 2/Secure Key Management System/key_store.py")
+revocation = load("Task 2/Secure Key Management System/revocation.py")
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = revocation.BloomFilter.for_capacity(10_000, error_rate=0.01)
+    for i in range(10_000):
+        bloom.add(f"user{i}")
+    assert all(f"user{i}" in bloom for i in range(10_000))
+    false_positives = sum(f"other{i}" in bloom for i in range(10_000))
+    assert false_positives < 300  # ~1% expected
+
+
+def test_bloom_filter_save_and_load(tmp_path):
+    bloom = revocation.BloomFilter.for_capacity(1000)
+    bloom.add("Alice")
+    bloom.version = 7
+    bloom.save(tmp_path / "f.bloom")
+    for use_mmap in (True, False):
+        loaded = revocation.BloomFilter.load(tmp_path / "f.bloom", use_mmap=use_mmap)
+        assert "Alice" in loaded and "Bob" not in loaded
+        assert (loaded.version, loaded.count, loaded.bits) == (7, 1, bloom.bits)
+        loaded.close()
+    (tmp_path / "bad.bloom").write_bytes(b"garbage" * 10)
+    with pytest.raises(ValueError):
+        revocation.BloomFilter.load(tmp_path / "bad.bloom")
+
+
+def test_revocation_list_in_process_filter():
+    store = key_store.KeyStore()
+    revocations = revocation.RevocationList(store, capacity=1000)
+    store.revoke_many(["Alice", "Bob"])
+    assert revocations.is_revoked("Alice") and not revocations.is_revoked("Carol")
+    store.revoke("Carol")
+    revocations.add("Carol")
+    assert revocations.is_revoked("Carol")
+    revocations.sync()
+    assert not revocations.recent  # folded into the filter
+
+
+def test_revocation_list_published_filter(tmp_path):
+    store = key_store.KeyStore()
+    path = str(tmp_path / "revoked.bloom")
+    writer = revocation.RevocationList(store, filter_path=path, capacity=1000)
+    reader = revocation.RevocationList(store, filter_path=path, capacity=1000, sync_interval=0)
+    store.revoke_many([f"user{i}" for i in range(100)])
+    writer.publish()
+    assert reader.is_revoked("user5") and not reader.is_revoked("someone")
+    store.revoke("late")
+    assert reader.is_revoked("late") and reader.recent == {"late"}
+    mapped = reader.bloom.array.obj
+    writer.publish()
+    reader.sync()
+    assert mapped.closed  # the old filter is unmapped once the new one is in use
+    assert not reader.recent  # the republished filter has "late"
+    assert reader.is_revoked("late") and reader.is_revoked("user99")
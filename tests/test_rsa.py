@@ -0,0 +1,45 @@
+import math
+
+import pytest
+
+from modules import load
+
+rsa = load("Lab programs/Lab7_RSA/rsa.py")
+
+
+def test_is_probable_prime():
+    primes = [2, 3, 5, 1999, 2003, 2**61 - 1, 2**127 - 1]
+    composites = [0, 1, 4, 561, 1105, 2001 * 2003, (2**61 - 1) * (2**31 - 1)]
+    assert all(rsa.is_probable_prime(p) for p in primes)
+    assert not any(rsa.is_probable_prime(n) for n in composites)
+
+
+@pytest.mark.parametrize("e", [3, 17, 65537])
+def test_generate_prime(e):
+    for _ in range(5):
+        p = rsa.generate_prime(128, e)
+        assert p.bit_length() == 128 and rsa.is_probable_prime(p)
+        assert math.gcd(e, p - 1) == 1
+
+
+def test_generate_prime_with_composite_exponent():
+    # e = 15 needs p - 1 coprime with both 3 and 5, not just indivisible by 15
+    for _ in range(5):
+        p = rsa.generate_prime(64, 15)
+        assert (p - 1) % 3 and (p - 1) % 5
+
+
+def test_textbook_known_answer():
+    key = rsa.RSAKey(61, 53, 17)
+    assert key.n == 3233
+    assert key.encrypt(65) == 2790
+    assert key.decrypt(2790) == 65 == key.decrypt_no_crt(2790)
+
+
+def test_round_trip():
+    key = rsa.RSAKey.generate(512)
+    assert key.n.bit_length() == 512
+    for m in [0, 1, 42, key.n - 1]:
+        assert key.decrypt(key.encrypt(m)) == m
+    message = b"attack at dawn " * 20
+    assert key.decrypt_bytes(key.encrypt_bytes(message)) == message
@@ -0,0 +1,65 @@
+import base64
+import os
+
+import pytest
+
+from modules import load
+
+tickets = load("Task 2/Secure Key Management System/tickets.py")
+
+
+@pytest.fixture
+def ring():
+    ring = tickets.MasterKeyRing()
+    ring.rotate()
+    return ring
+
+
+def test_round_trip(ring):
+    session_key, ticket = tickets.issue_ticket(ring, "User123", lifetime=60)
+    client_id, opened_key, expiry = tickets.open_ticket(ring, ticket)
+    assert (client_id, opened_key) == ("User123", session_key)
+    raw = os.urandom(32)
+    ticket = tickets.seal_ticket(ring, "Bob", base64.urlsafe_b64encode(raw), lifetime=10, now=1000)
+    assert tickets.open_ticket(ring, ticket, now=1005) == ("Bob", base64.urlsafe_b64encode(raw), 1010)
+
+
+def test_rejects_bad_tickets(ring):
+    ticket = tickets.seal_ticket(ring, "Bob", os.urandom(32), lifetime=10, now=1000)
+    tampered = bytearray(ticket)
+    tampered[-1] ^= 1
+    other = tickets.MasterKeyRing({ring.current: os.urandom(32)})
+    for bad, now in [(bytes(tampered), 1000), (ticket, 1011), (ticket[:20], 1000), (b"\x02" + ticket[1:], 1000)]:
+        with pytest.raises(tickets.InvalidTicket):
+            tickets.open_ticket(ring, bad, now=now)
+    with pytest.raises(tickets.InvalidTicket):
+        tickets.open_ticket(other, ticket, now=1000)
+
+
+def test_rotation_and_retirement(ring):
+    old = tickets.seal_ticket(ring, "Alice", os.urandom(32))
+    first = ring.current
+    assert ring.rotate() == first + 1
+    new = tickets.seal_ticket(ring, "Alice", os.urandom(32))
+    assert tickets.open_ticket(ring, old)[0] == tickets.open_ticket(ring, new)[0] == "Alice"
+    with pytest.raises(ValueError):
+        ring.retire(ring.current)
+    ring.retire(first)
+    with pytest.raises(tickets.InvalidTicket):
+        tickets.open_ticket(ring, old)
+    tickets.open_ticket(ring, new)
+
+
+def test_save_and_reload(ring, tmp_path):
+    path = str(tmp_path / "keyring.json")
+    ring.save(path)
+    assert os.stat(path).st_mode & 0o777 == 0o600
+    loaded = tickets.MasterKeyRing.load(path)
+    ticket = tickets.seal_ticket(ring, "Alice", os.urandom(32))
+    assert tickets.open_ticket(loaded, ticket)[0] == "Alice"
+    assert not loaded.reload()  # unchanged file
+    ring.rotate()
+    ring.save(path)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))  # make sure the mtime moves
+    assert loaded.reload() and loaded.current == ring.current
+    assert tickets.open_ticket(loaded, tickets.seal_ticket(ring, "Bob", os.urandom(32)))[0] == "Bob"